@@ -1,10 +1,18 @@
 import os
 import sys
+from contextvars import ContextVar, Token
+from typing import Optional
 
 from facefusion.types import AppContext
 
+APP_CONTEXT : ContextVar[Optional[AppContext]] = ContextVar('app_context', default = None)
+
 
 def detect_app_context() -> AppContext:
+	app_context = APP_CONTEXT.get()
+
+	if app_context:
+		return app_context
 	frame = sys._getframe(1)
 
 	while frame:
@@ -14,3 +22,11 @@ def detect_app_context() -> AppContext:
 			return 'ui'
 		frame = frame.f_back
 	return 'cli'
+
+
+def bind_app_context(app_context : AppContext) -> Token[Optional[AppContext]]:
+	return APP_CONTEXT.set(app_context)
+
+
+def unbind_app_context(app_context_token : Token[Optional[AppContext]]) -> None:
+	APP_CONTEXT.reset(app_context_token)
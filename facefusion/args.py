@@ -54,6 +54,8 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
     apply_state_item('face_detector_size', args.get('face_detector_size'))
     apply_state_item('face_detector_angles', args.get('face_detector_angles'))
     apply_state_item('face_detector_score', args.get('face_detector_score'))
+    apply_state_item('face_detector_interval', args.get('face_detector_interval'))
+    apply_state_item('face_detector_refine', args.get('face_detector_refine'))
     # face landmarker
     apply_state_item('face_landmarker_model', args.get('face_landmarker_model'))
     apply_state_item('face_landmarker_score', args.get('face_landmarker_score'))
@@ -81,6 +83,8 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
     apply_state_item('trim_frame_start', args.get('trim_frame_start'))
     apply_state_item('trim_frame_end', args.get('trim_frame_end'))
     apply_state_item('temp_frame_format', args.get('temp_frame_format'))
+    apply_state_item('video_pipeline', args.get('video_pipeline'))
+    apply_state_item('video_segment_count', args.get('video_segment_count'))
     apply_state_item('keep_temp', args.get('keep_temp'))
     # output creation
     apply_state_item('output_image_quality', args.get('output_image_quality'))
@@ -108,6 +112,13 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
     apply_state_item('execution_device_ids', args.get('execution_device_ids'))
     apply_state_item('execution_providers', args.get('execution_providers'))
     apply_state_item('execution_thread_count', args.get('execution_thread_count'))
+    apply_state_item('execution_queue_count', args.get('execution_queue_count'))
+    apply_state_item('execution_worker', args.get('execution_worker'))
+    apply_state_item('execution_device_pinning', args.get('execution_device_pinning'))
+    apply_state_item('execution_batch_size', args.get('execution_batch_size'))
+    apply_state_item('execution_batch_timeout', args.get('execution_batch_timeout'))
+    apply_state_item('execution_concurrency_limit', args.get('execution_concurrency_limit'))
+    apply_state_item('execution_warm_up', args.get('execution_warm_up'))
     # download
     apply_state_item('download_providers', args.get('download_providers'))
     apply_state_item('download_scope', args.get('download_scope'))
@@ -118,6 +129,8 @@ def apply_args(args : Args, apply_state_item : ApplyStateItem) -> None:
     # memory
     apply_state_item('video_memory_strategy', args.get('video_memory_strategy'))
     apply_state_item('system_memory_limit', args.get('system_memory_limit'))
+    apply_state_item('inference_memory_budget', args.get('inference_memory_budget'))
+    apply_state_item('face_store_capacity', args.get('face_store_capacity'))
     # misc
     apply_state_item('log_level', args.get('log_level'))
     apply_state_item('halt_on_error', args.get('halt_on_error'))
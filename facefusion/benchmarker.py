@@ -3,15 +3,15 @@ import os
 import statistics
 import tempfile
 from time import perf_counter
-from typing import Generator, List
+from typing import Dict, Generator, List
 
 import facefusion.choices
-from facefusion import content_analyser, core, state_manager
+from facefusion import content_analyser, core, inference_manager, state_manager
 from facefusion.cli_helper import render_table
 from facefusion.download import conditional_download, resolve_download_url
 from facefusion.face_store import clear_static_faces
 from facefusion.filesystem import get_file_extension
-from facefusion.types import BenchmarkCycleSet
+from facefusion.types import BenchmarkCycleSet, ExecutionDeviceLoad
 from facefusion.vision import count_video_frame_total, detect_video_fps
 
 
@@ -60,6 +60,8 @@ def cycle(cycle_count : int) -> BenchmarkCycleSet:
 	if state_manager.get_item('benchmark_mode') == 'warm':
 		core.conditional_process()
 
+	start_device_loads = inference_manager.get_execution_device_loads()
+
 	for index in range(cycle_count):
 		if state_manager.get_item('benchmark_mode') == 'cold':
 			content_analyser.analyse_image.cache_clear()
@@ -75,6 +77,7 @@ def cycle(cycle_count : int) -> BenchmarkCycleSet:
 	fastest_run = round(min(process_times), 2)
 	slowest_run = round(max(process_times), 2)
 	relative_fps = round(video_frame_total * cycle_count / sum(process_times), 2)
+	device_utilization = calculate_device_utilization(start_device_loads, inference_manager.get_execution_device_loads(), sum(process_times))
 
 	return\
 	{
@@ -83,10 +86,23 @@ def cycle(cycle_count : int) -> BenchmarkCycleSet:
 		'average_run': average_run,
 		'fastest_run': fastest_run,
 		'slowest_run': slowest_run,
-		'relative_fps': relative_fps
+		'relative_fps': relative_fps,
+		'device_utilization': device_utilization
 	}
 
 
+def calculate_device_utilization(start_device_loads : Dict[str, ExecutionDeviceLoad], end_device_loads : Dict[str, ExecutionDeviceLoad], wall_time : float) -> str:
+	busy_times = {}
+
+	for execution_device_id, end_device_load in end_device_loads.items():
+		start_device_load = start_device_loads.get(execution_device_id)
+		busy_times[execution_device_id] = end_device_load.get('busy_time') - start_device_load.get('busy_time') if start_device_load else end_device_load.get('busy_time')
+
+	if wall_time > 0:
+		return ' '.join(execution_device_id + ':' + str(round(busy_time / wall_time * 100)) + '%' for execution_device_id, busy_time in busy_times.items())
+	return ''
+
+
 def suggest_output_path(target_path : str) -> str:
 	target_file_extension = get_file_extension(target_path)
 	return os.path.join(tempfile.gettempdir(), hashlib.sha1().hexdigest()[:8] + target_file_extension)
@@ -101,7 +117,8 @@ def render() -> None:
 		'average_run',
 		'fastest_run',
 		'slowest_run',
-		'relative_fps'
+		'relative_fps',
+		'device_utilization'
 	]
 
 	for benchmark in run():
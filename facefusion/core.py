@@ -2,34 +2,40 @@ import itertools
 import os
 import shutil
 import signal
+import subprocess
 import sys
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
 from time import time
-from typing import Optional
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
 
 import numpy
 from tqdm import tqdm
 
-from facefusion import benchmarker, cli_helper, content_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, hash_helper, logger, process_manager, state_manager, video_manager, voice_extractor, wording
+from facefusion import benchmarker, cli_helper, content_analyser, face_analyser, face_classifier, face_detector, face_landmarker, face_masker, face_recognizer, face_tracker, hash_helper, inference_manager, logger, process_manager, state_manager, video_manager, voice_extractor, wording
 from facefusion.batch_helper import compose_batch_output_path
-from facefusion.args import apply_args, collect_job_args, reduce_job_args, reduce_step_args
+from facefusion.args import apply_args, collect_job_args, collect_step_args, reduce_job_args, reduce_step_args
 from facefusion.audio import create_empty_audio_frame, get_audio_frame, get_voice_frame
 from facefusion.common_helper import get_first
 from facefusion.content_analyser import analyse_image, analyse_video
 from facefusion.download import conditional_download_hashes, conditional_download_sources
 from facefusion.exit_helper import hard_exit, signal_exit
-from facefusion.ffmpeg import copy_image, extract_frames, finalize_image, merge_video, replace_audio, restore_audio
+from facefusion.ffmpeg import close_stream, concat_video, detect_video_keyframes, extract_frames, finalize_image, iterate_stream_frames, merge_video, merge_video_with_audio, open_frame_reader, open_frame_writer, open_segment_reader, replace_audio, restore_audio, write_stream_frame
 from facefusion.filesystem import create_directory, filter_audio_paths, get_file_name, is_image, is_video, resolve_file_paths, resolve_file_pattern
+from facefusion.frame_manifest import commit_partial_frame, create_args_hash, create_frame_manifest, get_partial_frame_path, read_frame_bitmap, restore_partial_frames, validate_frame_manifest
+from facefusion.frame_scheduler import prefetch_frames, schedule_frames
 from facefusion.jobs import job_helper, job_manager, job_runner
 from facefusion.jobs.job_list import compose_job_list
 from facefusion.memory import limit_system_memory
 from facefusion.processors.core import get_processors_modules
 from facefusion.program import create_program
 from facefusion.program_helper import validate_args
-from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, move_temp_file, resolve_temp_frame_paths
+from facefusion.segment_helper import calculate_segment_ranges
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, get_temp_segment_path, move_temp_file, resolve_temp_frame_paths
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import Args, ErrorCode
-from facefusion.vision import detect_image_resolution, detect_video_resolution, pack_resolution, read_static_image, read_static_images, read_static_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, write_image
+from facefusion.types import Args, ErrorCode, Fps, Resolution, VisionFrame
+from facefusion.vision import detect_video_fps, detect_video_resolution, pack_resolution, predict_video_frame_total, read_image, read_static_image, read_static_images, read_static_video_frame, resize_frame, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, unpack_resolution, write_image, write_image_with_quality
 
 
 def resolve_batch_output_path(base_output_path: Optional[str], target_path: str, index: int, total: int) -> str:
@@ -375,41 +381,75 @@ def conditional_process() -> ErrorCode:
         if not processor_module.pre_process('output'):
             return 2
 
-    if is_image(state_manager.get_item('target_path')):
-        return process_image(start_time)
-    if is_video(state_manager.get_item('target_path')):
-        return process_video(start_time)
+    if state_manager.get_item('execution_warm_up'):
+        warm_up_inference_pools()
+
+    state_snapshot_token = state_manager.bind_state_snapshot()
+
+    try:
+        if is_image(state_manager.get_item('target_path')):
+            return process_image(start_time)
+        if is_video(state_manager.get_item('target_path')):
+            return process_video(start_time)
+    finally:
+        face_detector.clear_face_detector_angles()
+        state_manager.unbind_state_snapshot(state_snapshot_token)
 
     return 0
 
 
+def warm_up_inference_pools() -> None:
+    face_attributes = face_analyser.resolve_face_attributes()
+    warm_up_set : List[Tuple[Any, Optional[Resolution]]] = [ (face_detector, unpack_resolution(state_manager.get_item('face_detector_size'))) ]
+
+    if state_manager.get_item('face_landmarker_score') > 0:
+        warm_up_set.append((face_landmarker, None))
+    if 'embedding' in face_attributes:
+        warm_up_set.append((face_recognizer, resolve_model_size(face_recognizer)))
+    if 'classification' in face_attributes:
+        warm_up_set.append((face_classifier, resolve_model_size(face_classifier)))
+    if any(face_mask_type in [ 'occlusion', 'region' ] for face_mask_type in state_manager.get_item('face_mask_types') or []):
+        warm_up_set.append((face_masker, None))
+
+    for processor_module in get_processors_modules(state_manager.get_item('processors')):
+        warm_up_set.append((processor_module, resolve_model_size(processor_module)))
+
+    for module, model_size in warm_up_set:
+        inference_pool = module.get_inference_pool()
+
+        if inference_pool:
+            inference_manager.warm_up_inference_pool(inference_pool, model_size)
+
+
+def resolve_model_size(module : Any) -> Optional[Resolution]:
+    if hasattr(module, 'get_model_options'):
+        model_size = module.get_model_options().get('size')
+
+        if model_size and len(model_size) == 3:
+            return model_size[0], model_size[0]
+        if model_size:
+            return model_size[0], model_size[1]
+    return None
+
+
 def process_image(start_time : float) -> ErrorCode:
     if analyse_image(state_manager.get_item('target_path')):
         return 3
 
-    logger.debug(wording.get('clearing_temp'), __name__)
-    clear_temp_directory(state_manager.get_item('target_path'))
-    logger.debug(wording.get('creating_temp'), __name__)
-    create_temp_directory(state_manager.get_item('target_path'))
-
     process_manager.start()
 
-    output_image_resolution = scale_resolution(detect_image_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_image_scale'))
-    temp_image_resolution = restrict_image_resolution(state_manager.get_item('target_path'), output_image_resolution)
+    target_vision_frame = read_image(state_manager.get_item('target_path'))
+    target_image_height, target_image_width = target_vision_frame.shape[:2]
+    output_image_resolution = scale_resolution((target_image_width, target_image_height), state_manager.get_item('output_image_scale'))
+    temp_image_resolution = min((target_image_width, target_image_height), output_image_resolution)
     logger.info(wording.get('copying_image').format(resolution = pack_resolution(temp_image_resolution)), __name__)
-    if copy_image(state_manager.get_item('target_path'), temp_image_resolution):
-        logger.debug(wording.get('copying_image_succeeded'), __name__)
-    else:
-        logger.error(wording.get('copying_image_failed'), __name__)
-        process_manager.end()
-        return 1
+    target_vision_frame = resize_frame(target_vision_frame, temp_image_resolution)
+    logger.debug(wording.get('copying_image_succeeded'), __name__)
 
-    temp_image_path = get_temp_file_path(state_manager.get_item('target_path'))
-    reference_vision_frame = read_static_image(temp_image_path)
+    reference_vision_frame = target_vision_frame
     source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
     source_audio_frame = create_empty_audio_frame()
     source_voice_frame = create_empty_audio_frame()
-    target_vision_frame = read_static_image(temp_image_path)
     temp_vision_frame = target_vision_frame.copy()
     # BATCH DEBUG CHECKPOINT 1
     logger.info('🟢 [BATCH] Starting processor loop', __name__)
@@ -431,7 +471,6 @@ def process_image(start_time : float) -> ErrorCode:
 
     # BATCH DEBUG CHECKPOINT 2
     logger.info('🟢 [BATCH] About to write image', __name__)
-    write_image(temp_image_path, temp_vision_frame)
     # BATCH DEBUG CHECKPOINT 3
     logger.info('🟢 [BATCH] Image written, checking if stopping...', __name__)
     logger.info(f'🟢 [BATCH] process_manager.is_stopping() = {process_manager.is_stopping()}', __name__)
@@ -453,7 +492,7 @@ def process_image(start_time : float) -> ErrorCode:
     #         del frame
 
     logger.info(wording.get('finalizing_image').format(resolution = pack_resolution(output_image_resolution)), __name__)
-    if finalize_image(state_manager.get_item('target_path'), state_manager.get_item('output_path'), output_image_resolution):
+    if write_image_with_quality(state_manager.get_item('output_path'), resize_frame(temp_vision_frame, output_image_resolution), state_manager.get_item('output_image_quality')) or finalize_temp_image(temp_vision_frame, output_image_resolution):
         logger.debug(wording.get('finalizing_image_succeeded'), __name__)
         # CRITICAL DEBUG - Verify file was actually saved
         output_path = state_manager.get_item('output_path')
@@ -493,77 +532,126 @@ def process_image(start_time : float) -> ErrorCode:
     return 0
 
 
-def process_video(start_time : float) -> ErrorCode:
-    trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
-    if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
-        return 3
-
+def finalize_temp_image(temp_vision_frame : VisionFrame, output_image_resolution : Resolution) -> bool:
     logger.debug(wording.get('clearing_temp'), __name__)
     clear_temp_directory(state_manager.get_item('target_path'))
     logger.debug(wording.get('creating_temp'), __name__)
     create_temp_directory(state_manager.get_item('target_path'))
 
-    process_manager.start()
-    output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
-    temp_video_resolution = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
-    temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-    logger.info(wording.get('extracting_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
-
-    if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
-        logger.debug(wording.get('extracting_frames_succeeded'), __name__)
-    else:
-        # DISABLED for batch processing
-        # if is_process_stopping():
-        #     return 4
-        logger.error(wording.get('extracting_frames_failed'), __name__)
-        process_manager.end()
-        return 1
-
-    temp_frame_paths = resolve_temp_frame_paths(state_manager.get_item('target_path'))
+    if write_image(get_temp_file_path(state_manager.get_item('target_path')), temp_vision_frame):
+        return finalize_image(state_manager.get_item('target_path'), state_manager.get_item('output_path'), output_image_resolution)
+    return False
 
-    if temp_frame_paths:
-        with tqdm(total = len(temp_frame_paths), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
-            progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
 
-            with ThreadPoolExecutor(max_workers = state_manager.get_item('execution_thread_count')) as executor:
-                futures = []
+def process_video(start_time : float) -> ErrorCode:
+    trim_frame_start, trim_frame_end = restrict_trim_frame(state_manager.get_item('target_path'), state_manager.get_item('trim_frame_start'), state_manager.get_item('trim_frame_end'))
+    if analyse_video(state_manager.get_item('target_path'), trim_frame_start, trim_frame_end):
+        return 3
 
-                for frame_number, temp_frame_path in enumerate(temp_frame_paths):
-                    future = executor.submit(process_temp_frame, temp_frame_path, frame_number)
-                    futures.append(future)
+    args_hash = create_args_hash(collect_step_args())
+    is_audio_merged = False
+    is_resumable = state_manager.get_item('video_pipeline') == 'temp_frames' and validate_frame_manifest(state_manager.get_item('target_path'), args_hash)
 
-                for future in as_completed(futures):
-                    if is_process_stopping():
-                        for __future__ in futures:
-                            __future__.cancel()
+    if not is_resumable:
+        logger.debug(wording.get('clearing_temp'), __name__)
+        clear_temp_directory(state_manager.get_item('target_path'))
+        logger.debug(wording.get('creating_temp'), __name__)
+        create_temp_directory(state_manager.get_item('target_path'))
 
-                    if not future.cancelled():
-                        future.result()
-                        progress.update()
+    process_manager.start()
+    output_video_resolution = scale_resolution(detect_video_resolution(state_manager.get_item('target_path')), state_manager.get_item('output_video_scale'))
+    temp_video_resolution = restrict_video_resolution(state_manager.get_item('target_path'), output_video_resolution)
+    temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
+    if state_manager.get_item('video_pipeline') == 'stream':
+        logger.info(wording.get('streaming_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
+        if stream_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+            logger.debug(wording.get('streaming_frames_succeeded'), __name__)
+        else:
+            if process_manager.is_stopping():
+                is_process_stopping()
+                return 4
+            logger.error(wording.get('streaming_frames_failed'), __name__)
+            process_manager.end()
+            return 1
 
         for processor_module in get_processors_modules(state_manager.get_item('processors')):
             processor_module.post_process()
+    elif state_manager.get_item('video_pipeline') == 'segment':
+        logger.info(wording.get('processing_segments').format(segment_total = state_manager.get_item('video_segment_count'), resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
+        if process_segments(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+            logger.debug(wording.get('processing_segments_succeeded'), __name__)
+        else:
+            if process_manager.is_stopping():
+                is_process_stopping()
+                return 4
+            logger.error(wording.get('processing_segments_failed'), __name__)
+            process_manager.end()
+            return 1
 
-        # DISABLED for batch processing
-        # if is_process_stopping():
-        #     return 4
+        for processor_module in get_processors_modules(state_manager.get_item('processors')):
+            processor_module.post_process()
     else:
-        logger.error(wording.get('temp_frames_not_found'), __name__)
-        process_manager.end()
-        return 1
+        if is_resumable:
+            restore_partial_frames(state_manager.get_item('target_path'))
+            logger.info(wording.get('resuming_frames'), __name__)
+        else:
+            logger.info(wording.get('extracting_frames').format(resolution = pack_resolution(temp_video_resolution), fps = temp_video_fps), __name__)
 
-    logger.info(wording.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
-    if merge_video(state_manager.get_item('target_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
-        logger.debug(wording.get('merging_video_succeeded'), __name__)
-    else:
-        # DISABLED for batch processing
-        # if is_process_stopping():
-        #     return 4
-        logger.error(wording.get('merging_video_failed'), __name__)
-        process_manager.end()
-        return 1
+            if extract_frames(state_manager.get_item('target_path'), temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end):
+                create_frame_manifest(state_manager.get_item('target_path'), args_hash, len(resolve_temp_frame_paths(state_manager.get_item('target_path'))))
+                logger.debug(wording.get('extracting_frames_succeeded'), __name__)
+            else:
+                # DISABLED for batch processing
+                # if is_process_stopping():
+                #     return 4
+                logger.error(wording.get('extracting_frames_failed'), __name__)
+                process_manager.end()
+                return 1
+
+        temp_frame_paths = resolve_temp_frame_paths(state_manager.get_item('target_path'))
 
-    if state_manager.get_item('output_audio_volume') == 0:
+        if temp_frame_paths:
+            if process_temp_frames(state_manager.get_item('target_path'), temp_frame_paths):
+                logger.debug(wording.get('processing_frames_succeeded'), __name__)
+            else:
+                if process_manager.is_stopping():
+                    is_process_stopping()
+                    return 4
+                logger.error(wording.get('processing_frames_failed'), __name__)
+                process_manager.end()
+                return 1
+
+            for processor_module in get_processors_modules(state_manager.get_item('processors')):
+                processor_module.post_process()
+
+            # DISABLED for batch processing
+            # if is_process_stopping():
+            #     return 4
+        else:
+            logger.error(wording.get('temp_frames_not_found'), __name__)
+            process_manager.end()
+            return 1
+
+        logger.info(wording.get('merging_video').format(resolution = pack_resolution(output_video_resolution), fps = state_manager.get_item('output_video_fps')), __name__)
+        source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
+        merge_audio_path = source_audio_path or state_manager.get_item('target_path')
+
+        if state_manager.get_item('output_audio_volume') > 0 and merge_video_with_audio(state_manager.get_item('target_path'), merge_audio_path, state_manager.get_item('output_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+            is_audio_merged = True
+            logger.debug(wording.get('merging_video_succeeded'), __name__)
+        elif merge_video(state_manager.get_item('target_path'), temp_video_fps, output_video_resolution, state_manager.get_item('output_video_fps'), trim_frame_start, trim_frame_end):
+            logger.debug(wording.get('merging_video_succeeded'), __name__)
+        else:
+            # DISABLED for batch processing
+            # if is_process_stopping():
+            #     return 4
+            logger.error(wording.get('merging_video_failed'), __name__)
+            process_manager.end()
+            return 1
+
+    if is_audio_merged:
+        video_manager.clear_video_pool()
+    elif state_manager.get_item('output_audio_volume') == 0:
         logger.info(wording.get('skipping_audio'), __name__)
         move_temp_file(state_manager.get_item('target_path'), state_manager.get_item('output_path'))
     else:
@@ -604,12 +692,103 @@ def process_video(start_time : float) -> ErrorCode:
     return 0
 
 
+def process_temp_frames(target_path : str, temp_frame_paths : List[str]) -> bool:
+    frame_bitmap = read_frame_bitmap(target_path)
+
+    with tqdm(total = len(temp_frame_paths), initial = numpy.count_nonzero(frame_bitmap), desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+        progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+        frame_arguments = [ (temp_frame_path, frame_number) for frame_number, temp_frame_path in enumerate(temp_frame_paths) if not frame_bitmap[frame_number] ]
+        schedule_frame_arguments : Iterable[Tuple[Any, ...]] = frame_arguments
+
+        if is_face_tracking():
+            schedule_frame_arguments = track_frames(frame_arguments)
+
+        for (temp_frame_path, frame_number), is_processed in zip(frame_arguments, schedule_frames(process_temp_frame, schedule_frame_arguments, state_manager.get_item('execution_thread_count'), state_manager.get_item('execution_queue_count'), state_manager.get_item('execution_worker'))):
+            if not is_processed or not commit_partial_frame(target_path, temp_frame_path, frame_number):
+                logger.error(wording.get('writing_frame_failed').format(frame_number = frame_number), __name__)
+                return False
+            progress.update()
+
+    return not process_manager.is_stopping()
+
+
+def stream_frames(target_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
+    stream_frame_total = predict_video_frame_total(target_path, temp_video_fps, trim_frame_start, trim_frame_end)
+
+    with tqdm(total = stream_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+        progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+        reader_process = open_frame_reader(target_path, temp_video_resolution, temp_video_fps, trim_frame_start, trim_frame_end)
+        return write_stream_frames(reader_process, get_temp_file_path(target_path), temp_video_resolution, temp_video_fps, output_video_resolution, output_video_fps, 0, state_manager.get_item('execution_thread_count'), progress)
+
+
+def process_segments(target_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
+    target_video_fps = detect_video_fps(target_path)
+    segment_ranges = calculate_segment_ranges(trim_frame_start, trim_frame_end, detect_video_keyframes(target_path), state_manager.get_item('video_segment_count'))
+    segment_worker_count = min(len(segment_ranges), state_manager.get_item('execution_thread_count'))
+    execution_thread_count = max(1, state_manager.get_item('execution_thread_count') // segment_worker_count)
+    temp_segment_paths = [ get_temp_segment_path(target_path, segment_index) for segment_index, _ in enumerate(segment_ranges) ]
+    segment_frame_total = predict_video_frame_total(target_path, temp_video_fps, trim_frame_start, trim_frame_end)
+
+    with tqdm(total = segment_frame_total, desc = wording.get('processing'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+        progress.set_postfix(execution_providers = state_manager.get_item('execution_providers'))
+
+        with ThreadPoolExecutor(max_workers = segment_worker_count) as executor:
+            futures = []
+
+            for temp_segment_path, (segment_frame_start, segment_frame_end) in zip(temp_segment_paths, segment_ranges):
+                frame_offset = round((segment_frame_start - trim_frame_start) * temp_video_fps / target_video_fps)
+                futures.append(executor.submit(copy_context().run, stream_segment, target_path, temp_segment_path, temp_video_resolution, temp_video_fps, output_video_resolution, output_video_fps, segment_frame_start, segment_frame_end, frame_offset, execution_thread_count, progress))
+
+            segment_results = [ future.result() for future in futures ]
+
+    return all(segment_results) and concat_video(get_temp_file_path(target_path), temp_segment_paths)
+
+
+def stream_segment(target_path : str, temp_segment_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps, segment_frame_start : int, segment_frame_end : int, frame_offset : int, execution_thread_count : int, progress : tqdm) -> bool:
+    reader_process = open_segment_reader(target_path, temp_video_resolution, temp_video_fps, segment_frame_start, segment_frame_end)
+    return write_stream_frames(reader_process, temp_segment_path, temp_video_resolution, temp_video_fps, output_video_resolution, output_video_fps, frame_offset, execution_thread_count, progress)
+
+
+def write_stream_frames(reader_process : subprocess.Popen[bytes], temp_video_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps, frame_offset : int, execution_thread_count : int, progress : tqdm) -> bool:
+    writer_process = None
+    is_writing = True
+    frame_arguments = ((target_vision_frame, frame_offset + frame_number) for frame_number, target_vision_frame in enumerate(iterate_stream_frames(reader_process, temp_video_resolution)))
+
+    if is_face_tracking():
+        frame_arguments = track_frames(frame_arguments)
+    elif state_manager.get_item('execution_worker') == 'thread' and state_manager.get_item('execution_batch_size') > 1 and has_face_processors():
+        frame_arguments = prefetch_frames(frame_arguments, partial(face_analyser.get_many_faces, target_path = state_manager.get_item('target_path')), state_manager.get_item('execution_batch_size'))
+    temp_vision_frames = schedule_frames(process_vision_frame, frame_arguments, execution_thread_count, state_manager.get_item('execution_queue_count'), state_manager.get_item('execution_worker'))
+
+    for temp_vision_frame in temp_vision_frames:
+        if not writer_process:
+            temp_frame_height, temp_frame_width = temp_vision_frame.shape[:2]
+            writer_process = open_frame_writer(temp_video_path, temp_video_fps, (temp_frame_width, temp_frame_height), output_video_resolution, output_video_fps)
+
+        is_writing = write_stream_frame(writer_process, temp_vision_frame)
+        if not is_writing:
+            temp_vision_frames.close()
+            break
+        progress.update()
+
+    close_stream(reader_process)
+
+    if writer_process:
+        return close_stream(writer_process) and is_writing and not process_manager.is_stopping()
+    return False
+
+
 def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
+    target_vision_frame = read_static_image(temp_frame_path)
+    temp_vision_frame = process_vision_frame(target_vision_frame, frame_number)
+    return write_image(get_partial_frame_path(temp_frame_path), temp_vision_frame)
+
+
+def process_vision_frame(target_vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
     reference_vision_frame = read_static_video_frame(state_manager.get_item('target_path'), state_manager.get_item('reference_frame_number'))
     source_vision_frames = read_static_images(state_manager.get_item('source_paths'))
     source_audio_path = get_first(filter_audio_paths(state_manager.get_item('source_paths')))
     temp_video_fps = restrict_video_fps(state_manager.get_item('target_path'), state_manager.get_item('output_video_fps'))
-    target_vision_frame = read_static_image(temp_frame_path)
     temp_vision_frame = target_vision_frame.copy()
 
     source_audio_frame = get_audio_frame(source_audio_path, temp_video_fps, frame_number)
@@ -620,18 +799,44 @@ def process_temp_frame(temp_frame_path : str, frame_number : int) -> bool:
     if not numpy.any(source_voice_frame):
         source_voice_frame = create_empty_audio_frame()
 
-    for processor_module in get_processors_modules(state_manager.get_item('processors')):
-        temp_vision_frame = processor_module.process_frame(
-        {
-            'reference_vision_frame': reference_vision_frame,
-            'source_vision_frames': source_vision_frames,
-            'source_audio_frame': source_audio_frame,
-            'source_voice_frame': source_voice_frame,
-            'target_vision_frame': target_vision_frame,
-            'temp_vision_frame': temp_vision_frame
-        })
+    execution_device_token = inference_manager.pin_execution_device()
+
+    try:
+        for processor_module in get_processors_modules(state_manager.get_item('processors')):
+            temp_vision_frame = processor_module.process_frame(
+            {
+                'reference_vision_frame': reference_vision_frame,
+                'source_vision_frames': source_vision_frames,
+                'source_audio_frame': source_audio_frame,
+                'source_voice_frame': source_voice_frame,
+                'target_vision_frame': target_vision_frame,
+                'temp_vision_frame': temp_vision_frame
+            })
+    finally:
+        inference_manager.unpin_execution_device(execution_device_token)
+
+    return temp_vision_frame
+
+
+def track_frames(frame_arguments : Iterable[Tuple[Any, ...]]) -> Iterator[Tuple[Any, ...]]:
+    tracker = face_tracker.create_face_tracker()
+
+    for frame_argument in frame_arguments:
+        target_vision_frame = get_first(frame_argument)
+
+        if isinstance(target_vision_frame, str):
+            target_vision_frame = read_static_image(target_vision_frame)
+        if target_vision_frame is not None and not process_manager.is_stopping():
+            face_tracker.track_faces(tracker, target_vision_frame)
+        yield frame_argument
+
+
+def has_face_processors() -> bool:
+    return any(processor not in [ 'frame_colorizer', 'frame_enhancer' ] for processor in state_manager.get_item('processors'))
+
 
-    return write_image(temp_frame_path, temp_vision_frame)
+def is_face_tracking() -> bool:
+    return state_manager.get_item('execution_worker') == 'thread' and state_manager.get_item('face_detector_interval') > 0 and has_face_processors()
 
 
 def is_process_stopping() -> bool:
@@ -5,6 +5,7 @@ from time import sleep
 from types import FrameType
 
 from facefusion import process_manager, state_manager
+from facefusion.frame_manifest import has_frame_manifest
 from facefusion.temp_helper import clear_temp_directory
 from facefusion.types import ErrorCode
 
@@ -28,7 +29,7 @@ def graceful_exit(error_code : ErrorCode) -> None:
 	while process_manager.is_processing():
 		sleep(0.5)
 
-	if state_manager.get_item('target_path'):
+	if state_manager.get_item('target_path') and not has_frame_manifest(state_manager.get_item('target_path')):
 		clear_temp_directory(state_manager.get_item('target_path'))
 
 	hard_exit(error_code)
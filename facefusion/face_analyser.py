@@ -4,63 +4,90 @@ import numpy
 
 from facefusion import state_manager
 from facefusion.common_helper import get_first
-from facefusion.face_classifier import classify_face
-from facefusion.face_detector import detect_faces, detect_faces_by_angle
+from facefusion.face_classifier import classify_faces
+from facefusion.face_detector import FACE_DETECTOR_ANGLE_SET, detect_faces_by_angle, detect_many_faces, merge_detections
 from facefusion.face_helper import apply_nms, convert_to_face_landmark_5, estimate_face_angle, get_nms_threshold
-from facefusion.face_landmarker import detect_face_landmark, estimate_face_landmark_68_5
-from facefusion.face_recognizer import calculate_face_embedding
+from facefusion.face_landmarker import detect_face_landmarks, estimate_face_landmarks_68_5
+from facefusion.face_recognizer import calculate_face_embeddings
 from facefusion.face_store import get_static_faces, set_static_faces
-from facefusion.types import BoundingBox, Face, FaceLandmark5, FaceLandmarkSet, FaceScoreSet, Score, VisionFrame
+from facefusion.types import Angle, BoundingBoxes, Face, FaceAttribute, FaceDetection, FaceLandmarks5, FaceLandmarkSet, FaceScoreSet, Scores, VisionFrame
 
-
-def create_faces(vision_frame : VisionFrame, bounding_boxes : List[BoundingBox], face_scores : List[Score], face_landmarks_5 : List[FaceLandmark5]) -> List[Face]:
+def create_faces(vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_scores : Scores, face_landmarks_5 : FaceLandmarks5) -> List[Face]:
 	faces = []
-	nms_threshold = get_nms_threshold(state_manager.get_item('face_detector_model'), state_manager.get_item('face_detector_angles'))
-	keep_indices = apply_nms(bounding_boxes, face_scores, state_manager.get_item('face_detector_score'), nms_threshold)
-
-	for index in keep_indices:
-		bounding_box = bounding_boxes[index]
-		face_score = face_scores[index]
-		face_landmark_5 = face_landmarks_5[index]
-		face_landmark_5_68 = face_landmark_5
-		face_landmark_68_5 = estimate_face_landmark_68_5(face_landmark_5_68)
-		face_landmark_68 = face_landmark_68_5
-		face_landmark_score_68 = 0.0
-		face_angle = estimate_face_angle(face_landmark_68_5)
-
-		if state_manager.get_item('face_landmarker_score') > 0:
-			face_landmark_68, face_landmark_score_68 = detect_face_landmark(vision_frame, bounding_box, face_angle)
-		if face_landmark_score_68 > state_manager.get_item('face_landmarker_score'):
-			face_landmark_5_68 = convert_to_face_landmark_5(face_landmark_68)
-
-		face_landmark_set : FaceLandmarkSet =\
-		{
-			'5': face_landmark_5,
-			'5/68': face_landmark_5_68,
-			'68': face_landmark_68,
-			'68/5': face_landmark_68_5
-		}
-		face_score_set : FaceScoreSet =\
-		{
-			'detector': face_score,
-			'landmarker': face_landmark_score_68
-		}
-		face_embedding, face_embedding_norm = calculate_face_embedding(vision_frame, face_landmark_set.get('5/68'))
-		gender, age, race = classify_face(vision_frame, face_landmark_set.get('5/68'))
-		faces.append(Face(
-			bounding_box = bounding_box,
-			score_set = face_score_set,
-			landmark_set = face_landmark_set,
-			angle = face_angle,
-			embedding = face_embedding,
-			embedding_norm = face_embedding_norm,
-			gender = gender,
-			age = age,
-			race = race
-		))
+	state_snapshot = state_manager.get_state_snapshot()
+	nms_threshold = get_nms_threshold(state_snapshot.face_detector_model, state_snapshot.face_detector_angles)
+	keep_indices = numpy.asarray(apply_nms(bounding_boxes, face_scores, state_snapshot.face_detector_score, nms_threshold), dtype = int)
+
+	if keep_indices.size:
+		bounding_boxes = bounding_boxes[keep_indices]
+		face_scores = face_scores[keep_indices]
+		face_landmarks_5 = face_landmarks_5[keep_indices]
+		face_landmarks_5_68 = list(face_landmarks_5)
+		face_landmarks_68_5 = estimate_face_landmarks_68_5(face_landmarks_5)
+		face_landmarks_68 = face_landmarks_68_5
+		face_landmark_scores_68 = [ 0.0 ] * len(keep_indices)
+		face_angles = [ estimate_face_angle(face_landmark_68_5) for face_landmark_68_5 in face_landmarks_68_5 ]
+
+		if state_snapshot.face_landmarker_score > 0:
+			face_landmarks_68, face_landmark_scores_68 = detect_face_landmarks(vision_frame, bounding_boxes, face_angles)
+
+		for index, face_landmark_score_68 in enumerate(face_landmark_scores_68):
+			if face_landmark_score_68 > state_snapshot.face_landmarker_score:
+				face_landmarks_5_68[index] = convert_to_face_landmark_5(face_landmarks_68[index])
+
+		for index in range(len(keep_indices)):
+			face_landmark_set : FaceLandmarkSet =\
+			{
+				'5': face_landmarks_5[index],
+				'5/68': face_landmarks_5_68[index],
+				'68': face_landmarks_68[index],
+				'68/5': face_landmarks_68_5[index]
+			}
+			face_score_set : FaceScoreSet =\
+			{
+				'detector': float(face_scores[index]),
+				'landmarker': face_landmark_scores_68[index]
+			}
+			faces.append(Face(
+				bounding_box = bounding_boxes[index],
+				score_set = face_score_set,
+				landmark_set = face_landmark_set,
+				angle = face_angles[index],
+				embedding = None,
+				embedding_norm = None,
+				gender = None,
+				age = None,
+				race = None
+			))
+	return complete_faces(vision_frame, faces)
+
+
+def complete_faces(vision_frame : VisionFrame, faces : List[Face]) -> List[Face]:
+	face_attributes = resolve_face_attributes()
+	face_landmarks_5_68 = [ face.landmark_set.get('5/68') for face in faces ]
+
+	if 'embedding' in face_attributes and any(face.embedding is None for face in faces):
+		face_embeddings, face_embeddings_norm = calculate_face_embeddings(vision_frame, face_landmarks_5_68)
+		faces = [ face._replace(embedding = face_embedding, embedding_norm = face_embedding_norm) for face, face_embedding, face_embedding_norm in zip(faces, face_embeddings, face_embeddings_norm) ]
+
+	if 'classification' in face_attributes and any(face.gender is None for face in faces):
+		face_classifications = classify_faces(vision_frame, face_landmarks_5_68)
+		faces = [ face._replace(gender = gender, age = age, race = race) for face, (gender, age, race) in zip(faces, face_classifications) ]
+
 	return faces
 
 
+def resolve_face_attributes() -> List[FaceAttribute]:
+	face_attributes : List[FaceAttribute] = []
+	state_snapshot = state_manager.get_state_snapshot()
+
+	if state_snapshot.face_selector_mode == 'reference' or 'face_swapper' in (state_snapshot.processors or []):
+		face_attributes.append('embedding')
+	if state_snapshot.face_selector_gender or state_snapshot.face_selector_race or state_snapshot.face_selector_age_start or state_snapshot.face_selector_age_end:
+		face_attributes.append('classification')
+	return face_attributes
+
+
 def get_one_face(faces : List[Face], position : int = 0) -> Optional[Face]:
 	if faces:
 		position = min(position, len(faces) - 1)
@@ -93,37 +120,69 @@ def get_average_face(faces : List[Face]) -> Optional[Face]:
 	return None
 
 
-def get_many_faces(vision_frames : List[VisionFrame]) -> List[Face]:
+def get_many_faces(vision_frames : List[VisionFrame], target_path : Optional[str] = None) -> List[Face]:
 	many_faces : List[Face] = []
+	frame_faces : List[Optional[List[Face]]] = [ get_static_faces(vision_frame) if numpy.any(vision_frame) else [] for vision_frame in vision_frames ]
+	detect_indices = [ index for index, faces in enumerate(frame_faces) if faces is None ]
+
+	for index, faces in enumerate(frame_faces):
+		if faces:
+			frame_faces[index] = complete_faces(vision_frames[index], faces)
+
+			if frame_faces[index] is not faces:
+				set_static_faces(vision_frames[index], frame_faces[index])
+
+	if detect_indices:
+		detect_vision_frames = [ vision_frames[index] for index in detect_indices ]
+		many_detections = detect_faces_by_angles(detect_vision_frames, target_path)
+
+		for index, face_detection in zip(detect_indices, many_detections):
+			vision_frame = vision_frames[index]
+			frame_faces[index] = []
+			all_bounding_boxes, all_face_scores, all_face_landmarks_5 = face_detection
+
+			if len(all_bounding_boxes) and state_manager.get_state_snapshot().face_detector_score > 0:
+				frame_faces[index] = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
 
-	for vision_frame in vision_frames:
-		if numpy.any(vision_frame):
-			static_faces = get_static_faces(vision_frame)
-			if static_faces:
-				many_faces.extend(static_faces)
-			else:
-				all_bounding_boxes = []
-				all_face_scores = []
-				all_face_landmarks_5 = []
-
-				for face_detector_angle in state_manager.get_item('face_detector_angles'):
-					if face_detector_angle == 0:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_faces(vision_frame)
-					else:
-						bounding_boxes, face_scores, face_landmarks_5 = detect_faces_by_angle(vision_frame, face_detector_angle)
-					all_bounding_boxes.extend(bounding_boxes)
-					all_face_scores.extend(face_scores)
-					all_face_landmarks_5.extend(face_landmarks_5)
-
-				if all_bounding_boxes and all_face_scores and all_face_landmarks_5 and state_manager.get_item('face_detector_score') > 0:
-					faces = create_faces(vision_frame, all_bounding_boxes, all_face_scores, all_face_landmarks_5)
-
-					if faces:
-						many_faces.extend(faces)
-						set_static_faces(vision_frame, faces)
+				if frame_faces[index]:
+					set_static_faces(vision_frame, frame_faces[index])
+
+	for faces in frame_faces:
+		many_faces.extend(faces or [])
 	return many_faces
 
 
+def detect_faces_by_angles(vision_frames : List[VisionFrame], target_path : Optional[str]) -> List[FaceDetection]:
+	face_detector_angles = state_manager.get_state_snapshot().face_detector_angles
+	face_detector_angle = FACE_DETECTOR_ANGLE_SET.get(target_path) if target_path else None
+	many_detections = [ merge_detections([]) for _ in vision_frames ]
+	detect_indices = list(range(len(vision_frames)))
+
+	if face_detector_angle in face_detector_angles:
+		for index, face_detection in zip(detect_indices, detect_faces_at_angle(vision_frames, face_detector_angle)):
+			many_detections[index] = face_detection
+		detect_indices = [ index for index in detect_indices if not len(many_detections[index][0]) ]
+
+	if detect_indices:
+		detect_vision_frames = [ vision_frames[index] for index in detect_indices ]
+		angle_detections = [ detect_faces_at_angle(detect_vision_frames, face_detector_angle) for face_detector_angle in face_detector_angles ]
+		angle_totals = [ sum(len(face_detection[0]) for face_detection in face_detections) for face_detections in angle_detections ]
+
+		for detect_index, index in enumerate(detect_indices):
+			many_detections[index] = merge_detections([ face_detections[detect_index] for face_detections in angle_detections ])
+
+		if target_path and max(angle_totals) > 0:
+			FACE_DETECTOR_ANGLE_SET[target_path] = face_detector_angles[angle_totals.index(max(angle_totals))]
+
+	return many_detections
+
+
+def detect_faces_at_angle(vision_frames : List[VisionFrame], face_detector_angle : Angle) -> List[FaceDetection]:
+	if face_detector_angle == 0:
+		return detect_many_faces(vision_frames)
+	return [ detect_faces_by_angle(vision_frame, face_detector_angle) for vision_frame in vision_frames ]
+
+
 def scale_face(target_face : Face, target_vision_frame : VisionFrame, temp_vision_frame : VisionFrame) -> Face:
 	scale_x = temp_vision_frame.shape[1] / target_vision_frame.shape[1]
 	scale_y = temp_vision_frame.shape[0] / target_vision_frame.shape[0]
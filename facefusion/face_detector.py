@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List, Sequence, Tuple
+from typing import Dict, List, Sequence, Tuple
 
 from onnxruntime import InferenceSession
 
@@ -8,12 +8,13 @@ import numpy
 
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
-from facefusion.face_helper import create_rotation_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, normalize_bounding_box, transform_bounding_box, transform_points
+from facefusion.face_helper import apply_nms, create_rotation_matrix_and_size, create_static_anchors, distance_to_bounding_box, distance_to_face_landmark_5, get_nms_threshold, normalize_bounding_boxes, transform_bounding_boxes, transform_points
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import Angle, BoundingBox, Detection, DownloadScope, DownloadSet, FaceLandmark5, InferencePool, ModelSet, Score, VisionFrame
+from facefusion.types import Angle, BoundingBoxes, Detection, DownloadScope, DownloadSet, FaceDetection, InferencePool, ModelSet, Resolution, Score, VisionFrame
 from facefusion.vision import restrict_frame, unpack_resolution
 
+FACE_DETECTOR_ANGLE_SET : Dict[str, Angle] = {}
+
 
 @lru_cache()
 def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
@@ -108,6 +109,11 @@ def get_inference_pool() -> InferencePool:
 def clear_inference_pool() -> None:
 	model_names = [ state_manager.get_item('face_detector_model') ]
 	inference_manager.clear_inference_pool(__name__, model_names)
+	clear_face_detector_angles()
+
+
+def clear_face_detector_angles() -> None:
+	FACE_DETECTOR_ANGLE_SET.clear()
 
 
 def collect_model_downloads() -> Tuple[DownloadSet, DownloadSet]:
@@ -129,236 +135,229 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hash_set) and conditional_download_sources(model_source_set)
 
 
-def detect_faces(vision_frame : VisionFrame) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	all_bounding_boxes : List[BoundingBox] = []
-	all_face_scores : List[Score] = []
-	all_face_landmarks_5 : List[FaceLandmark5] = []
+def detect_faces(vision_frame : VisionFrame) -> FaceDetection:
+	return detect_many_faces([ vision_frame ])[0]
+
+
+def detect_many_faces(vision_frames : List[VisionFrame]) -> List[FaceDetection]:
+	face_detector_score = state_manager.get_item('face_detector_score')
+
+	if state_manager.get_item('face_detector_refine'):
+		return refine_many_faces(vision_frames, face_detector_score)
+	return collect_many_faces(vision_frames, face_detector_score)
+
+
+def collect_many_faces(vision_frames : List[VisionFrame], face_detector_score : Score) -> List[FaceDetection]:
+	many_detections : List[List[FaceDetection]] = [ [] for _ in vision_frames ]
+	face_detector_model = state_manager.get_item('face_detector_model')
+	face_detector_size = state_manager.get_item('face_detector_size')
+
+	if face_detector_model in [ 'many', 'retinaface' ]:
+		collect_detections(many_detections, detect_with_retinaface(vision_frames, face_detector_size, face_detector_score))
+
+	if face_detector_model in [ 'many', 'scrfd' ]:
+		collect_detections(many_detections, detect_with_scrfd(vision_frames, face_detector_size, face_detector_score))
+
+	if face_detector_model in [ 'many', 'yolo_face' ]:
+		collect_detections(many_detections, detect_with_yolo_face(vision_frames, face_detector_size, face_detector_score))
+
+	if face_detector_model == 'yunet':
+		collect_detections(many_detections, detect_with_yunet(vision_frames, face_detector_size, face_detector_score))
+
+	return [ normalize_detection(merge_detections(face_detections)) for face_detections in many_detections ]
+
+
+def refine_many_faces(vision_frames : List[VisionFrame], face_detector_score : Score) -> List[FaceDetection]:
+	face_detector_width, face_detector_height = unpack_resolution(state_manager.get_item('face_detector_size'))
+	many_detections = collect_many_faces(vision_frames, face_detector_score / 2)
+	refine_detections : List[List[FaceDetection]] = []
+	roi_vision_frames = []
+	roi_indices = []
+	roi_offsets = []
+
+	for index, (vision_frame, face_detection) in enumerate(zip(vision_frames, many_detections)):
+		detect_ratio = max(vision_frame.shape[0] / face_detector_height, vision_frame.shape[1] / face_detector_width)
+		refine_detections.append([ filter_detection(face_detection, face_detector_score) ])
+
+		if detect_ratio > 1:
+			roi_boxes = create_roi_boxes(vision_frame, face_detection, face_detector_score / 2, detect_ratio * 64)
+
+			for roi_box in merge_roi_boxes(roi_boxes, (face_detector_width, face_detector_height)):
+				x1, y1, x2, y2 = roi_box
+				roi_vision_frames.append(vision_frame[y1:y2, x1:x2])
+				roi_indices.append(index)
+				roi_offsets.append((x1, y1))
+
+	if roi_vision_frames:
+		for index, roi_offset, roi_detection in zip(roi_indices, roi_offsets, collect_many_faces(roi_vision_frames, face_detector_score)):
+			refine_detections[index].append(offset_detection(roi_detection, roi_offset))
+
+	return [ merge_detections(face_detections) for face_detections in refine_detections ]
+
+
+def create_roi_boxes(vision_frame : VisionFrame, face_detection : FaceDetection, face_detector_score : Score, roi_size_limit : float) -> BoundingBoxes:
+	bounding_boxes, face_scores, _ = face_detection
+	vision_frame_height, vision_frame_width = vision_frame.shape[:2]
+	nms_threshold = get_nms_threshold(state_manager.get_item('face_detector_model'), state_manager.get_item('face_detector_angles'))
+
+	if len(bounding_boxes):
+		keep_indices = numpy.asarray(apply_nms(bounding_boxes, face_scores, face_detector_score, nms_threshold), dtype = int)
+		bounding_boxes = bounding_boxes[keep_indices]
+		bounding_box_sizes = numpy.max(bounding_boxes[:, 2:] - bounding_boxes[:, :2], axis = 1, keepdims = True)
+		roi_mask = bounding_box_sizes[:, 0] < roi_size_limit
+		bounding_boxes = bounding_boxes[roi_mask]
+		roi_padding = bounding_box_sizes[roi_mask] * 0.5 + 16
+		roi_boxes = numpy.concatenate([ bounding_boxes[:, :2] - roi_padding, bounding_boxes[:, 2:] + roi_padding ], axis = 1)
+		roi_boxes = numpy.clip(roi_boxes, 0, [ vision_frame_width, vision_frame_height, vision_frame_width, vision_frame_height ]).astype(int)
+		return roi_boxes[numpy.all(roi_boxes[:, 2:] > roi_boxes[:, :2], axis = 1)]
+	return numpy.empty((0, 4), dtype = int)
+
+
+def merge_roi_boxes(roi_boxes : BoundingBoxes, roi_resolution : Resolution) -> BoundingBoxes:
+	merge_boxes : List[List[int]] = []
+
+	for roi_box in roi_boxes.tolist():
+		index = 0
+
+		while index < len(merge_boxes):
+			merge_box = merge_boxes[index]
+			union_box = [ min(roi_box[0], merge_box[0]), min(roi_box[1], merge_box[1]), max(roi_box[2], merge_box[2]), max(roi_box[3], merge_box[3]) ]
+			is_overlap = roi_box[0] < merge_box[2] and merge_box[0] < roi_box[2] and roi_box[1] < merge_box[3] and merge_box[1] < roi_box[3]
+
+			if is_overlap and union_box[2] - union_box[0] <= roi_resolution[0] and union_box[3] - union_box[1] <= roi_resolution[1]:
+				roi_box = union_box
+				del merge_boxes[index]
+				index = 0
+			else:
+				index += 1
+		merge_boxes.append(roi_box)
+
+	return numpy.array(merge_boxes, dtype = int).reshape(-1, 4)
+
+
+def filter_detection(face_detection : FaceDetection, face_detector_score : Score) -> FaceDetection:
+	bounding_boxes, face_scores, face_landmarks_5 = face_detection
+	keep_mask = face_scores >= face_detector_score
+	return bounding_boxes[keep_mask], face_scores[keep_mask], face_landmarks_5[keep_mask]
+
+
+def offset_detection(face_detection : FaceDetection, roi_offset : Tuple[int, int]) -> FaceDetection:
+	bounding_boxes, face_scores, face_landmarks_5 = face_detection
+	return bounding_boxes + numpy.tile(roi_offset, 2), face_scores, face_landmarks_5 + roi_offset
+
+
+def collect_detections(many_detections : List[List[FaceDetection]], face_detections : List[FaceDetection]) -> None:
+	for frame_detections, face_detection in zip(many_detections, face_detections):
+		frame_detections.append(face_detection)
+
 
-	if state_manager.get_item('face_detector_model') in [ 'many', 'retinaface' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_retinaface(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+def merge_detections(face_detections : List[FaceDetection]) -> FaceDetection:
+	bounding_boxes = numpy.concatenate([ numpy.empty((0, 4)) ] + [ face_detection[0] for face_detection in face_detections ])
+	face_scores = numpy.concatenate([ numpy.empty(0) ] + [ face_detection[1] for face_detection in face_detections ])
+	face_landmarks_5 = numpy.concatenate([ numpy.empty((0, 5, 2)) ] + [ face_detection[2] for face_detection in face_detections ])
+	return bounding_boxes, face_scores, face_landmarks_5
 
-	if state_manager.get_item('face_detector_model') in [ 'many', 'scrfd' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_scrfd(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
 
-	if state_manager.get_item('face_detector_model') in [ 'many', 'yolo_face' ]:
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yolo_face(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
+def normalize_detection(face_detection : FaceDetection) -> FaceDetection:
+	bounding_boxes, face_scores, face_landmarks_5 = face_detection
+	return normalize_bounding_boxes(bounding_boxes), face_scores, face_landmarks_5
 
-	if state_manager.get_item('face_detector_model') == 'yunet':
-		bounding_boxes, face_scores, face_landmarks_5 = detect_with_yunet(vision_frame, state_manager.get_item('face_detector_size'))
-		all_bounding_boxes.extend(bounding_boxes)
-		all_face_scores.extend(face_scores)
-		all_face_landmarks_5.extend(face_landmarks_5)
 
-	all_bounding_boxes = [ normalize_bounding_box(all_bounding_box) for all_bounding_box in all_bounding_boxes ]
-	return all_bounding_boxes, all_face_scores, all_face_landmarks_5
+def scale_detection(face_detection : FaceDetection, detect_ratio : Tuple[float, float]) -> FaceDetection:
+	bounding_boxes, face_scores, face_landmarks_5 = face_detection
+	return bounding_boxes * numpy.tile(detect_ratio, 2), face_scores, face_landmarks_5 * detect_ratio
 
 
-def detect_faces_by_angle(vision_frame : VisionFrame, face_angle : Angle) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
+def detect_faces_by_angle(vision_frame : VisionFrame, face_angle : Angle) -> FaceDetection:
 	rotation_matrix, rotation_size = create_rotation_matrix_and_size(face_angle, vision_frame.shape[:2][::-1])
 	rotation_vision_frame = cv2.warpAffine(vision_frame, rotation_matrix, rotation_size)
 	rotation_inverse_matrix = cv2.invertAffineTransform(rotation_matrix)
 	bounding_boxes, face_scores, face_landmarks_5 = detect_faces(rotation_vision_frame)
-	bounding_boxes = [ transform_bounding_box(bounding_box, rotation_inverse_matrix) for bounding_box in bounding_boxes ]
-	face_landmarks_5 = [ transform_points(face_landmark_5, rotation_inverse_matrix) for face_landmark_5 in face_landmarks_5 ]
+	bounding_boxes = transform_bounding_boxes(bounding_boxes, rotation_inverse_matrix)
+
+	if len(face_landmarks_5):
+		face_landmarks_5 = transform_points(face_landmarks_5, rotation_inverse_matrix).reshape(-1, 5, 2)
 	return bounding_boxes, face_scores, face_landmarks_5
 
 
-def detect_with_retinaface(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
-	feature_strides = [ 8, 16, 32 ]
-	feature_map_channel = 3
-	anchor_total = 2
-	face_detector_score = state_manager.get_item('face_detector_score')
-	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ -1, 1 ])
-	detection = forward_with_retinaface(detect_vision_frame)
+def detect_with_retinaface(vision_frames : List[VisionFrame], face_detector_size : str, face_detector_score : Score) -> List[FaceDetection]:
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size, [ -1, 1 ])
+	detections = forward_detect_frames('retinaface', detect_vision_frames)
+	return [ decode_with_anchors(detection, face_detector_size, face_detector_score, detect_ratio) for detection, detect_ratio in zip(detections, detect_ratios) ]
 
-	for index, feature_stride in enumerate(feature_strides):
-		face_scores_raw = detection[index]
-		keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
 
-		if numpy.any(keep_indices):
-			stride_height = face_detector_height // feature_stride
-			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_boxes_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmarks_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+def detect_with_scrfd(vision_frames : List[VisionFrame], face_detector_size : str, face_detector_score : Score) -> List[FaceDetection]:
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size, [ -1, 1 ])
+	detections = forward_detect_frames('scrfd', detect_vision_frames)
+	return [ decode_with_anchors(detection, face_detector_size, face_detector_score, detect_ratio) for detection, detect_ratio in zip(detections, detect_ratios) ]
 
-			for bounding_box_raw in distance_to_bounding_box(anchors, bounding_boxes_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box_raw[0] * ratio_width,
-					bounding_box_raw[1] * ratio_height,
-					bounding_box_raw[2] * ratio_width,
-					bounding_box_raw[3] * ratio_height
-				]))
 
-			for face_score_raw in face_scores_raw[keep_indices]:
-				face_scores.append(face_score_raw[0])
+def detect_with_yolo_face(vision_frames : List[VisionFrame], face_detector_size : str, face_detector_score : Score) -> List[FaceDetection]:
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size, [ 0, 1 ])
+	detections = forward_detect_frames('yolo_face', detect_vision_frames)
+	return [ decode_with_yolo_face(detection, face_detector_score, detect_ratio) for detection, detect_ratio in zip(detections, detect_ratios) ]
 
-			for face_landmark_raw_5 in distance_to_face_landmark_5(anchors, face_landmarks_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
 
-	return bounding_boxes, face_scores, face_landmarks_5
+def detect_with_yunet(vision_frames : List[VisionFrame], face_detector_size : str, face_detector_score : Score) -> List[FaceDetection]:
+	detect_vision_frames, detect_ratios = prepare_detect_frames(vision_frames, face_detector_size, [ 0, 255 ])
+	detections = forward_detect_frames('yunet', detect_vision_frames)
+	return [ decode_with_yunet(detection, face_detector_size, face_detector_score, detect_ratio) for detection, detect_ratio in zip(detections, detect_ratios) ]
 
 
-def detect_with_scrfd(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+def decode_with_anchors(detection : Detection, face_detector_size : str, face_detector_score : Score, detect_ratio : Tuple[float, float]) -> FaceDetection:
+	face_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 2
-	face_detector_score = state_manager.get_item('face_detector_score')
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ -1, 1 ])
-	detection = forward_with_scrfd(detect_vision_frame)
 
 	for index, feature_stride in enumerate(feature_strides):
-		face_scores_raw = detection[index]
+		face_scores_raw = detection[index].reshape(-1)
 		keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
 
-		if numpy.any(keep_indices):
+		if keep_indices.size:
 			stride_height = face_detector_height // feature_stride
 			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_boxes_raw = detection[index + feature_map_channel] * feature_stride
-			face_landmarks_5_raw = detection[index + feature_map_channel * 2] * feature_stride
+			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)[keep_indices]
+			bounding_boxes_raw = detection[index + feature_map_channel].reshape(-1, 4)[keep_indices] * feature_stride
+			face_landmarks_5_raw = detection[index + feature_map_channel * 2].reshape(-1, 10)[keep_indices] * feature_stride
+			face_detections.append((distance_to_bounding_box(anchors, bounding_boxes_raw), face_scores_raw[keep_indices], distance_to_face_landmark_5(anchors, face_landmarks_5_raw)))
 
-			for bounding_box_raw in distance_to_bounding_box(anchors, bounding_boxes_raw)[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box_raw[0] * ratio_width,
-					bounding_box_raw[1] * ratio_height,
-					bounding_box_raw[2] * ratio_width,
-					bounding_box_raw[3] * ratio_height
-				]))
+	return scale_detection(merge_detections(face_detections), detect_ratio)
 
-			for face_score_raw in face_scores_raw[keep_indices]:
-				face_scores.append(face_score_raw[0])
 
-			for face_landmark_raw_5 in distance_to_face_landmark_5(anchors, face_landmarks_5_raw)[keep_indices]:
-				face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
-
-	return bounding_boxes, face_scores, face_landmarks_5
-
-
-def detect_with_yolo_face(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
-	face_detector_score = state_manager.get_item('face_detector_score')
-	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ 0, 1 ])
-	detection = forward_with_yolo_face(detect_vision_frame)
+def decode_with_yolo_face(detection : Detection, face_detector_score : Score, detect_ratio : Tuple[float, float]) -> FaceDetection:
 	detection = numpy.squeeze(detection).T
-	bounding_boxes_raw, face_scores_raw, face_landmarks_5_raw = numpy.split(detection, [ 4, 5 ], axis = 1)
-	keep_indices = numpy.where(face_scores_raw > face_detector_score)[0]
+	detection = detection[detection[:, 4] > face_detector_score]
+	bounding_boxes = numpy.concatenate([ detection[:, :2] - detection[:, 2:4] / 2, detection[:, :2] + detection[:, 2:4] / 2 ], axis = 1)
+	face_scores = detection[:, 4]
+	face_landmarks_5 = detection[:, 5:].reshape(-1, 5, 3)[:, :, :2]
+	return scale_detection((bounding_boxes, face_scores, face_landmarks_5), detect_ratio)
 
-	if numpy.any(keep_indices):
-		bounding_boxes_raw, face_scores_raw, face_landmarks_5_raw = bounding_boxes_raw[keep_indices], face_scores_raw[keep_indices], face_landmarks_5_raw[keep_indices]
 
-		for bounding_box_raw in bounding_boxes_raw:
-			bounding_boxes.append(numpy.array(
-			[
-				(bounding_box_raw[0] - bounding_box_raw[2] / 2) * ratio_width,
-				(bounding_box_raw[1] - bounding_box_raw[3] / 2) * ratio_height,
-				(bounding_box_raw[0] + bounding_box_raw[2] / 2) * ratio_width,
-				(bounding_box_raw[1] + bounding_box_raw[3] / 2) * ratio_height
-			]))
-
-		face_scores = face_scores_raw.ravel().tolist()
-		face_landmarks_5_raw[:, 0::3] = (face_landmarks_5_raw[:, 0::3]) * ratio_width
-		face_landmarks_5_raw[:, 1::3] = (face_landmarks_5_raw[:, 1::3]) * ratio_height
-
-		for face_landmark_raw_5 in face_landmarks_5_raw:
-			face_landmarks_5.append(numpy.array(face_landmark_raw_5.reshape(-1, 3)[:, :2]))
-
-	return bounding_boxes, face_scores, face_landmarks_5
-
-
-def detect_with_yunet(vision_frame : VisionFrame, face_detector_size : str) -> Tuple[List[BoundingBox], List[Score], List[FaceLandmark5]]:
-	bounding_boxes = []
-	face_scores = []
-	face_landmarks_5 = []
+def decode_with_yunet(detection : Detection, face_detector_size : str, face_detector_score : Score, detect_ratio : Tuple[float, float]) -> FaceDetection:
+	face_detections = []
 	feature_strides = [ 8, 16, 32 ]
 	feature_map_channel = 3
 	anchor_total = 1
-	face_detector_score = state_manager.get_item('face_detector_score')
 	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
-	temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
-	ratio_height = vision_frame.shape[0] / temp_vision_frame.shape[0]
-	ratio_width = vision_frame.shape[1] / temp_vision_frame.shape[1]
-	detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
-	detect_vision_frame = normalize_detect_frame(detect_vision_frame, [ 0, 255 ])
-	detection = forward_with_yunet(detect_vision_frame)
 
 	for index, feature_stride in enumerate(feature_strides):
 		face_scores_raw = (detection[index] * detection[index + feature_map_channel]).reshape(-1)
 		keep_indices = numpy.where(face_scores_raw >= face_detector_score)[0]
 
-		if numpy.any(keep_indices):
+		if keep_indices.size:
 			stride_height = face_detector_height // feature_stride
 			stride_width = face_detector_width // feature_stride
-			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)
-			bounding_boxes_center = detection[index + feature_map_channel * 2].squeeze(0)[:, :2] * feature_stride + anchors
-			bounding_boxes_size = numpy.exp(detection[index + feature_map_channel * 2].squeeze(0)[:, 2:4]) * feature_stride
-			face_landmarks_5_raw = detection[index + feature_map_channel * 3].squeeze(0)
-
-			bounding_boxes_raw = numpy.stack(
-			[
-				bounding_boxes_center[:, 0] - bounding_boxes_size[:, 0] / 2,
-				bounding_boxes_center[:, 1] - bounding_boxes_size[:, 1] / 2,
-				bounding_boxes_center[:, 0] + bounding_boxes_size[:, 0] / 2,
-				bounding_boxes_center[:, 1] + bounding_boxes_size[:, 1] / 2
-			], axis = -1)
-
-			for bounding_box_raw in bounding_boxes_raw[keep_indices]:
-				bounding_boxes.append(numpy.array(
-				[
-					bounding_box_raw[0] * ratio_width,
-					bounding_box_raw[1] * ratio_height,
-					bounding_box_raw[2] * ratio_width,
-					bounding_box_raw[3] * ratio_height
-				]))
-
-			face_scores.extend(face_scores_raw[keep_indices])
-			face_landmarks_5_raw = numpy.concatenate(
-			[
-				face_landmarks_5_raw[:, [0, 1]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [2, 3]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [4, 5]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [6, 7]] * feature_stride + anchors,
-				face_landmarks_5_raw[:, [8, 9]] * feature_stride + anchors
-			], axis = -1).reshape(-1, 5, 2)
-
-			for face_landmark_raw_5 in face_landmarks_5_raw[keep_indices]:
-				face_landmarks_5.append(face_landmark_raw_5 * [ ratio_width, ratio_height ])
+			anchors = create_static_anchors(feature_stride, anchor_total, stride_height, stride_width)[keep_indices]
+			bounding_boxes_raw = detection[index + feature_map_channel * 2].reshape(-1, 4)[keep_indices]
+			bounding_boxes_center = bounding_boxes_raw[:, :2] * feature_stride + anchors
+			bounding_boxes_size = numpy.exp(bounding_boxes_raw[:, 2:4]) * feature_stride
+			bounding_boxes = numpy.concatenate([ bounding_boxes_center - bounding_boxes_size / 2, bounding_boxes_center + bounding_boxes_size / 2 ], axis = 1)
+			face_landmarks_5 = detection[index + feature_map_channel * 3].reshape(-1, 5, 2)[keep_indices] * feature_stride + anchors[:, numpy.newaxis]
+			face_detections.append((bounding_boxes, face_scores_raw[keep_indices], face_landmarks_5))
 
-	return bounding_boxes, face_scores, face_landmarks_5
+	return scale_detection(merge_detections(face_detections), detect_ratio)
 
 
 def resolve_face_detector_session(model_name : str) -> InferenceSession:
@@ -378,52 +377,31 @@ def resolve_face_detector_session(model_name : str) -> InferenceSession:
         return face_detector_session
 
 
-def forward_with_retinaface(detect_vision_frame : VisionFrame) -> Detection:
-        face_detector = resolve_face_detector_session('retinaface')
-
-        with thread_semaphore():
-                detection = face_detector.run(None,
-                {
-                        'input': detect_vision_frame
-                })
+def forward_detect_frames(model_name : str, detect_vision_frames : List[VisionFrame]) -> List[Detection]:
+	face_detector = resolve_face_detector_session(model_name)
 
-        return detection
-
-
-def forward_with_scrfd(detect_vision_frame : VisionFrame) -> Detection:
-        face_detector = resolve_face_detector_session('scrfd')
-
-        with thread_semaphore():
-                detection = face_detector.run(None,
-                {
-                        'input': detect_vision_frame
-                })
-
-        return detection
-
-
-def forward_with_yolo_face(detect_vision_frame : VisionFrame) -> Detection:
-        face_detector = resolve_face_detector_session('yolo_face')
-
-        with thread_semaphore():
-                detection = face_detector.run(None,
-                {
-                        'input': detect_vision_frame
-                })
+	if len(detect_vision_frames) > 1 and inference_manager.is_batchable_session(face_detector):
+		detection = inference_manager.run_inference(face_detector,
+		{
+			'input': numpy.concatenate(detect_vision_frames)
+		})
+		return [ [ detection_output[index:index + 1] for detection_output in detection ] for index in range(len(detect_vision_frames)) ]
 
-        return detection
+	return [ inference_manager.run_inference(face_detector, { 'input': detect_vision_frame }) for detect_vision_frame in detect_vision_frames ]
 
 
-def forward_with_yunet(detect_vision_frame : VisionFrame) -> Detection:
-        face_detector = resolve_face_detector_session('yunet')
+def prepare_detect_frames(vision_frames : List[VisionFrame], face_detector_size : str, normalize_range : Sequence[int]) -> Tuple[List[VisionFrame], List[Tuple[float, float]]]:
+	face_detector_width, face_detector_height = unpack_resolution(face_detector_size)
+	detect_vision_frames = []
+	detect_ratios = []
 
-        with thread_semaphore():
-                detection = face_detector.run(None,
-                {
-                        'input': detect_vision_frame
-                })
+	for vision_frame in vision_frames:
+		temp_vision_frame = restrict_frame(vision_frame, (face_detector_width, face_detector_height))
+		detect_vision_frame = prepare_detect_frame(temp_vision_frame, face_detector_size)
+		detect_vision_frames.append(normalize_detect_frame(detect_vision_frame, normalize_range))
+		detect_ratios.append((vision_frame.shape[1] / temp_vision_frame.shape[1], vision_frame.shape[0] / temp_vision_frame.shape[0]))
 
-        return detection
+	return detect_vision_frames, detect_ratios
 
 
 def prepare_detect_frame(temp_vision_frame : VisionFrame, face_detector_size : str) -> VisionFrame:
@@ -5,7 +5,7 @@ import cv2
 import numpy
 from cv2.typing import Size
 
-from facefusion.types import Anchors, Angle, BoundingBox, Distance, FaceDetectorModel, FaceLandmark5, FaceLandmark68, Mask, Matrix, Points, Scale, Score, Translation, VisionFrame, WarpTemplate, WarpTemplateSet
+from facefusion.types import Anchors, Angle, BoundingBox, BoundingBoxes, Distance, FaceDetectorModel, FaceLandmark5, FaceLandmark68, Mask, Matrix, Points, Scale, Scores, Translation, VisionFrame, WarpTemplate, WarpTemplateSet
 
 WARP_TEMPLATE_SET : WarpTemplateSet =\
 {
@@ -161,6 +161,10 @@ def normalize_bounding_box(bounding_box : BoundingBox) -> BoundingBox:
 	return numpy.array([ x1, y1, x2, y2 ])
 
 
+def normalize_bounding_boxes(bounding_boxes : BoundingBoxes) -> BoundingBoxes:
+	return numpy.concatenate([ numpy.minimum(bounding_boxes[:, :2], bounding_boxes[:, 2:]), numpy.maximum(bounding_boxes[:, :2], bounding_boxes[:, 2:]) ], axis = 1)
+
+
 def transform_points(points : Points, matrix : Matrix) -> Points:
 	points = points.reshape(-1, 1, 2)
 	points = cv2.transform(points, matrix) #type:ignore[assignment]
@@ -182,6 +186,13 @@ def transform_bounding_box(bounding_box : BoundingBox, matrix : Matrix) -> Bound
 	return normalize_bounding_box(numpy.array([ x1, y1, x2, y2 ]))
 
 
+def transform_bounding_boxes(bounding_boxes : BoundingBoxes, matrix : Matrix) -> BoundingBoxes:
+	if len(bounding_boxes):
+		points = transform_points(bounding_boxes[:, [ 0, 1, 2, 1, 2, 3, 0, 3 ]], matrix).reshape(-1, 4, 2)
+		return numpy.concatenate([ numpy.min(points, axis = 1), numpy.max(points, axis = 1) ], axis = 1)
+	return bounding_boxes
+
+
 def distance_to_bounding_box(points : Points, distance : Distance) -> BoundingBox:
 	x1 = points[:, 0] - distance[:, 0]
 	y1 = points[:, 1] - distance[:, 1]
@@ -228,8 +239,8 @@ def estimate_face_angle(face_landmark_68 : FaceLandmark68) -> Angle:
 	return face_angle
 
 
-def apply_nms(bounding_boxes : List[BoundingBox], scores : List[Score], score_threshold : float, nms_threshold : float) -> Sequence[int]:
-	bounding_boxes_norm = [ (x1, y1, x2 - x1, y2 - y1) for (x1, y1, x2, y2) in bounding_boxes ]
+def apply_nms(bounding_boxes : BoundingBoxes, scores : Scores, score_threshold : float, nms_threshold : float) -> Sequence[int]:
+	bounding_boxes_norm = numpy.concatenate([ bounding_boxes[:, :2], bounding_boxes[:, 2:] - bounding_boxes[:, :2] ], axis = 1)
 	keep_indices = cv2.dnn.NMSBoxes(bounding_boxes_norm, scores, score_threshold = score_threshold, nms_threshold = nms_threshold)
 	return keep_indices
 
@@ -1,15 +1,15 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy
+from cv2.typing import Size
 
 from facefusion import inference_manager, logger, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import create_rotation_matrix_and_size, estimate_matrix_by_face_landmark_5, transform_points, warp_face_by_translation
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.types import Angle, BoundingBox, DownloadScope, DownloadSet, FaceLandmark5, FaceLandmark68, InferencePool, ModelSet, Prediction, Score, VisionFrame
+from facefusion.types import Angle, BoundingBoxes, DownloadScope, DownloadSet, FaceLandmark68, FaceLandmarks5, InferencePool, Matrix, ModelSet, Prediction, Score, VisionFrame
 
 
 @lru_cache()
@@ -78,13 +78,16 @@ def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
 	}
 
 
-def get_inference_pool() -> InferencePool:
+def get_inference_pool(load_model_names : Optional[List[str]] = None) -> InferencePool:
         model_names = [ state_manager.get_item('face_landmarker_model'), 'fan_68_5' ]
         if not pre_check():
                 logger.error('Unable to download face landmarker models.', __name__)
                 raise RuntimeError('Face landmarker models are not available.')
 
         _, model_source_set = collect_model_downloads()
+
+        if load_model_names:
+                model_source_set = { model_name : model_source for model_name, model_source in model_source_set.items() if model_name in load_model_names }
         inference_pool = inference_manager.get_inference_pool(__name__, model_names, model_source_set)
         expected_models = [ model_name for model_name in model_source_set.keys() if model_name ]
         missing_models = [ model_name for model_name in expected_models if model_name not in inference_pool ]
@@ -127,59 +130,74 @@ def pre_check() -> bool:
 	return conditional_download_hashes(model_hash_set) and conditional_download_sources(model_source_set)
 
 
-def detect_face_landmark(vision_frame : VisionFrame, bounding_box : BoundingBox, face_angle : Angle) -> Tuple[FaceLandmark68, Score]:
-	face_landmark_2dfan4 = None
-	face_landmark_peppa_wutz = None
-	face_landmark_score_2dfan4 = 0.0
-	face_landmark_score_peppa_wutz = 0.0
+def detect_face_landmarks(vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_angles : List[Angle]) -> Tuple[List[FaceLandmark68], List[Score]]:
+	face_landmarks_2dfan4 : List[Optional[FaceLandmark68]] = [ None ] * len(bounding_boxes)
+	face_landmarks_peppa_wutz : List[Optional[FaceLandmark68]] = [ None ] * len(bounding_boxes)
+	face_landmark_scores_2dfan4 = [ 0.0 ] * len(bounding_boxes)
+	face_landmark_scores_peppa_wutz = [ 0.0 ] * len(bounding_boxes)
+	face_landmarks_68 = []
+	face_landmark_scores_68 = []
 
 	if state_manager.get_item('face_landmarker_model') in [ 'many', '2dfan4' ]:
-		face_landmark_2dfan4, face_landmark_score_2dfan4 = detect_with_2dfan4(vision_frame, bounding_box, face_angle)
+		face_landmarks_2dfan4, face_landmark_scores_2dfan4 = detect_with_2dfan4(vision_frame, bounding_boxes, face_angles)
 
 	if state_manager.get_item('face_landmarker_model') in [ 'many', 'peppa_wutz' ]:
-		face_landmark_peppa_wutz, face_landmark_score_peppa_wutz = detect_with_peppa_wutz(vision_frame, bounding_box, face_angle)
+		face_landmarks_peppa_wutz, face_landmark_scores_peppa_wutz = detect_with_peppa_wutz(vision_frame, bounding_boxes, face_angles)
+
+	for face_landmark_2dfan4, face_landmark_score_2dfan4, face_landmark_peppa_wutz, face_landmark_score_peppa_wutz in zip(face_landmarks_2dfan4, face_landmark_scores_2dfan4, face_landmarks_peppa_wutz, face_landmark_scores_peppa_wutz):
+		if face_landmark_score_2dfan4 > face_landmark_score_peppa_wutz - 0.2:
+			face_landmarks_68.append(face_landmark_2dfan4)
+			face_landmark_scores_68.append(face_landmark_score_2dfan4)
+		else:
+			face_landmarks_68.append(face_landmark_peppa_wutz)
+			face_landmark_scores_68.append(face_landmark_score_peppa_wutz)
 
-	if face_landmark_score_2dfan4 > face_landmark_score_peppa_wutz - 0.2:
-		return face_landmark_2dfan4, face_landmark_score_2dfan4
-	return face_landmark_peppa_wutz, face_landmark_score_peppa_wutz
+	return face_landmarks_68, face_landmark_scores_68
 
 
-def detect_with_2dfan4(temp_vision_frame: VisionFrame, bounding_box: BoundingBox, face_angle: Angle) -> Tuple[FaceLandmark68, Score]:
+def detect_with_2dfan4(temp_vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_angles : List[Angle]) -> Tuple[List[FaceLandmark68], List[Score]]:
 	model_size = create_static_model_set('full').get('2dfan4').get('size')
-	scale = 195 / numpy.subtract(bounding_box[2:], bounding_box[:2]).max().clip(1, None)
-	translation = (model_size[0] - numpy.add(bounding_box[2:], bounding_box[:2]) * scale) * 0.5
-	rotation_matrix, rotation_size = create_rotation_matrix_and_size(face_angle, model_size)
-	crop_vision_frame, affine_matrix = warp_face_by_translation(temp_vision_frame, translation, scale, model_size)
-	crop_vision_frame = cv2.warpAffine(crop_vision_frame, rotation_matrix, rotation_size)
-	crop_vision_frame = conditional_optimize_contrast(crop_vision_frame)
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1).astype(numpy.float32) / 255.0
-	face_landmark_68, face_heatmap = forward_with_2dfan4(crop_vision_frame)
-	face_landmark_68 = face_landmark_68[:, :, :2][0] / 64 * 256
-	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(rotation_matrix))
-	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(affine_matrix))
-	face_landmark_score_68 = numpy.amax(face_heatmap, axis = (2, 3))
-	face_landmark_score_68 = numpy.mean(face_landmark_score_68)
-	face_landmark_score_68 = numpy.interp(face_landmark_score_68, [ 0, 0.9 ], [ 0, 1 ])
-	return face_landmark_68, face_landmark_score_68
+	crop_vision_frames, crop_matrices = prepare_crop_frames(temp_vision_frame, bounding_boxes, face_angles, model_size)
+	face_landmarks_68_raw, face_heatmaps = forward_with_2dfan4(crop_vision_frames)
+	face_landmarks_68 = [ restore_face_landmark_68(face_landmark_68, crop_matrix) for face_landmark_68, crop_matrix in zip(face_landmarks_68_raw[:, :, :2] / 64 * 256, crop_matrices) ]
+	face_landmark_scores_68 = numpy.mean(numpy.amax(face_heatmaps, axis = (2, 3)), axis = 1)
+	face_landmark_scores_68 = numpy.interp(face_landmark_scores_68, [ 0, 0.9 ], [ 0, 1 ])
+	return face_landmarks_68, face_landmark_scores_68.tolist()
 
 
-def detect_with_peppa_wutz(temp_vision_frame : VisionFrame, bounding_box : BoundingBox, face_angle : Angle) -> Tuple[FaceLandmark68, Score]:
+def detect_with_peppa_wutz(temp_vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_angles : List[Angle]) -> Tuple[List[FaceLandmark68], List[Score]]:
 	model_size = create_static_model_set('full').get('peppa_wutz').get('size')
-	scale = 195 / numpy.subtract(bounding_box[2:], bounding_box[:2]).max().clip(1, None)
-	translation = (model_size[0] - numpy.add(bounding_box[2:], bounding_box[:2]) * scale) * 0.5
-	rotation_matrix, rotation_size = create_rotation_matrix_and_size(face_angle, model_size)
-	crop_vision_frame, affine_matrix = warp_face_by_translation(temp_vision_frame, translation, scale, model_size)
-	crop_vision_frame = cv2.warpAffine(crop_vision_frame, rotation_matrix, rotation_size)
-	crop_vision_frame = conditional_optimize_contrast(crop_vision_frame)
-	crop_vision_frame = crop_vision_frame.transpose(2, 0, 1).astype(numpy.float32) / 255.0
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-	prediction = forward_with_peppa_wutz(crop_vision_frame)
-	face_landmark_68 = prediction.reshape(-1, 3)[:, :2] / 64 * model_size[0]
+	crop_vision_frames, crop_matrices = prepare_crop_frames(temp_vision_frame, bounding_boxes, face_angles, model_size)
+	prediction = forward_with_peppa_wutz(crop_vision_frames).reshape(len(crop_vision_frames), -1, 3)
+	face_landmarks_68 = [ restore_face_landmark_68(face_landmark_68, crop_matrix) for face_landmark_68, crop_matrix in zip(prediction[:, :, :2] / 64 * model_size[0], crop_matrices) ]
+	face_landmark_scores_68 = prediction[:, :, 2].mean(axis = 1)
+	face_landmark_scores_68 = numpy.interp(face_landmark_scores_68, [ 0, 0.95 ], [ 0, 1 ])
+	return face_landmarks_68, face_landmark_scores_68.tolist()
+
+
+def prepare_crop_frames(temp_vision_frame : VisionFrame, bounding_boxes : BoundingBoxes, face_angles : List[Angle], model_size : Size) -> Tuple[VisionFrame, List[Tuple[Matrix, Matrix]]]:
+	crop_vision_frames = []
+	crop_matrices = []
+
+	for bounding_box, face_angle in zip(bounding_boxes, face_angles):
+		scale = 195 / numpy.subtract(bounding_box[2:], bounding_box[:2]).max().clip(1, None)
+		translation = (model_size[0] - numpy.add(bounding_box[2:], bounding_box[:2]) * scale) * 0.5
+		rotation_matrix, rotation_size = create_rotation_matrix_and_size(face_angle, model_size)
+		crop_vision_frame, affine_matrix = warp_face_by_translation(temp_vision_frame, translation, scale, model_size)
+		crop_vision_frame = cv2.warpAffine(crop_vision_frame, rotation_matrix, rotation_size)
+		crop_vision_frame = conditional_optimize_contrast(crop_vision_frame)
+		crop_vision_frames.append(crop_vision_frame.transpose(2, 0, 1))
+		crop_matrices.append((rotation_matrix, affine_matrix))
+
+	crop_vision_frames = numpy.stack(crop_vision_frames).astype(numpy.float32) / 255.0
+	return crop_vision_frames, crop_matrices
+
+
+def restore_face_landmark_68(face_landmark_68 : FaceLandmark68, crop_matrix : Tuple[Matrix, Matrix]) -> FaceLandmark68:
+	rotation_matrix, affine_matrix = crop_matrix
 	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(rotation_matrix))
 	face_landmark_68 = transform_points(face_landmark_68, cv2.invertAffineTransform(affine_matrix))
-	face_landmark_score_68 = prediction.reshape(-1, 3)[:, 2].mean()
-	face_landmark_score_68 = numpy.interp(face_landmark_score_68, [ 0, 0.95 ], [ 0, 1 ])
-	return face_landmark_68, face_landmark_score_68
+	return face_landmark_68
 
 
 def conditional_optimize_contrast(crop_vision_frame : VisionFrame) -> VisionFrame:
@@ -190,45 +208,39 @@ def conditional_optimize_contrast(crop_vision_frame : VisionFrame) -> VisionFram
 	return crop_vision_frame
 
 
-def estimate_face_landmark_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark68:
-	affine_matrix = estimate_matrix_by_face_landmark_5(face_landmark_5, 'ffhq_512', (1, 1))
-	face_landmark_5 = cv2.transform(face_landmark_5.reshape(1, -1, 2), affine_matrix).reshape(-1, 2)
-	face_landmark_68_5 = forward_fan_68_5(face_landmark_5)
-	face_landmark_68_5 = cv2.transform(face_landmark_68_5.reshape(1, -1, 2), cv2.invertAffineTransform(affine_matrix)).reshape(-1, 2)
-	return face_landmark_68_5
+def estimate_face_landmarks_68_5(face_landmarks_5 : FaceLandmarks5) -> List[FaceLandmark68]:
+	affine_matrices = [ estimate_matrix_by_face_landmark_5(face_landmark_5, 'ffhq_512', (1, 1)) for face_landmark_5 in face_landmarks_5 ]
+	face_landmarks_5 = numpy.stack([ cv2.transform(face_landmark_5.reshape(1, -1, 2), affine_matrix).reshape(-1, 2) for face_landmark_5, affine_matrix in zip(face_landmarks_5, affine_matrices) ]).astype(numpy.float32)
+	face_landmarks_68_5 = forward_fan_68_5(face_landmarks_5)
+	face_landmarks_68_5 = [ cv2.transform(face_landmark_68_5.reshape(1, -1, 2), cv2.invertAffineTransform(affine_matrix)).reshape(-1, 2) for face_landmark_68_5, affine_matrix in zip(face_landmarks_68_5, affine_matrices) ]
+	return face_landmarks_68_5
 
 
-def forward_with_2dfan4(crop_vision_frame : VisionFrame) -> Tuple[Prediction, Prediction]:
-	face_landmarker = get_inference_pool().get('2dfan4')
-
-	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
-		{
-			'input': [ crop_vision_frame ]
-		})
-
-	return prediction
+def forward_with_2dfan4(crop_vision_frames : VisionFrame) -> Tuple[Prediction, Prediction]:
+	face_landmarker = get_inference_pool([ '2dfan4' ]).get('2dfan4')
+	face_landmarks_68, face_heatmaps = inference_manager.run_stacked_inference(face_landmarker,
+	{
+		'input': crop_vision_frames
+	})
 
+	return face_landmarks_68, face_heatmaps
 
-def forward_with_peppa_wutz(crop_vision_frame : VisionFrame) -> Prediction:
-	face_landmarker = get_inference_pool().get('peppa_wutz')
 
-	with conditional_thread_semaphore():
-		prediction = face_landmarker.run(None,
-		{
-			'input': crop_vision_frame
-		})[0]
+def forward_with_peppa_wutz(crop_vision_frames : VisionFrame) -> Prediction:
+	face_landmarker = get_inference_pool([ 'peppa_wutz' ]).get('peppa_wutz')
+	prediction = inference_manager.run_stacked_inference(face_landmarker,
+	{
+		'input': crop_vision_frames
+	})[0]
 
 	return prediction
 
 
-def forward_fan_68_5(face_landmark_5 : FaceLandmark5) -> FaceLandmark68:
-	face_landmarker = get_inference_pool().get('fan_68_5')
-
-	with conditional_thread_semaphore():
-		face_landmark_68_5 = face_landmarker.run(None,
-		{
-			'input': [ face_landmark_5 ]
-		})[0][0]
+def forward_fan_68_5(face_landmarks_5 : FaceLandmarks5) -> Prediction:
+	face_landmarker = get_inference_pool([ 'fan_68_5' ]).get('fan_68_5')
+	face_landmarks_68_5 = inference_manager.run_stacked_inference(face_landmarker,
+	{
+		'input': face_landmarks_5
+	})[0]
 
-	return face_landmark_68_5
+	return face_landmarks_68_5
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 import cv2
 import numpy
@@ -8,7 +8,7 @@ import facefusion.choices
 from facefusion import inference_manager, state_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.thread_helper import session_semaphore
 from facefusion.types import DownloadScope, DownloadSet, FaceLandmark68, FaceMaskArea, FaceMaskRegion, InferencePool, Mask, ModelSet, Padding, VisionFrame
 
 
@@ -119,10 +119,14 @@ def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
 	}
 
 
-def get_inference_pool() -> InferencePool:
-	model_names = [ state_manager.get_item('face_occluder_model'), state_manager.get_item('face_parser_model') ]
+def get_inference_pool(load_model_names : Optional[List[str]] = None) -> InferencePool:
+	state_snapshot = state_manager.get_state_snapshot()
+	model_names = [ state_snapshot.face_occluder_model, state_snapshot.face_parser_model ]
 	_, model_source_set = collect_model_downloads()
 
+	if load_model_names:
+		model_source_set = { model_name : model_source for model_name, model_source in model_source_set.items() if model_name in load_model_names }
+
 	return inference_manager.get_inference_pool(__name__, model_names, model_source_set)
 
 
@@ -172,17 +176,17 @@ def create_box_mask(crop_vision_frame : VisionFrame, face_mask_blur : float, fac
 
 def create_occlusion_mask(crop_vision_frame : VisionFrame) -> Mask:
 	temp_masks = []
+	face_occluder_model = state_manager.get_state_snapshot().face_occluder_model
 
-	if state_manager.get_item('face_occluder_model') == 'many':
+	if face_occluder_model == 'many':
 		model_names = [ 'xseg_1', 'xseg_2', 'xseg_3' ]
 	else:
-		model_names = [ state_manager.get_item('face_occluder_model') ]
+		model_names = [ face_occluder_model ]
 
 	for model_name in model_names:
 		model_size = create_static_model_set('full').get(model_name).get('size')
-		prepare_vision_frame = cv2.resize(crop_vision_frame, model_size)
-		prepare_vision_frame = numpy.expand_dims(prepare_vision_frame, axis = 0).astype(numpy.float32) / 255.0
-		prepare_vision_frame = prepare_vision_frame.transpose(0, 1, 2, 3)
+		prepare_vision_frame = inference_manager.get_tensor_buffer(model_name + '.input', (1,) + model_size[::-1] + (3,), numpy.float32)
+		numpy.divide(cv2.resize(crop_vision_frame, model_size), 255.0, out = prepare_vision_frame[0], casting = 'unsafe')
 		temp_mask = forward_occlude_face(prepare_vision_frame, model_name)
 		temp_mask = temp_mask.transpose(0, 1, 2).clip(0, 1).astype(numpy.float32)
 		temp_mask = cv2.resize(temp_mask, crop_vision_frame.shape[:2][::-1])
@@ -209,7 +213,7 @@ def create_area_mask(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLan
 
 
 def create_region_mask(crop_vision_frame : VisionFrame, face_mask_regions : List[FaceMaskRegion]) -> Mask:
-	model_name = state_manager.get_item('face_parser_model')
+	model_name = state_manager.get_state_snapshot().face_parser_model
 	model_size = create_static_model_set('full').get(model_name).get('size')
 	prepare_vision_frame = cv2.resize(crop_vision_frame, model_size)
 	prepare_vision_frame = prepare_vision_frame[:, :, ::-1].astype(numpy.float32) / 255.0
@@ -225,22 +229,21 @@ def create_region_mask(crop_vision_frame : VisionFrame, face_mask_regions : List
 
 
 def forward_occlude_face(prepare_vision_frame : VisionFrame, model_name : str) -> Mask:
-	face_occluder = get_inference_pool().get(model_name)
+	face_occluder = get_inference_pool([ model_name ]).get(model_name)
 
-	with conditional_thread_semaphore():
-		occlusion_mask : Mask = face_occluder.run(None,
-		{
-			'input': prepare_vision_frame
-		})[0][0]
+	occlusion_mask : Mask = inference_manager.run_bound_inference(face_occluder,
+	{
+		'input': prepare_vision_frame
+	})[0][0]
 
 	return occlusion_mask
 
 
 def forward_parse_face(prepare_vision_frame : VisionFrame) -> Mask:
-	model_name = state_manager.get_item('face_parser_model')
-	face_parser = get_inference_pool().get(model_name)
+	model_name = state_manager.get_state_snapshot().face_parser_model
+	face_parser = get_inference_pool([ model_name ]).get(model_name)
 
-	with conditional_thread_semaphore():
+	with session_semaphore(face_parser):
 		region_mask : Mask = face_parser.run(None,
 		{
 			'input': prepare_vision_frame
@@ -1,5 +1,5 @@
 from functools import lru_cache
-from typing import Tuple
+from typing import List, Tuple
 
 import numpy
 
@@ -7,8 +7,7 @@ from facefusion import inference_manager
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.face_helper import warp_face_by_face_landmark_5
 from facefusion.filesystem import resolve_relative_path
-from facefusion.thread_helper import conditional_thread_semaphore
-from facefusion.types import DownloadScope, Embedding, FaceLandmark5, InferencePool, ModelOptions, ModelSet, VisionFrame
+from facefusion.types import DownloadScope, Embedding, FaceLandmarks5, InferencePool, ModelOptions, ModelSet, VisionFrame
 
 
 @lru_cache()
@@ -56,17 +55,19 @@ def pre_check() -> bool:
     return conditional_download_hashes(model_hash_set) and conditional_download_sources(model_source_set)
 
 
-def calculate_face_embedding(temp_vision_frame: VisionFrame, face_landmark_5: FaceLandmark5) -> Tuple[Embedding, Embedding]:
+def calculate_face_embeddings(temp_vision_frame : VisionFrame, face_landmarks_5 : FaceLandmarks5) -> Tuple[List[Embedding], List[Embedding]]:
     model_template = get_model_options().get('template')
     model_size = get_model_options().get('size')
-    crop_vision_frame, matrix = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
-    crop_vision_frame = crop_vision_frame / 127.5 - 1
-    crop_vision_frame = crop_vision_frame[:, :, ::-1].transpose(2, 0, 1).astype(numpy.float32)
-    crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0)
-    face_embedding = forward(crop_vision_frame)
-    face_embedding = face_embedding.ravel()
-    face_embedding_norm = face_embedding / numpy.linalg.norm(face_embedding)
-    return face_embedding, face_embedding_norm
+    crop_buffer = inference_manager.get_tensor_buffer('face_recognizer.input', (len(face_landmarks_5), 3) + model_size[::-1], numpy.float32)
+
+    for index, face_landmark_5 in enumerate(face_landmarks_5):
+        crop_vision_frame, _ = warp_face_by_face_landmark_5(temp_vision_frame, face_landmark_5, model_template, model_size)
+        numpy.divide(crop_vision_frame[:, :, ::-1].transpose(2, 0, 1), 127.5, out = crop_buffer[index], casting = 'unsafe')
+
+    numpy.subtract(crop_buffer, 1, out = crop_buffer)
+    face_embeddings = forward(crop_buffer).reshape(len(face_landmarks_5), -1)
+    face_embeddings_norm = face_embeddings / numpy.linalg.norm(face_embeddings, axis = 1, keepdims = True)
+    return list(face_embeddings), list(face_embeddings_norm)
 
 
 def forward(crop_vision_frame: VisionFrame) -> Embedding:
@@ -80,12 +81,11 @@ def forward(crop_vision_frame: VisionFrame) -> Embedding:
     if face_recognizer is None:
         raise RuntimeError('Failed to load face recognizer inference session.')
 
-    with conditional_thread_semaphore():
-        face_embedding = face_recognizer.run(
-            None,
-            {
-                'input': crop_vision_frame
-            }
-        )[0]
+    face_embedding = inference_manager.run_stacked_inference(
+        face_recognizer,
+        {
+            'input': crop_vision_frame
+        }
+    )[0].copy()
 
     return face_embedding
@@ -1,29 +1,35 @@
-from typing import List
+from typing import Dict, List
 
 import numpy
 
 from facefusion import state_manager
 from facefusion.face_analyser import get_many_faces, get_one_face
-from facefusion.types import Face, FaceSelectorOrder, Gender, Race, Score, VisionFrame
+from facefusion.face_store import pin_static_faces
+from facefusion.hash_helper import create_hash
+from facefusion.types import Embeddings, Face, FaceSelectorOrder, Gender, Race, Score, VisionFrame
+
+REFERENCE_MATRIX_SET : Dict[str, Embeddings] = {}
 
 
 def select_faces(reference_vision_frame : VisionFrame, target_vision_frame : VisionFrame) -> List[Face]:
-	target_faces = get_many_faces([ target_vision_frame ])
+	state_snapshot = state_manager.get_state_snapshot()
+	target_faces = get_many_faces([ target_vision_frame ], state_manager.get_item('target_path'))
 
-	if state_manager.get_item('face_selector_mode') == 'many':
+	if state_snapshot.face_selector_mode == 'many':
 		return sort_and_filter_faces(target_faces)
 
-	if state_manager.get_item('face_selector_mode') == 'one':
+	if state_snapshot.face_selector_mode == 'one':
 		target_face = get_one_face(sort_and_filter_faces(target_faces))
 		if target_face:
 			return [ target_face ]
 
-	if state_manager.get_item('face_selector_mode') == 'reference':
+	if state_snapshot.face_selector_mode == 'reference':
 		reference_faces = get_many_faces([ reference_vision_frame ])
+		pin_static_faces(reference_vision_frame)
 		reference_faces = sort_and_filter_faces(reference_faces)
-		reference_face = get_one_face(reference_faces, state_manager.get_item('reference_face_position'))
+		reference_face = get_one_face(reference_faces, state_snapshot.reference_face_position)
 		if reference_face:
-			match_faces = find_match_faces([ reference_face ], target_faces, state_manager.get_item('reference_face_distance'))
+			match_faces = find_match_faces([ reference_face ], target_faces, state_snapshot.reference_face_distance)
 			return match_faces
 
 	return []
@@ -31,16 +37,29 @@ def select_faces(reference_vision_frame : VisionFrame, target_vision_frame : Vis
 
 def find_match_faces(reference_faces : List[Face], target_faces : List[Face], face_distance : float) -> List[Face]:
 	match_faces : List[Face] = []
+	reference_faces = [ reference_face for reference_face in reference_faces if reference_face ]
 
-	for reference_face in reference_faces:
-		if reference_face:
-			for index, target_face in enumerate(target_faces):
-				if compare_faces(target_face, reference_face, face_distance):
-					match_faces.append(target_faces[index])
+	if reference_faces and target_faces:
+		embedding_matrix = get_reference_matrix(reference_faces)
+		target_matrix = numpy.stack([ target_face.embedding_norm for target_face in target_faces ]).astype(numpy.float32)
+		match_mask = (1 - embedding_matrix @ target_matrix.T) / 2 < face_distance
+
+		for target_index in numpy.nonzero(match_mask)[1]:
+			match_faces.append(target_faces[target_index])
 
 	return match_faces
 
 
+def get_reference_matrix(reference_faces : List[Face]) -> Embeddings:
+	embedding_matrix = numpy.stack([ reference_face.embedding_norm for reference_face in reference_faces ]).astype(numpy.float32)
+	reference_hash = create_hash(embedding_matrix.tobytes())
+
+	if reference_hash not in REFERENCE_MATRIX_SET:
+		REFERENCE_MATRIX_SET.clear()
+		REFERENCE_MATRIX_SET[reference_hash] = embedding_matrix / numpy.linalg.norm(embedding_matrix, axis = 1, keepdims = True)
+	return REFERENCE_MATRIX_SET.get(reference_hash)
+
+
 def compare_faces(face : Face, reference_face : Face, face_distance : float) -> bool:
 	current_face_distance = calculate_face_distance(face, reference_face)
 	current_face_distance = float(numpy.interp(current_face_distance, [ 0, 2 ], [ 0, 1 ]))
@@ -55,14 +74,16 @@ def calculate_face_distance(face : Face, reference_face : Face) -> float:
 
 def sort_and_filter_faces(faces : List[Face]) -> List[Face]:
 	if faces:
-		if state_manager.get_item('face_selector_order'):
-			faces = sort_faces_by_order(faces, state_manager.get_item('face_selector_order'))
-		if state_manager.get_item('face_selector_gender'):
-			faces = filter_faces_by_gender(faces, state_manager.get_item('face_selector_gender'))
-		if state_manager.get_item('face_selector_race'):
-			faces = filter_faces_by_race(faces, state_manager.get_item('face_selector_race'))
-		if state_manager.get_item('face_selector_age_start') or state_manager.get_item('face_selector_age_end'):
-			faces = filter_faces_by_age(faces, state_manager.get_item('face_selector_age_start'), state_manager.get_item('face_selector_age_end'))
+		state_snapshot = state_manager.get_state_snapshot()
+
+		if state_snapshot.face_selector_order:
+			faces = sort_faces_by_order(faces, state_snapshot.face_selector_order)
+		if state_snapshot.face_selector_gender:
+			faces = filter_faces_by_gender(faces, state_snapshot.face_selector_gender)
+		if state_snapshot.face_selector_race:
+			faces = filter_faces_by_race(faces, state_snapshot.face_selector_race)
+		if state_snapshot.face_selector_age_start or state_snapshot.face_selector_age_end:
+			faces = filter_faces_by_age(faces, state_snapshot.face_selector_age_start, state_snapshot.face_selector_age_end)
 	return faces
 
 
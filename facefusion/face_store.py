@@ -1,12 +1,19 @@
+from collections import OrderedDict
+from threading import Lock
 from typing import List, Optional
 
+from facefusion import state_manager
 from facefusion.hash_helper import create_hash
 from facefusion.types import Face, FaceStore, VisionFrame
 
 FACE_STORE : FaceStore =\
 {
-	'static_faces': {}
+	'static_faces': OrderedDict(),
+	'pinned_faces': OrderedDict(),
+	'hit_count': 0,
+	'miss_count': 0
 }
+FACE_STORE_LOCK : Lock = Lock()
 
 
 def get_face_store() -> FaceStore:
@@ -14,15 +21,49 @@ def get_face_store() -> FaceStore:
 
 
 def get_static_faces(vision_frame : VisionFrame) -> Optional[List[Face]]:
-	vision_hash = create_hash(vision_frame.tobytes())
-	return FACE_STORE.get('static_faces').get(vision_hash)
+	vision_hash = create_vision_hash(vision_frame)
+
+	with FACE_STORE_LOCK:
+		for face_set in [ FACE_STORE.get('pinned_faces'), FACE_STORE.get('static_faces') ]:
+			if vision_hash in face_set:
+				face_set.move_to_end(vision_hash)
+				FACE_STORE['hit_count'] += 1
+				return face_set.get(vision_hash)
+
+		FACE_STORE['miss_count'] += 1
+	return None
 
 
 def set_static_faces(vision_frame : VisionFrame, faces : List[Face]) -> None:
-	vision_hash = create_hash(vision_frame.tobytes())
-	if vision_hash:
+	vision_hash = create_vision_hash(vision_frame)
+
+	with FACE_STORE_LOCK:
+		if vision_hash in FACE_STORE.get('pinned_faces'):
+			FACE_STORE['pinned_faces'][vision_hash] = faces
+			return
+
 		FACE_STORE['static_faces'][vision_hash] = faces
+		FACE_STORE['static_faces'].move_to_end(vision_hash)
+
+		while len(FACE_STORE.get('static_faces')) > (state_manager.get_item('face_store_capacity') or 1024):
+			FACE_STORE['static_faces'].popitem(last = False)
+
+
+def pin_static_faces(vision_frame : VisionFrame) -> None:
+	vision_hash = create_vision_hash(vision_frame)
+
+	with FACE_STORE_LOCK:
+		if vision_hash in FACE_STORE.get('static_faces'):
+			FACE_STORE['pinned_faces'][vision_hash] = FACE_STORE.get('static_faces').pop(vision_hash)
+
+
+def create_vision_hash(vision_frame : VisionFrame) -> str:
+	return create_hash(str(vision_frame.shape).encode() + vision_frame.tobytes())
 
 
 def clear_static_faces() -> None:
-	FACE_STORE['static_faces'].clear()
+	with FACE_STORE_LOCK:
+		FACE_STORE['static_faces'].clear()
+		FACE_STORE['pinned_faces'].clear()
+		FACE_STORE['hit_count'] = 0
+		FACE_STORE['miss_count'] = 0
@@ -0,0 +1,108 @@
+from typing import List, Optional
+
+import cv2
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_analyser import get_many_faces
+from facefusion.face_helper import convert_to_face_landmark_5, transform_points
+from facefusion.face_store import set_static_faces
+from facefusion.types import BoundingBox, Face, FaceLandmarkSet, FaceTracker, Mask, Matrix, Points, VisionFrame
+
+
+def create_face_tracker() -> FaceTracker:
+	return\
+	{
+		'track_frame': None,
+		'faces': [],
+		'frame_count': 0
+	}
+
+
+def track_faces(face_tracker : FaceTracker, vision_frame : VisionFrame) -> List[Face]:
+	track_frame = cv2.cvtColor(vision_frame, cv2.COLOR_BGR2GRAY)
+	faces = None
+
+	if is_track_frame(face_tracker, track_frame):
+		faces = propagate_faces(face_tracker.get('track_frame'), track_frame, face_tracker.get('faces'))
+	if faces is None:
+		faces = get_many_faces([ vision_frame ], state_manager.get_item('target_path'))
+		face_tracker['frame_count'] = 0
+
+	set_static_faces(vision_frame, faces)
+	face_tracker['track_frame'] = track_frame
+	face_tracker['faces'] = faces
+	face_tracker['frame_count'] += 1
+	return faces
+
+
+def is_track_frame(face_tracker : FaceTracker, track_frame : VisionFrame) -> bool:
+	previous_track_frame = face_tracker.get('track_frame')
+
+	if previous_track_frame is not None and previous_track_frame.shape == track_frame.shape and face_tracker.get('frame_count') < state_manager.get_item('face_detector_interval'):
+		return not detect_scene_cut(previous_track_frame, track_frame)
+	return False
+
+
+def detect_scene_cut(previous_track_frame : VisionFrame, track_frame : VisionFrame) -> bool:
+	previous_thumbnail_frame = cv2.resize(previous_track_frame, (64, 64), interpolation = cv2.INTER_AREA)
+	thumbnail_frame = cv2.resize(track_frame, (64, 64), interpolation = cv2.INTER_AREA)
+	return bool(numpy.mean(cv2.absdiff(previous_thumbnail_frame, thumbnail_frame)) > 32)
+
+
+def propagate_faces(previous_track_frame : VisionFrame, track_frame : VisionFrame, faces : List[Face]) -> Optional[List[Face]]:
+	tracked_faces = []
+
+	if faces:
+		previous_points = numpy.concatenate([ face.landmark_set.get('68') for face in faces ]).reshape(-1, 1, 2).astype(numpy.float32)
+		track_points, track_status, _ = cv2.calcOpticalFlowPyrLK(previous_track_frame, track_frame, previous_points, None, winSize = (21, 21), maxLevel = 3) #type:ignore[call-overload]
+		retrack_points, retrack_status, _ = cv2.calcOpticalFlowPyrLK(track_frame, previous_track_frame, track_points, None, winSize = (21, 21), maxLevel = 3) #type:ignore[call-overload]
+		track_errors = numpy.linalg.norm(previous_points - retrack_points, axis = 2).ravel()
+		track_mask = numpy.logical_and.reduce([ track_status.ravel() == 1, retrack_status.ravel() == 1, track_errors < 1.0 ])
+		previous_points = previous_points.reshape(len(faces), -1, 2)
+		track_points = track_points.reshape(len(faces), -1, 2)
+		track_mask = track_mask.reshape(len(faces), -1)
+
+		for index, face in enumerate(faces):
+			tracked_face = propagate_face(face, track_frame, previous_points[index], track_points[index], track_mask[index])
+
+			if tracked_face is None:
+				return None
+			tracked_faces.append(tracked_face)
+	return tracked_faces
+
+
+def propagate_face(face : Face, track_frame : VisionFrame, previous_points : Points, track_points : Points, track_mask : Mask) -> Optional[Face]:
+	track_frame_height, track_frame_width = track_frame.shape[:2]
+
+	if numpy.count_nonzero(track_mask) > track_mask.size // 2:
+		affine_matrix, _ = cv2.estimateAffinePartial2D(previous_points[track_mask], track_points[track_mask], method = cv2.LMEDS)
+
+		if affine_matrix is not None:
+			bounding_box = track_bounding_box(face.bounding_box, affine_matrix)
+			center_x, center_y = (bounding_box[:2] + bounding_box[2:]) / 2
+
+			if 0 < center_x < track_frame_width and 0 < center_y < track_frame_height:
+				face_landmark_68 = transform_points(face.landmark_set.get('68'), affine_matrix)
+				face_landmark_68[track_mask] = track_points[track_mask]
+				face_landmark_5_68 = transform_points(face.landmark_set.get('5/68'), affine_matrix)
+
+				if face.score_set.get('landmarker') > state_manager.get_item('face_landmarker_score'):
+					face_landmark_5_68 = convert_to_face_landmark_5(face_landmark_68)
+
+				face_landmark_set : FaceLandmarkSet =\
+				{
+					'5': transform_points(face.landmark_set.get('5'), affine_matrix),
+					'5/68': face_landmark_5_68,
+					'68': face_landmark_68,
+					'68/5': transform_points(face.landmark_set.get('68/5'), affine_matrix)
+				}
+				return face._replace(bounding_box = bounding_box, landmark_set = face_landmark_set)
+	return None
+
+
+def track_bounding_box(bounding_box : BoundingBox, affine_matrix : Matrix) -> BoundingBox:
+	scale = numpy.sqrt(numpy.abs(numpy.linalg.det(affine_matrix[:, :2])))
+	center_point = transform_points((bounding_box[:2] + bounding_box[2:]) / 2, affine_matrix).ravel()
+	half_size = (bounding_box[2:] - bounding_box[:2]) / 2 * scale
+	return numpy.concatenate([ center_point - half_size, center_point + half_size ])
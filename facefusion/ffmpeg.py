@@ -2,17 +2,19 @@ import io
 import os
 import subprocess
 import tempfile
+from fractions import Fraction
 from functools import partial
-from typing import List, Optional, cast
+from typing import Iterator, List, Optional, cast
 
+import numpy
 from tqdm import tqdm
 
 import facefusion.choices
 from facefusion import ffmpeg_builder, logger, process_manager, state_manager, wording
 from facefusion.filesystem import get_file_format, remove_file
 from facefusion.temp_helper import get_temp_file_path, get_temp_frames_pattern
-from facefusion.types import AudioBuffer, AudioEncoder, Commands, EncoderSet, Fps, Resolution, UpdateProgress, VideoEncoder, VideoFormat
-from facefusion.vision import detect_video_duration, detect_video_fps, pack_resolution, predict_video_frame_total
+from facefusion.types import AudioBuffer, AudioEncoder, Commands, EncoderSet, Fps, Resolution, UpdateProgress, VideoEncoder, VideoFormat, VisionFrame
+from facefusion.vision import count_trim_frame_total, detect_video_duration, detect_video_fps, pack_resolution, predict_video_frame_total, unpack_resolution
 
 
 def run_ffmpeg_with_progress(commands : Commands, update_progress : UpdateProgress) -> subprocess.Popen[bytes]:
@@ -169,6 +171,121 @@ def extract_frames(target_path : str, temp_video_resolution : Resolution, temp_v
         return process.returncode == 0
 
 
+def open_frame_reader(target_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> subprocess.Popen[bytes]:
+    commands = ffmpeg_builder.chain(
+        ffmpeg_builder.set_input(target_path),
+        ffmpeg_builder.set_media_resolution(pack_resolution(temp_video_resolution)),
+        ffmpeg_builder.select_frame_range(trim_frame_start, trim_frame_end, temp_video_fps),
+        ffmpeg_builder.prevent_frame_drop(),
+        ffmpeg_builder.capture_raw_video(),
+        ffmpeg_builder.cast_stream()
+    )
+    return open_ffmpeg(commands)
+
+
+def open_segment_reader(target_path : str, temp_video_resolution : Resolution, temp_video_fps : Fps, segment_frame_start : int, segment_frame_end : int) -> subprocess.Popen[bytes]:
+    target_video_fps = detect_video_fps(target_path)
+    commands = ffmpeg_builder.chain(
+        ffmpeg_builder.select_media_range(segment_frame_start, None, target_video_fps),
+        ffmpeg_builder.set_input(target_path),
+        ffmpeg_builder.set_media_resolution(pack_resolution(temp_video_resolution)),
+        ffmpeg_builder.select_frame_range(0, segment_frame_end - segment_frame_start, temp_video_fps),
+        ffmpeg_builder.prevent_frame_drop(),
+        ffmpeg_builder.capture_raw_video(),
+        ffmpeg_builder.cast_stream()
+    )
+    return open_ffmpeg(commands)
+
+
+def open_frame_writer(temp_video_path : str, temp_video_fps : Fps, temp_frame_resolution : Resolution, output_video_resolution : Resolution, output_video_fps : Fps) -> subprocess.Popen[bytes]:
+    output_video_encoder = state_manager.get_item('output_video_encoder')
+    output_video_quality = state_manager.get_item('output_video_quality')
+    output_video_preset = state_manager.get_item('output_video_preset')
+    temp_video_format = cast(VideoFormat, get_file_format(temp_video_path))
+
+    output_video_encoder = fix_video_encoder(temp_video_format, output_video_encoder)
+    commands = ffmpeg_builder.chain(
+        ffmpeg_builder.capture_raw_video(),
+        ffmpeg_builder.set_media_resolution(pack_resolution(temp_frame_resolution)),
+        ffmpeg_builder.set_input_fps(temp_video_fps),
+        ffmpeg_builder.set_input('-'),
+        ffmpeg_builder.set_media_resolution(pack_resolution(output_video_resolution)),
+        ffmpeg_builder.set_video_encoder(output_video_encoder),
+        ffmpeg_builder.set_video_quality(output_video_encoder, output_video_quality),
+        ffmpeg_builder.set_video_preset(output_video_encoder, output_video_preset),
+        ffmpeg_builder.set_video_fps(output_video_fps),
+        ffmpeg_builder.set_pixel_format(output_video_encoder),
+        ffmpeg_builder.force_output(temp_video_path)
+    )
+    return open_ffmpeg(commands)
+
+
+def read_stream_frame(process : subprocess.Popen[bytes], temp_video_resolution : Resolution) -> Optional[VisionFrame]:
+    temp_video_width, temp_video_height = unpack_resolution(pack_resolution(temp_video_resolution))
+    vision_frame = numpy.empty((temp_video_height, temp_video_width, 3), dtype = numpy.uint8)
+
+    if process.stdout.readinto(memoryview(vision_frame).cast('B')) == vision_frame.nbytes:
+        return vision_frame
+    return None
+
+
+def iterate_stream_frames(process : subprocess.Popen[bytes], temp_video_resolution : Resolution) -> Iterator[VisionFrame]:
+    vision_frame = read_stream_frame(process, temp_video_resolution)
+
+    while vision_frame is not None:
+        yield vision_frame
+        vision_frame = read_stream_frame(process, temp_video_resolution)
+
+
+def write_stream_frame(process : subprocess.Popen[bytes], vision_frame : VisionFrame) -> bool:
+    vision_frame = numpy.ascontiguousarray(vision_frame, dtype = numpy.uint8)
+
+    try:
+        process.stdin.write(memoryview(vision_frame).cast('B'))
+        return True
+    except (BrokenPipeError, OSError):
+        return False
+
+
+def close_stream(process : subprocess.Popen[bytes]) -> bool:
+    if process.stdin:
+        try:
+            process.stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+    if process.stdout:
+        process.stdout.close()
+    return process.wait() == 0
+
+
+def detect_video_keyframes(target_path : str) -> List[int]:
+    target_video_fps = detect_video_fps(target_path)
+    video_keyframes = []
+    time_base = None
+    start_pts = None
+    commands = ffmpeg_builder.chain(
+        ffmpeg_builder.skip_non_keyframes(),
+        ffmpeg_builder.set_input(target_path),
+        ffmpeg_builder.select_media_stream('0:v:0'),
+        ffmpeg_builder.prevent_frame_drop(),
+        ffmpeg_builder.capture_frame_checksums(),
+        ffmpeg_builder.cast_stream()
+    )
+    stdout_buffer, _ = open_ffmpeg(commands).communicate()
+
+    for line in stdout_buffer.decode().splitlines():
+        if line.startswith('#tb'):
+            time_base = Fraction(line.split(':')[-1].strip())
+        if time_base and not line.startswith('#'):
+            frame_pts = int(line.split(',')[2])
+
+            if start_pts is None:
+                start_pts = frame_pts
+            video_keyframes.append(round((frame_pts - start_pts) * time_base * target_video_fps))
+
+    return video_keyframes
+
+
 def copy_image(target_path : str, temp_image_resolution : Resolution) -> bool:
     temp_image_path = get_temp_file_path(target_path)
     commands = ffmpeg_builder.chain(
@@ -296,6 +413,51 @@ def merge_video(target_path : str, temp_video_fps : Fps, output_video_resolution
         return process.returncode == 0
 
 
+def merge_video_with_audio(target_path : str, audio_path : str, output_path : str, temp_video_fps : Fps, output_video_resolution : Resolution, output_video_fps : Fps, trim_frame_start : int, trim_frame_end : int) -> bool:
+    output_video_encoder = state_manager.get_item('output_video_encoder')
+    output_video_quality = state_manager.get_item('output_video_quality')
+    output_video_preset = state_manager.get_item('output_video_preset')
+    output_audio_encoder = state_manager.get_item('output_audio_encoder')
+    output_audio_quality = state_manager.get_item('output_audio_quality')
+    output_audio_volume = state_manager.get_item('output_audio_volume')
+    target_video_fps = detect_video_fps(target_path)
+    merge_frame_total = predict_video_frame_total(target_path, output_video_fps, trim_frame_start, trim_frame_end)
+    merge_video_duration = count_trim_frame_total(target_path, trim_frame_start, trim_frame_end) / target_video_fps
+    output_video_format = cast(VideoFormat, get_file_format(output_path))
+    temp_frames_pattern = get_temp_frames_pattern(target_path, '%08d')
+
+    output_video_encoder = fix_video_encoder(output_video_format, output_video_encoder)
+    output_audio_encoder = fix_audio_encoder(output_video_format, output_audio_encoder)
+    commands = ffmpeg_builder.chain(
+        ffmpeg_builder.set_input_fps(temp_video_fps),
+        ffmpeg_builder.set_input(temp_frames_pattern)
+    )
+
+    if audio_path == target_path:
+        commands.extend(ffmpeg_builder.select_media_range(trim_frame_start, trim_frame_end, target_video_fps))
+
+    commands.extend(ffmpeg_builder.chain(
+        ffmpeg_builder.set_input(audio_path),
+        ffmpeg_builder.set_media_resolution(pack_resolution(output_video_resolution)),
+        ffmpeg_builder.set_video_encoder(output_video_encoder),
+        ffmpeg_builder.set_video_quality(output_video_encoder, output_video_quality),
+        ffmpeg_builder.set_video_preset(output_video_encoder, output_video_preset),
+        ffmpeg_builder.set_video_fps(output_video_fps),
+        ffmpeg_builder.set_pixel_format(output_video_encoder),
+        ffmpeg_builder.set_audio_encoder(output_audio_encoder),
+        ffmpeg_builder.set_audio_quality(output_audio_encoder, output_audio_quality),
+        ffmpeg_builder.set_audio_volume(output_audio_volume),
+        ffmpeg_builder.select_media_stream('0:v:0'),
+        ffmpeg_builder.select_media_stream('1:a:0?'),
+        ffmpeg_builder.set_video_duration(merge_video_duration),
+        ffmpeg_builder.force_output(output_path)
+    ))
+
+    with tqdm(total = merge_frame_total, desc = wording.get('merging'), unit = 'frame', ascii = ' =', disable = state_manager.get_item('log_level') in [ 'warn', 'error' ]) as progress:
+        process = run_ffmpeg_with_progress(commands, partial(update_progress, progress))
+        return process.returncode == 0
+
+
 def concat_video(output_path : str, temp_output_paths : List[str]) -> bool:
     concat_video_path = tempfile.mktemp()
 
@@ -88,6 +88,14 @@ def prevent_frame_drop() -> Commands:
 	return [ '-vsync', '0' ]
 
 
+def skip_non_keyframes() -> Commands:
+	return [ '-skip_frame', 'nokey' ]
+
+
+def capture_frame_checksums() -> Commands:
+	return [ '-f', 'framecrc' ]
+
+
 def select_media_range(frame_start : int, frame_end : int, media_fps : Fps) -> Commands:
 	commands = []
 
@@ -212,6 +220,10 @@ def capture_video() -> Commands:
 	return [ '-f', 'rawvideo', '-pix_fmt', 'rgb24' ]
 
 
+def capture_raw_video() -> Commands:
+	return [ '-f', 'rawvideo', '-pix_fmt', 'bgr24' ]
+
+
 def ignore_video_stream() -> Commands:
 	return [ '-vn' ]
 
@@ -0,0 +1,118 @@
+import json
+import os
+from typing import Optional
+
+import numpy
+
+from facefusion.filesystem import create_directory, is_file, remove_file
+from facefusion.hash_helper import create_hash
+from facefusion.temp_helper import get_temp_directory_path, resolve_temp_frame_paths
+from facefusion.types import Args, FrameBitmap, FrameManifest
+
+
+def create_args_hash(args : Args) -> str:
+	return create_hash(json.dumps(args, sort_keys = True, default = str).encode())
+
+
+def get_frame_manifest_path(target_path : str) -> str:
+	return os.path.join(get_temp_directory_path(target_path), 'frame_manifest.json')
+
+
+def get_frame_bitmap_path(target_path : str) -> str:
+	return os.path.join(get_temp_directory_path(target_path), 'frame_manifest.bin')
+
+
+def get_partial_frame_path(temp_frame_path : str) -> str:
+	temp_directory_path, temp_frame_name = os.path.split(temp_frame_path)
+	return os.path.join(temp_directory_path, 'partial', temp_frame_name)
+
+
+def create_frame_manifest(target_path : str, args_hash : str, frame_total : int) -> bool:
+	frame_manifest : FrameManifest =\
+	{
+		'args_hash': args_hash,
+		'frame_total': frame_total
+	}
+	create_directory(os.path.join(get_temp_directory_path(target_path), 'partial'))
+
+	with open(get_frame_bitmap_path(target_path), 'wb') as frame_bitmap_file:
+		frame_bitmap_file.write(bytes((frame_total + 7) // 8))
+
+	with open(get_frame_manifest_path(target_path), 'w') as frame_manifest_file:
+		json.dump(frame_manifest, frame_manifest_file)
+
+	return is_file(get_frame_manifest_path(target_path))
+
+
+def read_frame_manifest(target_path : str) -> Optional[FrameManifest]:
+	frame_manifest_path = get_frame_manifest_path(target_path)
+
+	if is_file(frame_manifest_path) and is_file(get_frame_bitmap_path(target_path)):
+		with open(frame_manifest_path) as frame_manifest_file:
+			try:
+				return json.load(frame_manifest_file)
+			except json.JSONDecodeError:
+				return None
+	return None
+
+
+def validate_frame_manifest(target_path : str, args_hash : str) -> bool:
+	frame_manifest = read_frame_manifest(target_path)
+
+	if frame_manifest and frame_manifest.get('args_hash') == args_hash:
+		return len(resolve_temp_frame_paths(target_path)) == frame_manifest.get('frame_total')
+	return False
+
+
+def has_frame_manifest(target_path : str) -> bool:
+	frame_manifest = read_frame_manifest(target_path)
+
+	if frame_manifest:
+		return len(resolve_temp_frame_paths(target_path)) == frame_manifest.get('frame_total')
+	return False
+
+
+def read_frame_bitmap(target_path : str) -> FrameBitmap:
+	frame_manifest = read_frame_manifest(target_path)
+
+	if frame_manifest:
+		frame_bitmap = numpy.fromfile(get_frame_bitmap_path(target_path), dtype = numpy.uint8)
+		return numpy.unpackbits(frame_bitmap, bitorder = 'little')[:frame_manifest.get('frame_total')].astype(bool)
+	return numpy.zeros(0, dtype = bool)
+
+
+def mark_frame(target_path : str, frame_number : int) -> bool:
+	frame_bitmap_path = get_frame_bitmap_path(target_path)
+
+	if is_file(frame_bitmap_path):
+		with open(frame_bitmap_path, 'r+b') as frame_bitmap_file:
+			frame_bitmap_file.seek(frame_number // 8)
+			frame_byte = frame_bitmap_file.read(1)
+
+			if frame_byte:
+				frame_bitmap_file.seek(frame_number // 8)
+				frame_bitmap_file.write(bytes([ frame_byte[0] | 1 << frame_number % 8 ]))
+				return True
+	return False
+
+
+def commit_partial_frame(target_path : str, temp_frame_path : str, frame_number : int) -> bool:
+	partial_frame_path = get_partial_frame_path(temp_frame_path)
+
+	if is_file(partial_frame_path) and mark_frame(target_path, frame_number):
+		os.replace(partial_frame_path, temp_frame_path)
+		return is_file(temp_frame_path)
+	return False
+
+
+def restore_partial_frames(target_path : str) -> None:
+	frame_bitmap = read_frame_bitmap(target_path)
+
+	for frame_number, temp_frame_path in enumerate(resolve_temp_frame_paths(target_path)):
+		partial_frame_path = get_partial_frame_path(temp_frame_path)
+
+		if is_file(partial_frame_path):
+			if frame_number < len(frame_bitmap) and frame_bitmap[frame_number]:
+				os.replace(partial_frame_path, temp_frame_path)
+			else:
+				remove_file(partial_frame_path)
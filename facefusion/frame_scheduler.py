@@ -0,0 +1,196 @@
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextvars import Context, copy_context
+from multiprocessing.shared_memory import SharedMemory
+from multiprocessing.sharedctypes import SynchronizedArray
+from multiprocessing.util import Finalize
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Tuple
+
+import numpy
+
+from facefusion import inference_manager, logger, process_manager, state_manager
+from facefusion.app_context import bind_app_context
+from facefusion.types import ExecutionWorker, SharedFrame, State, VisionFrame
+
+SHARED_MEMORY_SET : Dict[str, SharedMemory] = {}
+
+
+def calculate_frame_window(execution_thread_count : int, execution_queue_count : int) -> int:
+	return max(1, execution_thread_count) * max(1, execution_queue_count)
+
+
+def schedule_frames(process_frame : Callable[..., Any], frame_arguments : Iterable[Tuple[Any, ...]], execution_thread_count : int, execution_queue_count : int, execution_worker : ExecutionWorker = 'thread') -> Iterator[Any]:
+	if execution_worker == 'process':
+		return schedule_frames_with_processes(process_frame, frame_arguments, execution_thread_count, execution_queue_count)
+	return schedule_frames_with_threads(process_frame, frame_arguments, execution_thread_count, execution_queue_count)
+
+
+def schedule_frames_with_threads(process_frame : Callable[..., Any], frame_arguments : Iterable[Tuple[Any, ...]], execution_thread_count : int, execution_queue_count : int) -> Iterator[Any]:
+	with ThreadPoolExecutor(max_workers = execution_thread_count) as executor:
+		frame_arguments_with_context = ((frame_argument, None) for frame_argument in frame_arguments)
+
+		for future, _ in schedule_futures(executor, process_frame_in_context, frame_arguments_with_context, calculate_frame_window(execution_thread_count, execution_queue_count), copy_context(), process_frame):
+			yield future.result()
+
+
+def schedule_frames_with_processes(process_frame : Callable[..., Any], frame_arguments : Iterable[Tuple[Any, ...]], execution_thread_count : int, execution_queue_count : int) -> Iterator[Any]:
+	shared_memories : List[SharedMemory] = []
+	idle_shared_memories : Deque[SharedMemory] = deque()
+	shared_frame_arguments = share_frame_arguments(frame_arguments, shared_memories, idle_shared_memories)
+	mp_context = multiprocessing.get_context('spawn')
+	worker_loads = mp_context.Array('i', len(state_manager.get_item('execution_device_ids') or [ '0' ]))
+
+	try:
+		with ProcessPoolExecutor(max_workers = execution_thread_count, mp_context = mp_context, initializer = init_frame_worker, initargs = (dict(state_manager.get_state()), worker_loads)) as executor:
+			for future, frame_memories in schedule_futures(executor, process_shared_frame, shared_frame_arguments, calculate_frame_window(execution_thread_count, execution_queue_count), process_frame):
+				yield resolve_shared_result(future.result(), frame_memories)
+				idle_shared_memories.extend(frame_memories)
+	finally:
+		for shared_memory in shared_memories:
+			shared_memory.close()
+			shared_memory.unlink()
+
+
+def prefetch_frames(frame_arguments : Iterable[Tuple[Any, ...]], prefetch_frame : Callable[[List[VisionFrame]], Any], frame_window : int) -> Iterator[Tuple[Any, ...]]:
+	window_arguments : List[Tuple[Any, ...]] = []
+
+	for frame_argument in frame_arguments:
+		window_arguments.append(frame_argument)
+
+		if len(window_arguments) >= frame_window:
+			yield from prefetch_window(window_arguments, prefetch_frame)
+			window_arguments = []
+
+	yield from prefetch_window(window_arguments, prefetch_frame)
+
+
+def prefetch_window(window_arguments : List[Tuple[Any, ...]], prefetch_frame : Callable[[List[VisionFrame]], Any]) -> List[Tuple[Any, ...]]:
+	vision_frames = [ argument for window_argument in window_arguments for argument in window_argument if isinstance(argument, numpy.ndarray) ]
+
+	if vision_frames and not process_manager.is_stopping():
+		prefetch_frame(vision_frames)
+	return window_arguments
+
+
+def schedule_futures(executor : Executor, process_frame : Callable[..., Any], frame_arguments : Iterable[Tuple[Any, ...]], frame_window : int, *process_arguments : Any) -> Iterator[Tuple[Future[Any], Any]]:
+	futures : Deque[Tuple[Future[Any], Any]] = deque()
+
+	try:
+		for frame_argument, frame_context in frame_arguments:
+			if process_manager.is_stopping():
+				return
+			futures.append((executor.submit(process_frame, *process_arguments, *frame_argument), frame_context))
+
+			if len(futures) >= frame_window:
+				yield futures.popleft()
+
+		while futures:
+			if process_manager.is_stopping():
+				return
+			yield futures.popleft()
+	finally:
+		for future, _ in futures:
+			future.cancel()
+
+
+def share_frame_arguments(frame_arguments : Iterable[Tuple[Any, ...]], shared_memories : List[SharedMemory], idle_shared_memories : Deque[SharedMemory]) -> Iterator[Tuple[Tuple[Any, ...], List[SharedMemory]]]:
+	for frame_argument in frame_arguments:
+		shared_frame_argument = []
+		frame_memories = []
+
+		for argument in frame_argument:
+			if isinstance(argument, numpy.ndarray):
+				shared_memory = acquire_shared_memory(shared_memories, idle_shared_memories, argument.nbytes)
+				numpy.ndarray(argument.shape, argument.dtype, shared_memory.buf)[:] = argument
+				shared_frame_argument.append(create_shared_frame(shared_memory, argument))
+				frame_memories.append(shared_memory)
+			else:
+				shared_frame_argument.append(argument)
+
+		yield tuple(shared_frame_argument), frame_memories
+
+
+def acquire_shared_memory(shared_memories : List[SharedMemory], idle_shared_memories : Deque[SharedMemory], size : int) -> SharedMemory:
+	for shared_memory in list(idle_shared_memories):
+		if shared_memory.size >= size:
+			idle_shared_memories.remove(shared_memory)
+			return shared_memory
+
+	shared_memory = SharedMemory(create = True, size = max(1, size))
+	shared_memories.append(shared_memory)
+	return shared_memory
+
+
+def create_shared_frame(shared_memory : SharedMemory, vision_frame : VisionFrame) -> SharedFrame:
+	return\
+	{
+		'name': shared_memory.name,
+		'shape': vision_frame.shape,
+		'dtype': vision_frame.dtype.str
+	}
+
+
+def resolve_shared_result(result : Any, frame_memories : List[SharedMemory]) -> Any:
+	if isinstance(result, dict) and result.keys() == { 'name', 'shape', 'dtype' }:
+		for shared_memory in frame_memories:
+			if shared_memory.name == result.get('name'):
+				return numpy.ndarray(result.get('shape'), result.get('dtype'), shared_memory.buf).copy()
+
+		shared_memory = SharedMemory(name = result.get('name'))
+		vision_frame = numpy.ndarray(result.get('shape'), result.get('dtype'), shared_memory.buf).copy()
+		shared_memory.close()
+		shared_memory.unlink()
+		return vision_frame
+	return result
+
+
+def process_frame_in_context(frame_context : Context, process_frame : Callable[..., Any], *frame_argument : Any) -> Any:
+	return frame_context.copy().run(process_frame, *frame_argument)
+
+
+def init_frame_worker(state : State, worker_loads : SynchronizedArray) -> None:
+	for key, value in state.items():
+		state_manager.init_item(key, value) #type:ignore[arg-type]
+	with worker_loads.get_lock():
+		worker_index = worker_loads[:].index(min(worker_loads[:]))
+		worker_loads[worker_index] += 1
+	inference_manager.assign_worker_execution_device(worker_index)
+	Finalize(None, release_frame_worker, args = (worker_loads, worker_index), exitpriority = 10)
+	bind_app_context('cli')
+	state_manager.bind_state_snapshot()
+	if state_manager.get_item('log_level'):
+		logger.init(state_manager.get_item('log_level'))
+	process_manager.start()
+
+
+def release_frame_worker(worker_loads : SynchronizedArray, worker_index : int) -> None:
+	with worker_loads.get_lock():
+		worker_loads[worker_index] -= 1
+
+
+def process_shared_frame(process_frame : Callable[..., Any], *shared_frame_argument : Any) -> Any:
+	frame_argument = []
+	shared_memory = None
+
+	for argument in shared_frame_argument:
+		if isinstance(argument, dict) and argument.keys() == { 'name', 'shape', 'dtype' }:
+			shared_memory = get_shared_memory(argument.get('name'))
+			frame_argument.append(numpy.ndarray(argument.get('shape'), argument.get('dtype'), shared_memory.buf))
+		else:
+			frame_argument.append(argument)
+
+	result = process_frame(*frame_argument)
+
+	if isinstance(result, numpy.ndarray):
+		if not shared_memory or shared_memory.size < result.nbytes:
+			shared_memory = SharedMemory(create = True, size = max(1, result.nbytes))
+		numpy.copyto(numpy.ndarray(result.shape, result.dtype, shared_memory.buf), result)
+		return create_shared_frame(shared_memory, result)
+	return result
+
+
+def get_shared_memory(name : str) -> SharedMemory:
+	if name not in SHARED_MEMORY_SET:
+		SHARED_MEMORY_SET[name] = SharedMemory(name = name)
+	return SHARED_MEMORY_SET.get(name)
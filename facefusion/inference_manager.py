@@ -1,23 +1,54 @@
 import importlib
-import random
-from time import sleep, time
-from typing import List
+import os
+from collections import OrderedDict
+from contextvars import ContextVar, Token
+from threading import Condition, Event, Lock, current_thread, local
+from time import perf_counter, sleep, time
+from typing import Any, Dict, List, Optional, Tuple
+from weakref import WeakKeyDictionary, finalize
 
-from onnxruntime import InferenceSession
+import numpy
+from numpy.typing import DTypeLike, NDArray
+import onnxruntime
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
 
 from facefusion import logger, process_manager, state_manager, wording
 from facefusion.app_context import detect_app_context
 from facefusion.execution import create_inference_session_providers
 from facefusion.exit_helper import fatal_exit
-from facefusion.filesystem import get_file_name, is_file
+from facefusion.filesystem import create_directory, get_file_name, get_file_size, is_file, remove_file, resolve_relative_path
+from facefusion.hash_helper import create_hash, get_hash_path
+from facefusion.thread_helper import session_semaphore
 from facefusion.time_helper import calculate_end_time
-from facefusion.types import DownloadSet, ExecutionProvider, InferencePool, InferencePoolSet
+from facefusion.types import AppContext, DownloadSet, ExecutionDeviceLoad, ExecutionProvider, InferenceBatch, InferenceBinding, InferenceFootprintSet, InferenceInputs, InferenceInputType, InferenceOutputs, InferencePool, InferencePoolSet, InferenceRequest, InferenceSessionProvider, Resolution
 
 INFERENCE_POOL_SET : InferencePoolSet =\
 {
 	'cli': {},
 	'ui': {}
 }
+INFERENCE_FOOTPRINT_SET : InferenceFootprintSet = OrderedDict()
+INFERENCE_POOL_LOCK : Lock = Lock()
+INFERENCE_LOAD_LOCK : Lock = Lock()
+EXECUTION_DEVICE : ContextVar[Optional[Tuple[str, float]]] = ContextVar('execution_device', default = None)
+EXECUTION_DEVICE_LOAD_SET : Dict[str, ExecutionDeviceLoad] = {}
+EXECUTION_DEVICE_LOCK : Lock = Lock()
+EXECUTION_DEVICE_WORKER = local()
+INFERENCE_BATCH_SET : WeakKeyDictionary[InferenceSession, Dict[str, InferenceBatch]] = WeakKeyDictionary()
+INFERENCE_BATCHABLE_SET : WeakKeyDictionary[InferenceSession, bool] = WeakKeyDictionary()
+INFERENCE_BATCH_LOCK : Lock = Lock()
+INFERENCE_ARENA = local()
+INFERENCE_CACHE_EXECUTION_PROVIDERS : List[ExecutionProvider] = [ 'cpu', 'cuda', 'directml', 'rocm' ]
+INFERENCE_INPUT_TYPE_SET : Dict[InferenceInputType, str] =\
+{
+	'tensor(bool)': 'bool',
+	'tensor(double)': 'float64',
+	'tensor(float)': 'float32',
+	'tensor(float16)': 'float16',
+	'tensor(int32)': 'int32',
+	'tensor(int64)': 'int64',
+	'tensor(uint8)': 'uint8'
+}
 
 
 def get_inference_pool(module_name : str, model_names : List[str], model_source_set : DownloadSet) -> InferencePool:
@@ -34,25 +65,168 @@ def get_inference_pool(module_name : str, model_names : List[str], model_source_
 			INFERENCE_POOL_SET['cli'][inference_context] = INFERENCE_POOL_SET.get('ui').get(inference_context)
 		if app_context == 'ui' and INFERENCE_POOL_SET.get('cli').get(inference_context):
 			INFERENCE_POOL_SET['ui'][inference_context] = INFERENCE_POOL_SET.get('cli').get(inference_context)
-		if not INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			INFERENCE_POOL_SET[app_context][inference_context] = create_inference_pool(model_source_set, execution_device_id, execution_providers)
+		if has_missing_inference_session(INFERENCE_POOL_SET.get(app_context).get(inference_context), model_source_set):
+			with INFERENCE_LOAD_LOCK:
+				create_inference_pool(app_context, inference_context, model_source_set, execution_device_id, execution_providers)
+
+	current_inference_context = get_inference_context(module_name, model_names, resolve_execution_device(execution_device_ids), execution_providers)
+	current_inference_pool = INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
+	touch_inference_pool(current_inference_context, current_inference_pool)
+	return current_inference_pool
+
+
+def resolve_execution_device(execution_device_ids : List[str]) -> str:
+	execution_device = EXECUTION_DEVICE.get()
+
+	if execution_device and execution_device[0] in execution_device_ids:
+		return execution_device[0]
+	return select_execution_device(execution_device_ids)
+
+
+def select_execution_device(execution_device_ids : List[str]) -> str:
+	execution_device_loads = [ get_execution_device_load(execution_device_id) for execution_device_id in execution_device_ids ]
+	execution_device_index = min(range(len(execution_device_ids)), key = [ (execution_device_load.get('requests'), execution_device_load.get('latency')) for execution_device_load in execution_device_loads ].__getitem__)
+	return execution_device_ids[execution_device_index]
+
+
+def select_worker_execution_device(execution_device_ids : List[str]) -> str:
+	execution_device_id = getattr(EXECUTION_DEVICE_WORKER, 'execution_device_id', None)
+
+	if execution_device_id not in execution_device_ids:
+		with EXECUTION_DEVICE_LOCK:
+			execution_device_workers = [ get_execution_device_load(execution_device_id).get('workers') for execution_device_id in execution_device_ids ]
+			execution_device_id = execution_device_ids[execution_device_workers.index(min(execution_device_workers))]
+			EXECUTION_DEVICE_LOAD_SET[execution_device_id]['workers'] += 1
+		EXECUTION_DEVICE_WORKER.execution_device_id = execution_device_id
+		finalize(current_thread(), release_worker_execution_device, execution_device_id)
+	return execution_device_id
+
+
+def release_worker_execution_device(execution_device_id : str) -> None:
+	with EXECUTION_DEVICE_LOCK:
+		get_execution_device_load(execution_device_id)['workers'] -= 1
+
+
+def assign_worker_execution_device(worker_index : int) -> None:
+	execution_device_ids = state_manager.get_item('execution_device_ids')
 
-	current_inference_context = get_inference_context(module_name, model_names, random.choice(execution_device_ids), execution_providers)
-	return INFERENCE_POOL_SET.get(app_context).get(current_inference_context)
+	if execution_device_ids:
+		EXECUTION_DEVICE_WORKER.execution_device_id = execution_device_ids[worker_index % len(execution_device_ids)]
 
 
-def create_inference_pool(model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferencePool:
-	inference_pool : InferencePool = {}
+def pin_execution_device() -> Token[Optional[Tuple[str, float]]]:
+	execution_device_ids = state_manager.get_item('execution_device_ids')
+
+	if state_manager.get_item('execution_device_pinning') == 'worker':
+		execution_device_id = select_worker_execution_device(execution_device_ids)
+	else:
+		execution_device_id = select_execution_device(execution_device_ids)
+
+	with EXECUTION_DEVICE_LOCK:
+		execution_device_load = get_execution_device_load(execution_device_id)
+
+		if not execution_device_load.get('requests'):
+			execution_device_load['busy_start'] = perf_counter()
+		execution_device_load['requests'] += 1
+	return EXECUTION_DEVICE.set((execution_device_id, perf_counter()))
+
+
+def unpin_execution_device(execution_device_token : Token[Optional[Tuple[str, float]]]) -> None:
+	execution_device_id, start_time = EXECUTION_DEVICE.get()
+	execution_time = perf_counter() - start_time
+	EXECUTION_DEVICE.reset(execution_device_token)
+
+	with EXECUTION_DEVICE_LOCK:
+		execution_device_load = get_execution_device_load(execution_device_id)
+		execution_device_load['requests'] -= 1
+		execution_device_load['latency'] = execution_time if not execution_device_load.get('frame_total') else execution_device_load.get('latency') * 0.9 + execution_time * 0.1
+		execution_device_load['frame_total'] += 1
+
+		if not execution_device_load.get('requests'):
+			execution_device_load['busy_time'] += perf_counter() - execution_device_load.get('busy_start')
+
+
+def get_execution_device_load(execution_device_id : str) -> ExecutionDeviceLoad:
+	if execution_device_id not in EXECUTION_DEVICE_LOAD_SET:
+		EXECUTION_DEVICE_LOAD_SET[execution_device_id] =\
+		{
+			'requests': 0,
+			'workers': 0,
+			'latency': 0.0,
+			'busy_time': 0.0,
+			'busy_start': 0.0,
+			'frame_total': 0
+		}
+	return EXECUTION_DEVICE_LOAD_SET.get(execution_device_id)
+
+
+def get_execution_device_loads() -> Dict[str, ExecutionDeviceLoad]:
+	with EXECUTION_DEVICE_LOCK:
+		return { execution_device_id : execution_device_load.copy() for execution_device_id, execution_device_load in EXECUTION_DEVICE_LOAD_SET.items() } #type:ignore[misc]
+
+
+def create_inference_pool(app_context : AppContext, inference_context : str, model_source_set : DownloadSet, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> None:
+	INFERENCE_POOL_SET[app_context].setdefault(inference_context, {})
 
 	for model_name in model_source_set.keys():
 		model_path = model_source_set.get(model_name).get('path')
-		if is_file(model_path):
-			inference_pool[model_name] = create_inference_session(model_path, execution_device_id, execution_providers)
 
-	return inference_pool
+		if model_name not in (INFERENCE_POOL_SET.get(app_context).get(inference_context) or {}) and is_file(model_path):
+			inference_session = create_inference_session(model_path, execution_device_id, execution_providers)
+
+			with INFERENCE_POOL_LOCK:
+				inference_pool = (INFERENCE_POOL_SET.get(app_context).get(inference_context) or {}).copy()
+				inference_pool[model_name] = inference_session
+				INFERENCE_POOL_SET[app_context][inference_context] = inference_pool
+				INFERENCE_FOOTPRINT_SET[(inference_context, model_name)] = get_file_size(model_path)
+				update_inference_pool(inference_context, inference_pool)
+				evict_inference_pools(inference_context)
+
+
+def has_missing_inference_session(inference_pool : InferencePool, model_source_set : DownloadSet) -> bool:
+	if inference_pool:
+		for model_name in model_source_set.keys():
+			if model_name not in inference_pool and is_file(model_source_set.get(model_name).get('path')):
+				return True
+		return False
+	return True
+
+
+def update_inference_pool(inference_context : str, inference_pool : InferencePool) -> None:
+	for app_context in INFERENCE_POOL_SET.keys():
+		if inference_context in INFERENCE_POOL_SET.get(app_context):
+			INFERENCE_POOL_SET[app_context][inference_context] = inference_pool
+
+
+def touch_inference_pool(inference_context : str, inference_pool : InferencePool) -> None:
+	if inference_pool and state_manager.get_state_snapshot().inference_memory_budget:
+		with INFERENCE_POOL_LOCK:
+			for model_name in inference_pool.keys():
+				try:
+					INFERENCE_FOOTPRINT_SET.move_to_end((inference_context, model_name))
+				except KeyError:
+					pass
+
+
+def evict_inference_pools(inference_context : str) -> None:
+	inference_memory_budget = (state_manager.get_item('inference_memory_budget') or 0) * 1024 ** 3
+
+	if inference_memory_budget:
+		for footprint_context, model_name in list(INFERENCE_FOOTPRINT_SET.keys()):
+			if sum(INFERENCE_FOOTPRINT_SET.values()) <= inference_memory_budget:
+				return
+
+			if footprint_context != inference_context:
+				inference_pool = INFERENCE_POOL_SET.get('cli').get(footprint_context) or INFERENCE_POOL_SET.get('ui').get(footprint_context) or {}
+				update_inference_pool(footprint_context, { key : value for key, value in inference_pool.items() if key != model_name })
+				del INFERENCE_FOOTPRINT_SET[(footprint_context, model_name)]
+				logger.debug(wording.get('unloading_model').format(model_name = model_name), __name__)
 
 
 def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
+	if state_manager.get_item('inference_memory_budget'):
+		return
+
 	execution_device_ids = state_manager.get_item('execution_device_ids')
 	execution_providers = resolve_execution_providers(module_name)
 	app_context = detect_app_context()
@@ -60,8 +234,13 @@ def clear_inference_pool(module_name : str, model_names : List[str]) -> None:
 	for execution_device_id in execution_device_ids:
 		inference_context = get_inference_context(module_name, model_names, execution_device_id, execution_providers)
 
-		if INFERENCE_POOL_SET.get(app_context).get(inference_context):
-			del INFERENCE_POOL_SET[app_context][inference_context]
+		with INFERENCE_POOL_LOCK:
+			if INFERENCE_POOL_SET.get(app_context).get(inference_context):
+				del INFERENCE_POOL_SET[app_context][inference_context]
+
+			for footprint_context, model_name in list(INFERENCE_FOOTPRINT_SET.keys()):
+				if footprint_context == inference_context:
+					del INFERENCE_FOOTPRINT_SET[(footprint_context, model_name)]
 
 
 def create_inference_session(model_path : str, execution_device_id : str, execution_providers : List[ExecutionProvider]) -> InferenceSession:
@@ -70,7 +249,7 @@ def create_inference_session(model_path : str, execution_device_id : str, execut
 
 	try:
 		inference_session_providers = create_inference_session_providers(execution_device_id, execution_providers)
-		inference_session = InferenceSession(model_path, providers = inference_session_providers)
+		inference_session = create_cached_inference_session(model_path, execution_providers, inference_session_providers)
 		logger.debug(wording.get('loading_model_succeeded').format(model_name = model_file_name, seconds = calculate_end_time(start_time)), __name__)
 		return inference_session
 
@@ -79,6 +258,86 @@ def create_inference_session(model_path : str, execution_device_id : str, execut
 		fatal_exit(1)
 
 
+def create_cached_inference_session(model_path : str, execution_providers : List[ExecutionProvider], inference_session_providers : List[InferenceSessionProvider]) -> InferenceSession:
+	if not all(execution_provider in INFERENCE_CACHE_EXECUTION_PROVIDERS for execution_provider in execution_providers):
+		return InferenceSession(model_path, providers = inference_session_providers)
+
+	optimized_model_path = get_optimized_model_path(model_path, execution_providers)
+	temp_model_path = optimized_model_path + '.tmp'
+
+	if is_file(optimized_model_path):
+		try:
+			session_options = SessionOptions()
+			session_options.graph_optimization_level = GraphOptimizationLevel.ORT_DISABLE_ALL
+			return InferenceSession(optimized_model_path, sess_options = session_options, providers = inference_session_providers)
+		except Exception:
+			remove_file(optimized_model_path)
+
+	try:
+		create_directory(os.path.dirname(optimized_model_path))
+		session_options = SessionOptions()
+		session_options.graph_optimization_level = GraphOptimizationLevel.ORT_ENABLE_ALL
+		session_options.optimized_model_filepath = temp_model_path
+		inference_session = InferenceSession(model_path, sess_options = session_options, providers = inference_session_providers)
+
+		if is_file(temp_model_path):
+			os.replace(temp_model_path, optimized_model_path)
+		return inference_session
+	except Exception:
+		remove_file(temp_model_path)
+		return InferenceSession(model_path, providers = inference_session_providers)
+
+
+def get_optimized_model_path(model_path : str, execution_providers : List[ExecutionProvider]) -> str:
+	hash_path = get_hash_path(model_path)
+	model_stat = os.stat(model_path)
+	model_hash = create_hash((str(model_stat.st_size) + str(model_stat.st_mtime_ns)).encode())
+
+	if is_file(hash_path):
+		with open(hash_path) as hash_file:
+			model_hash = hash_file.read().strip()
+
+	optimized_model_hash = create_hash('.'.join([ model_hash ] + list(execution_providers) + [ onnxruntime.__version__ ]).encode())
+	return os.path.join(resolve_relative_path('../.caches'), get_file_name(model_path) + '.' + optimized_model_hash + '.onnx')
+
+
+def warm_up_inference_pool(inference_pool : InferencePool, model_size : Optional[Resolution] = None) -> None:
+	for model_name, inference_session in inference_pool.items():
+		inference_inputs = create_warm_up_inputs(inference_session, model_size)
+
+		if inference_inputs:
+			try:
+				with session_semaphore(inference_session):
+					inference_session.run(None, inference_inputs)
+			except Exception as exception:
+				logger.warn(wording.get('warming_up_model_failed').format(model_name = model_name, error = exception), __name__)
+		else:
+			logger.debug(wording.get('warming_up_model_skipped').format(model_name = model_name), __name__)
+
+
+def create_warm_up_inputs(inference_session : InferenceSession, model_size : Optional[Resolution]) -> Optional[InferenceInputs]:
+	inference_inputs = {}
+
+	for session_input in inference_session.get_inputs():
+		input_shape = list(session_input.shape)
+
+		if len(input_shape) == 4 and model_size:
+			spatial_indices = [ 2, 3 ] if input_shape[1] in [ 1, 3 ] else [ 1, 2 ]
+
+			for spatial_index, spatial_size in zip(spatial_indices, model_size[::-1]):
+				if not isinstance(input_shape[spatial_index], int):
+					input_shape[spatial_index] = spatial_size
+
+		if input_shape and not isinstance(input_shape[0], int):
+			input_shape[0] = 1
+
+		if not all(isinstance(input_size, int) and input_size > 0 for input_size in input_shape):
+			return None
+		inference_inputs[session_input.name] = numpy.zeros(input_shape, dtype = INFERENCE_INPUT_TYPE_SET.get(session_input.type, 'float32'))
+
+	return inference_inputs
+
+
 def get_inference_context(module_name : str, model_names : List[str], execution_device_id : str, execution_providers : List[ExecutionProvider]) -> str:
 	inference_context = '.'.join([ module_name ] + model_names + [ execution_device_id ] + list(execution_providers))
 	return inference_context
@@ -90,3 +349,204 @@ def resolve_execution_providers(module_name : str) -> List[ExecutionProvider]:
 	if hasattr(module, 'resolve_execution_providers'):
 		return getattr(module, 'resolve_execution_providers')()
 	return state_manager.get_item('execution_providers')
+
+
+def run_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceOutputs:
+	execution_batch_size = state_manager.get_item('execution_batch_size') or 1
+
+	if execution_batch_size > 1 and is_batchable_inference(inference_session, inference_inputs):
+		return run_batch_inference(inference_session, inference_inputs, execution_batch_size)
+
+	with session_semaphore(inference_session):
+		return inference_session.run(None, inference_inputs)
+
+
+def run_bound_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceOutputs:
+	execution_batch_size = state_manager.get_item('execution_batch_size') or 1
+
+	if execution_batch_size > 1 and is_batchable_inference(inference_session, inference_inputs):
+		return run_batch_inference(inference_session, inference_inputs, execution_batch_size)
+
+	inference_binding = get_inference_binding(inference_session)
+
+	if inference_binding:
+		io_binding = inference_binding.get('io_binding')
+
+		for input_name, input_value in inference_inputs.items():
+			io_binding.bind_cpu_input(input_name, numpy.ascontiguousarray(input_value))
+
+		with session_semaphore(inference_session):
+			inference_session.run_with_iobinding(io_binding)
+		return [ inference_output.copy() for inference_output in inference_binding.get('outputs') ]
+
+	with session_semaphore(inference_session):
+		return inference_session.run(None, inference_inputs)
+
+
+def run_stacked_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceOutputs:
+	stack_total = len(next(iter(inference_inputs.values())))
+
+	if stack_total == 1 or is_batchable_inference(inference_session, inference_inputs):
+		return run_bound_inference(inference_session, inference_inputs)
+
+	stack_outputs = []
+
+	for stack_index in range(stack_total):
+		inference_outputs = run_bound_inference(inference_session, { input_name: input_value[stack_index:stack_index + 1] for input_name, input_value in inference_inputs.items() })
+		stack_outputs.append(inference_outputs)
+
+	return [ numpy.concatenate(inference_outputs) for inference_outputs in zip(*stack_outputs) ]
+
+
+def is_batchable_session(inference_session : InferenceSession) -> bool:
+	if inference_session not in INFERENCE_BATCHABLE_SET:
+		batch_dimensions = { session_input.shape[0] if session_input.shape else 0 for session_input in inference_session.get_inputs() }
+		batch_dimensions.update(session_output.shape[0] if session_output.shape else 0 for session_output in inference_session.get_outputs())
+		INFERENCE_BATCHABLE_SET[inference_session] = len(batch_dimensions) == 1 and not isinstance(batch_dimensions.pop(), int)
+	return INFERENCE_BATCHABLE_SET.get(inference_session)
+
+
+def get_inference_binding(inference_session : InferenceSession) -> Optional[InferenceBinding]:
+	if not hasattr(INFERENCE_ARENA, 'inference_bindings'):
+		INFERENCE_ARENA.inference_bindings = WeakKeyDictionary()
+
+	if inference_session not in INFERENCE_ARENA.inference_bindings:
+		INFERENCE_ARENA.inference_bindings[inference_session] = create_inference_binding(inference_session)
+	return INFERENCE_ARENA.inference_bindings.get(inference_session)
+
+
+def create_inference_binding(inference_session : InferenceSession) -> Optional[InferenceBinding]:
+	session_outputs = inference_session.get_outputs()
+
+	if all(session_output.shape and all(isinstance(output_dim, int) and output_dim > 0 for output_dim in session_output.shape) for session_output in session_outputs):
+		io_binding = inference_session.io_binding()
+		inference_outputs = []
+
+		for session_output in session_outputs:
+			output_buffer = numpy.empty(session_output.shape, dtype = INFERENCE_INPUT_TYPE_SET.get(session_output.type, 'float32'))
+			io_binding.bind_output(session_output.name, 'cpu', 0, output_buffer.dtype, output_buffer.shape, output_buffer.ctypes.data)
+			inference_outputs.append(output_buffer)
+
+		return\
+		{
+			'io_binding': io_binding,
+			'outputs': inference_outputs
+		}
+	return None
+
+
+def get_tensor_buffer(buffer_name : str, buffer_shape : Tuple[int, ...], buffer_dtype : DTypeLike) -> NDArray[Any]:
+	buffer_key = (buffer_name, buffer_shape, numpy.dtype(buffer_dtype).str)
+
+	if not hasattr(INFERENCE_ARENA, 'tensor_buffers'):
+		INFERENCE_ARENA.tensor_buffers = {}
+
+	if buffer_key not in INFERENCE_ARENA.tensor_buffers:
+		INFERENCE_ARENA.tensor_buffers[buffer_key] = numpy.empty(buffer_shape, dtype = buffer_dtype)
+	return INFERENCE_ARENA.tensor_buffers.get(buffer_key)
+
+
+def run_batch_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs, execution_batch_size : int) -> InferenceOutputs:
+	execution_batch_timeout = (state_manager.get_item('execution_batch_timeout') or 0) / 1000000
+	inference_batch = get_inference_batch(inference_session, inference_inputs)
+	inference_condition = inference_batch.get('condition')
+	inference_requests = inference_batch.get('requests')
+	inference_request : InferenceRequest =\
+	{
+		'inputs': inference_inputs,
+		'outputs': None,
+		'error': None,
+		'event': Event()
+	}
+	batch_requests = []
+
+	with inference_condition:
+		inference_requests.append(inference_request)
+		inference_condition.notify_all()
+
+		while has_inference_request(inference_requests, inference_request) and inference_requests[0] is not inference_request:
+			inference_condition.wait()
+
+		if has_inference_request(inference_requests, inference_request):
+			batch_end_time = time() + execution_batch_timeout
+
+			while len(inference_requests) < execution_batch_size and batch_end_time > time():
+				inference_condition.wait(batch_end_time - time())
+
+			batch_requests = inference_requests[:execution_batch_size]
+			del inference_requests[:execution_batch_size]
+			inference_condition.notify_all()
+
+	if batch_requests:
+		resolve_inference_requests(inference_session, batch_requests)
+
+	inference_request.get('event').wait()
+
+	if inference_request.get('error'):
+		raise inference_request.get('error')
+	return inference_request.get('outputs')
+
+
+def resolve_inference_requests(inference_session : InferenceSession, inference_requests : List[InferenceRequest]) -> None:
+	try:
+		if len(inference_requests) > 1 and INFERENCE_BATCHABLE_SET.get(inference_session):
+			batch_inputs = {}
+			batch_counts = [ len(next(iter(inference_request.get('inputs').values()))) for inference_request in inference_requests ]
+
+			for input_name in inference_requests[0].get('inputs').keys():
+				batch_inputs[input_name] = numpy.concatenate([ inference_request.get('inputs').get(input_name) for inference_request in inference_requests ])
+
+			try:
+				with session_semaphore(inference_session):
+					batch_outputs = inference_session.run(None, batch_inputs)
+			except Exception:
+				batch_outputs = []
+
+			if batch_outputs and all(len(batch_output) == sum(batch_counts) for batch_output in batch_outputs):
+				batch_indices = numpy.cumsum(batch_counts)[:-1]
+				split_outputs = [ numpy.split(batch_output, batch_indices) for batch_output in batch_outputs ]
+
+				for request_index, inference_request in enumerate(inference_requests):
+					inference_request['outputs'] = [ split_output[request_index] for split_output in split_outputs ]
+				return
+
+		for inference_request in inference_requests:
+			with session_semaphore(inference_session):
+				inference_request['outputs'] = inference_session.run(None, inference_request.get('inputs'))
+
+		if len(inference_requests) > 1:
+			INFERENCE_BATCHABLE_SET[inference_session] = False
+
+	except Exception as exception:
+		for inference_request in inference_requests:
+			inference_request['error'] = exception
+
+	finally:
+		for inference_request in inference_requests:
+			inference_request.get('event').set()
+
+
+def get_inference_batch(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> InferenceBatch:
+	inference_batch_key = '|'.join(input_name + ':' + str(input_value.shape[1:]) + ':' + input_value.dtype.str for input_name, input_value in sorted(inference_inputs.items()))
+
+	with INFERENCE_BATCH_LOCK:
+		inference_batch_set = INFERENCE_BATCH_SET.setdefault(inference_session, {})
+
+		if inference_batch_key not in inference_batch_set:
+			inference_batch_set[inference_batch_key] =\
+			{
+				'condition': Condition(),
+				'requests': []
+			}
+		return inference_batch_set.get(inference_batch_key)
+
+
+def has_inference_request(inference_requests : List[InferenceRequest], inference_request : InferenceRequest) -> bool:
+	return any(current_request is inference_request for current_request in inference_requests)
+
+
+def is_batchable_inference(inference_session : InferenceSession, inference_inputs : InferenceInputs) -> bool:
+	if is_batchable_session(inference_session) and inference_inputs:
+		batch_counts = { input_value.shape[0] if isinstance(input_value, numpy.ndarray) and input_value.ndim else 0 for input_value in inference_inputs.values() }
+		return len(batch_counts) == 1 and 0 not in batch_counts
+	return False
@@ -1,6 +1,7 @@
 import os
 
 from facefusion import logger
+from facefusion.app_context import bind_app_context, unbind_app_context
 from facefusion.jobs import job_helper, job_manager
 from facefusion.types import JobOutputSet, JobStep, ProcessStep
 
@@ -68,7 +69,14 @@ def run_step(job_id: str, step_index: int, step: JobStep, process_step: ProcessS
         logger.error('[BATCH DEBUG] Failed to set step status to started', __name__)
         return False
 
-    if not process_step(job_id, step_index, step_args):
+    app_context_token = bind_app_context('cli')
+
+    try:
+        is_step_processed = process_step(job_id, step_index, step_args)
+    finally:
+        unbind_app_context(app_context_token)
+
+    if not is_step_processed:
         logger.error('[BATCH DEBUG] Process step failed', __name__)
         job_manager.set_step_status(job_id, step_index, 'failed')
         return False
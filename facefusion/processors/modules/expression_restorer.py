@@ -19,7 +19,7 @@ from facefusion.processors import choices as processors_choices
 from facefusion.processors.live_portrait import create_rotation, limit_expression
 from facefusion.processors.types import ExpressionRestorerInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
+from facefusion.thread_helper import session_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
@@ -197,7 +197,7 @@ def restrict_expression_areas(temp_expression : LivePortraitExpression, target_e
 def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
 	feature_extractor = get_inference_pool().get('feature_extractor')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(feature_extractor):
 		feature_volume = feature_extractor.run(None,
 		{
 			'input': crop_vision_frame
@@ -209,7 +209,7 @@ def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeat
 def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
 	motion_extractor = get_inference_pool().get('motion_extractor')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(motion_extractor):
 		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
 		{
 			'input': crop_vision_frame
@@ -221,7 +221,7 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, target_motion_points : LivePortraitMotionPoints, temp_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
+	with session_semaphore(generator):
 		crop_vision_frame = generator.run(None,
 		{
 			'feature_volume': feature_volume,
@@ -19,7 +19,7 @@ from facefusion.processors import choices as processors_choices
 from facefusion.processors.live_portrait import create_rotation, limit_angle, limit_expression
 from facefusion.processors.types import FaceEditorInputs, LivePortraitExpression, LivePortraitFeatureVolume, LivePortraitMotionPoints, LivePortraitPitch, LivePortraitRoll, LivePortraitRotation, LivePortraitScale, LivePortraitTranslation, LivePortraitYaw
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore, thread_semaphore
+from facefusion.thread_helper import session_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, FaceLandmark68, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
@@ -234,7 +234,7 @@ def apply_edit(crop_vision_frame : VisionFrame, face_landmark_68 : FaceLandmark6
 def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeatureVolume:
 	feature_extractor = get_inference_pool().get('feature_extractor')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(feature_extractor):
 		feature_volume = feature_extractor.run(None,
 		{
 			'input': crop_vision_frame
@@ -246,7 +246,7 @@ def forward_extract_feature(crop_vision_frame : VisionFrame) -> LivePortraitFeat
 def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortraitPitch, LivePortraitYaw, LivePortraitRoll, LivePortraitScale, LivePortraitTranslation, LivePortraitExpression, LivePortraitMotionPoints]:
 	motion_extractor = get_inference_pool().get('motion_extractor')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(motion_extractor):
 		pitch, yaw, roll, scale, translation, expression, motion_points = motion_extractor.run(None,
 		{
 			'input': crop_vision_frame
@@ -258,7 +258,7 @@ def forward_extract_motion(crop_vision_frame : VisionFrame) -> Tuple[LivePortrai
 def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	eye_retargeter = get_inference_pool().get('eye_retargeter')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(eye_retargeter):
 		eye_motion_points = eye_retargeter.run(None,
 		{
 			'input': eye_motion_points
@@ -270,7 +270,7 @@ def forward_retarget_eye(eye_motion_points : LivePortraitMotionPoints) -> LivePo
 def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	lip_retargeter = get_inference_pool().get('lip_retargeter')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(lip_retargeter):
 		lip_motion_points = lip_retargeter.run(None,
 		{
 			'input': lip_motion_points
@@ -282,7 +282,7 @@ def forward_retarget_lip(lip_motion_points : LivePortraitMotionPoints) -> LivePo
 def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> LivePortraitMotionPoints:
 	stitcher = get_inference_pool().get('stitcher')
 
-	with thread_semaphore():
+	with session_semaphore(stitcher):
 		motion_points = stitcher.run(None,
 		{
 			'source': source_motion_points,
@@ -295,7 +295,7 @@ def forward_stitch_motion_points(source_motion_points : LivePortraitMotionPoints
 def forward_generate_frame(feature_volume : LivePortraitFeatureVolume, source_motion_points : LivePortraitMotionPoints, target_motion_points : LivePortraitMotionPoints) -> VisionFrame:
 	generator = get_inference_pool().get('generator')
 
-	with thread_semaphore():
+	with session_semaphore(generator):
 		crop_vision_frame = generator.run(None,
 		{
 			'feature_volume': feature_volume,
@@ -16,7 +16,6 @@ from facefusion.filesystem import in_directory, is_image, is_video, resolve_rela
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import FaceEnhancerInputs, FaceEnhancerWeight
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import thread_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import blend_frame, read_static_image, read_static_video_frame
 
@@ -285,21 +284,22 @@ def post_process() -> None:
 
 
 def enhance_face(target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
+	state_snapshot = state_manager.get_state_snapshot()
 	model_template = get_model_options().get('template')
 	model_size = get_model_options().get('size')
 	crop_vision_frame, affine_matrix = warp_face_by_face_landmark_5(temp_vision_frame, target_face.landmark_set.get('5/68'), model_template, model_size)
-	box_mask = create_box_mask(crop_vision_frame, state_manager.get_item('face_mask_blur'), (0, 0, 0, 0))
+	box_mask = create_box_mask(crop_vision_frame, state_snapshot.face_mask_blur, (0, 0, 0, 0))
 	crop_masks =\
 	[
 		box_mask
 	]
 
-	if 'occlusion' in state_manager.get_item('face_mask_types'):
+	if 'occlusion' in state_snapshot.face_mask_types:
 		occlusion_mask = create_occlusion_mask(crop_vision_frame)
 		crop_masks.append(occlusion_mask)
 
 	crop_vision_frame = prepare_crop_frame(crop_vision_frame)
-	face_enhancer_weight = numpy.array([ state_manager.get_item('face_enhancer_weight') ]).astype(numpy.double)
+	face_enhancer_weight = numpy.array([ state_snapshot.face_enhancer_weight ]).astype(numpy.double)
 	crop_vision_frame = forward(crop_vision_frame, face_enhancer_weight)
 	crop_vision_frame = normalize_crop_frame(crop_vision_frame)
 	crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
@@ -318,8 +318,7 @@ def forward(crop_vision_frame : VisionFrame, face_enhancer_weight : FaceEnhancer
 		if face_enhancer_input.name == 'weight':
 			face_enhancer_inputs[face_enhancer_input.name] = face_enhancer_weight
 
-	with thread_semaphore():
-		crop_vision_frame = face_enhancer.run(None, face_enhancer_inputs)[0][0]
+	crop_vision_frame = inference_manager.run_bound_inference(face_enhancer, face_enhancer_inputs)[0][0]
 
 	return crop_vision_frame
 
@@ -335,10 +334,11 @@ def has_weight_input() -> bool:
 
 
 def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
-	crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-	crop_vision_frame = (crop_vision_frame - 0.5) / 0.5
-	crop_vision_frame = numpy.expand_dims(crop_vision_frame.transpose(2, 0, 1), axis = 0).astype(numpy.float32)
-	return crop_vision_frame
+	crop_buffer = inference_manager.get_tensor_buffer('face_enhancer.input', (1, 3) + crop_vision_frame.shape[:2], numpy.float32)
+
+	numpy.multiply(crop_vision_frame[:, :, ::-1].transpose(2, 0, 1), 2 / 255.0, out = crop_buffer[0], casting = 'unsafe')
+	numpy.subtract(crop_buffer[0], 1, out = crop_buffer[0])
+	return crop_buffer
 
 
 def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
@@ -351,7 +351,7 @@ def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
 
 
 def blend_paste_frame(temp_vision_frame : VisionFrame, paste_vision_frame : VisionFrame) -> VisionFrame:
-	face_enhancer_blend = 1 - (state_manager.get_item('face_enhancer_blend') / 100)
+	face_enhancer_blend = 1 - (state_manager.get_state_snapshot().face_enhancer_blend / 100)
 	temp_vision_frame = blend_frame(temp_vision_frame, paste_vision_frame, 1 - face_enhancer_blend)
 	return temp_vision_frame
 
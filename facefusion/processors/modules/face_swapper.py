@@ -1,3 +1,4 @@
+import os
 from argparse import ArgumentParser
 from functools import lru_cache
 from typing import List, Optional, Tuple
@@ -12,20 +13,24 @@ from facefusion import config, content_analyser, face_classifier, face_detector,
 from facefusion.common_helper import get_first, is_macos
 from facefusion.download import conditional_download_hashes, conditional_download_sources, resolve_download_url
 from facefusion.execution import has_execution_provider
-from facefusion.face_analyser import get_average_face, get_many_faces, get_one_face, scale_face
+from facefusion.face_analyser import get_average_face, get_many_faces, scale_face
 from facefusion.face_helper import paste_back, warp_face_by_face_landmark_5
 from facefusion.face_masker import create_area_mask, create_box_mask, create_occlusion_mask, create_region_mask
 from facefusion.face_selector import select_faces, sort_faces_by_order
-from facefusion.filesystem import filter_image_paths, has_image, in_directory, is_image, is_video, resolve_relative_path, same_file_extension
+from facefusion.face_store import pin_static_faces
+from facefusion.filesystem import create_directory, filter_image_paths, get_file_name, has_image, in_directory, is_file, is_image, is_video, remove_file, resolve_relative_path, same_file_extension
+from facefusion.hash_helper import create_hash
 from facefusion.model_helper import get_static_model_initializer
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.pixel_boost import explode_pixel_boost, implode_pixel_boost
-from facefusion.processors.types import FaceSwapperInputs
+from facefusion.processors.types import FaceSwapperInputs, FaceSwapperSource, FaceSwapperSourceSet
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.thread_helper import session_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, Embedding, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_images, read_static_video_frame, unpack_resolution
 
+FACE_SWAPPER_SOURCE_SET : FaceSwapperSourceSet = {}
+
 
 @lru_cache()
 def create_static_model_set(download_scope : DownloadScope) -> ModelSet:
@@ -460,11 +465,7 @@ def pre_process(mode : ProcessMode) -> bool:
         logger.error(wording.get('choose_image_source') + wording.get('exclamation_mark'), __name__)
         return False
 
-    source_image_paths = filter_image_paths(state_manager.get_item('source_paths'))
-    source_frames = read_static_images(source_image_paths)
-    source_faces = get_many_faces(source_frames)
-
-    if not get_one_face(source_faces):
+    if load_face_swapper_source(filter_image_paths(state_manager.get_item('source_paths'))) is None:
         logger.error(wording.get('no_source_face_detected') + wording.get('exclamation_mark'), __name__)
         return False
 
@@ -484,6 +485,7 @@ def pre_process(mode : ProcessMode) -> bool:
 
 
 def post_process() -> None:
+    FACE_SWAPPER_SOURCE_SET.clear()
     read_static_image.cache_clear()
     read_static_video_frame.cache_clear()
     video_manager.clear_video_pool()
@@ -499,38 +501,39 @@ def post_process() -> None:
         face_recognizer.clear_inference_pool()
 
 
-def swap_face(source_face : Face, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
+def swap_face(face_swapper_source : FaceSwapperSource, target_face : Face, temp_vision_frame : VisionFrame) -> VisionFrame:
+    state_snapshot = state_manager.get_state_snapshot()
     model_template = get_model_options().get('template')
     model_size = get_model_options().get('size')
-    pixel_boost_size = unpack_resolution(state_manager.get_item('face_swapper_pixel_boost'))
+    pixel_boost_size = unpack_resolution(state_snapshot.face_swapper_pixel_boost)
     pixel_boost_total = pixel_boost_size[0] // model_size[0]
     crop_vision_frame, affine_matrix = warp_face_by_face_landmark_5(temp_vision_frame, target_face.landmark_set.get('5/68'), model_template, pixel_boost_size)
     temp_vision_frames = []
     crop_masks = []
 
-    if 'box' in state_manager.get_item('face_mask_types'):
-        box_mask = create_box_mask(crop_vision_frame, state_manager.get_item('face_mask_blur'), state_manager.get_item('face_mask_padding'))
+    if 'box' in state_snapshot.face_mask_types:
+        box_mask = create_box_mask(crop_vision_frame, state_snapshot.face_mask_blur, state_snapshot.face_mask_padding)
         crop_masks.append(box_mask)
 
-    if 'occlusion' in state_manager.get_item('face_mask_types'):
+    if 'occlusion' in state_snapshot.face_mask_types:
         occlusion_mask = create_occlusion_mask(crop_vision_frame)
         crop_masks.append(occlusion_mask)
 
     pixel_boost_vision_frames = implode_pixel_boost(crop_vision_frame, pixel_boost_total, model_size)
     for pixel_boost_vision_frame in pixel_boost_vision_frames:
         pixel_boost_vision_frame = prepare_crop_frame(pixel_boost_vision_frame)
-        pixel_boost_vision_frame = forward_swap_face(source_face, target_face, pixel_boost_vision_frame)
+        pixel_boost_vision_frame = forward_swap_face(face_swapper_source, target_face, pixel_boost_vision_frame)
         pixel_boost_vision_frame = normalize_crop_frame(pixel_boost_vision_frame)
         temp_vision_frames.append(pixel_boost_vision_frame)
     crop_vision_frame = explode_pixel_boost(temp_vision_frames, pixel_boost_total, model_size, pixel_boost_size)
 
-    if 'area' in state_manager.get_item('face_mask_types'):
+    if 'area' in state_snapshot.face_mask_types:
         face_landmark_68 = cv2.transform(target_face.landmark_set.get('68').reshape(1, -1, 2), affine_matrix).reshape(-1, 2)
-        area_mask = create_area_mask(crop_vision_frame, face_landmark_68, state_manager.get_item('face_mask_areas'))
+        area_mask = create_area_mask(crop_vision_frame, face_landmark_68, state_snapshot.face_mask_areas)
         crop_masks.append(area_mask)
 
-    if 'region' in state_manager.get_item('face_mask_types'):
-        region_mask = create_region_mask(crop_vision_frame, state_manager.get_item('face_mask_regions'))
+    if 'region' in state_snapshot.face_mask_types:
+        region_mask = create_region_mask(crop_vision_frame, state_snapshot.face_mask_regions)
         crop_masks.append(region_mask)
 
     crop_mask = numpy.minimum.reduce(crop_masks).clip(0, 1)
@@ -538,7 +541,7 @@ def swap_face(source_face : Face, target_face : Face, temp_vision_frame : Vision
     return paste_vision_frame
 
 
-def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame : VisionFrame) -> VisionFrame:
+def forward_swap_face(face_swapper_source : FaceSwapperSource, target_face : Face, crop_vision_frame : VisionFrame) -> VisionFrame:
     face_swapper = get_inference_pool().get('face_swapper')
     model_type = get_model_options().get('type')
     face_swapper_inputs = {}
@@ -570,16 +573,13 @@ def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame
     for face_swapper_input in face_swapper.get_inputs():
         if face_swapper_input.name == 'source':
             if model_type in [ 'blendswap', 'uniface' ]:
-                face_swapper_inputs[face_swapper_input.name] = prepare_source_frame(source_face)
+                face_swapper_inputs[face_swapper_input.name] = face_swapper_source
             else:
-                source_embedding = prepare_source_embedding(source_face)
-                source_embedding = balance_source_embedding(source_embedding, target_face.embedding)
-                face_swapper_inputs[face_swapper_input.name] = source_embedding
+                face_swapper_inputs[face_swapper_input.name] = balance_source_embedding(face_swapper_source, target_face.embedding)
         if face_swapper_input.name == 'target':
             face_swapper_inputs[face_swapper_input.name] = crop_vision_frame
 
-    with conditional_thread_semaphore():
-        face_swapper_outputs = face_swapper.run(None, face_swapper_inputs)
+    face_swapper_outputs = inference_manager.run_bound_inference(face_swapper, face_swapper_inputs)
 
     if not face_swapper_outputs:
         logger.error('face swapper inference returned no output.', __name__)
@@ -592,7 +592,7 @@ def forward_swap_face(source_face : Face, target_face : Face, crop_vision_frame
 def forward_convert_embedding(face_embedding : Embedding) -> Embedding:
     embedding_converter = get_inference_pool().get('embedding_converter')
 
-    with conditional_thread_semaphore():
+    with session_semaphore(embedding_converter):
         face_embedding = embedding_converter.run(None,
         {
             'input': face_embedding
@@ -645,7 +645,7 @@ def prepare_source_embedding(source_face : Face) -> Embedding:
 
 def balance_source_embedding(source_embedding : Embedding, target_embedding : Embedding) -> Embedding:
     model_type = get_model_options().get('type')
-    face_swapper_weight = state_manager.get_item('face_swapper_weight')
+    face_swapper_weight = state_manager.get_state_snapshot().face_swapper_weight
     face_swapper_weight = numpy.interp(face_swapper_weight, [ 0, 1 ], [ 0.35, -0.35 ]).astype(numpy.float32)
 
     if model_type in [ 'hififace', 'hyperswap', 'inswapper', 'simswap' ]:
@@ -665,14 +665,13 @@ def convert_source_embedding(source_embedding : Embedding) -> Tuple[Embedding, E
 
 
 def prepare_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
-    model_mean = get_model_options().get('mean')
-    model_standard_deviation = get_model_options().get('standard_deviation')
+    model_mean = numpy.array(get_model_options().get('mean'), dtype = numpy.float32).reshape(3, 1, 1)
+    model_standard_deviation = numpy.array(get_model_options().get('standard_deviation'), dtype = numpy.float32).reshape(3, 1, 1)
+    crop_buffer = inference_manager.get_tensor_buffer('face_swapper.target', (1, 3) + crop_vision_frame.shape[:2], numpy.float32)
 
-    crop_vision_frame = crop_vision_frame[:, :, ::-1] / 255.0
-    crop_vision_frame = (crop_vision_frame - model_mean) / model_standard_deviation
-    crop_vision_frame = crop_vision_frame.transpose(2, 0, 1)
-    crop_vision_frame = numpy.expand_dims(crop_vision_frame, axis = 0).astype(numpy.float32)
-    return crop_vision_frame
+    numpy.multiply(crop_vision_frame[:, :, ::-1].transpose(2, 0, 1), 1 / (model_standard_deviation * 255.0), out = crop_buffer[0], casting = 'unsafe')
+    numpy.subtract(crop_buffer[0], model_mean / model_standard_deviation, out = crop_buffer[0])
+    return crop_buffer
 
 
 def normalize_crop_frame(crop_vision_frame : VisionFrame) -> VisionFrame:
@@ -696,6 +695,7 @@ def extract_source_face(source_vision_frames : List[VisionFrame]) -> Optional[Fa
     if source_vision_frames:
         for source_vision_frame in source_vision_frames:
             temp_faces = get_many_faces([source_vision_frame])
+            pin_static_faces(source_vision_frame)
             temp_faces = sort_faces_by_order(temp_faces, 'large-small')
 
             if temp_faces:
@@ -704,17 +704,101 @@ def extract_source_face(source_vision_frames : List[VisionFrame]) -> Optional[Fa
     return get_average_face(source_faces)
 
 
+def get_face_swapper_source() -> Optional[FaceSwapperSource]:
+    if not FACE_SWAPPER_SOURCE_SET:
+        load_face_swapper_source(filter_image_paths(state_manager.get_item('source_paths')))
+    return get_first(list(FACE_SWAPPER_SOURCE_SET.values()))
+
+
+def load_face_swapper_source(source_image_paths : List[str]) -> Optional[FaceSwapperSource]:
+    source_key = create_source_key(source_image_paths)
+
+    if source_key not in FACE_SWAPPER_SOURCE_SET:
+        FACE_SWAPPER_SOURCE_SET.clear()
+        FACE_SWAPPER_SOURCE_SET[source_key] = resolve_face_swapper_source(source_image_paths, read_static_images(source_image_paths))
+    return FACE_SWAPPER_SOURCE_SET.get(source_key)
+
+
+def resolve_face_swapper_source(source_image_paths : List[str], source_vision_frames : List[VisionFrame]) -> Optional[FaceSwapperSource]:
+    source_cache_path = get_source_cache_path(source_image_paths)
+
+    if is_file(source_cache_path):
+        try:
+            return numpy.load(source_cache_path)
+        except (OSError, ValueError):
+            remove_file(source_cache_path)
+
+    source_face = extract_source_face(source_vision_frames)
+
+    if source_face:
+        face_swapper_source = prepare_face_swapper_source(source_face)
+        write_source_cache(source_cache_path, face_swapper_source)
+        return face_swapper_source
+    return None
+
+
+def prepare_face_swapper_source(source_face : Face) -> FaceSwapperSource:
+    model_type = get_model_options().get('type')
+
+    if model_type in [ 'blendswap', 'uniface' ]:
+        return prepare_source_frame(source_face)
+    return prepare_source_embedding(source_face)
+
+
+def create_source_key(source_image_paths : List[str]) -> str:
+    source_signatures = create_source_signatures()
+
+    for source_image_path in source_image_paths:
+        source_stat = os.stat(source_image_path)
+        source_signatures.extend([ source_image_path, str(source_stat.st_size), str(source_stat.st_mtime_ns) ])
+    return '.'.join(source_signatures)
+
+
+def create_source_signatures() -> List[str]:
+    face_recognizer_path = face_recognizer.get_model_options().get('sources').get('face_recognizer').get('path')
+    return\
+    [
+        get_model_name(),
+        get_file_name(face_recognizer_path),
+        state_manager.get_item('face_detector_model'),
+        state_manager.get_item('face_detector_size'),
+        str(state_manager.get_item('face_detector_score')),
+        str(state_manager.get_item('face_detector_angles')),
+        str(state_manager.get_item('face_detector_refine')),
+        state_manager.get_item('face_landmarker_model'),
+        str(state_manager.get_item('face_landmarker_score'))
+    ]
+
+
+def get_source_cache_path(source_image_paths : List[str]) -> str:
+    source_hashes = create_source_signatures()
+
+    for source_image_path in source_image_paths:
+        with open(source_image_path, 'rb') as source_image_file:
+            source_hashes.append(create_hash(source_image_file.read()))
+    return os.path.join(resolve_relative_path('../.caches'), get_model_name() + '.' + create_hash('.'.join(source_hashes).encode()) + '.npy')
+
+
+def write_source_cache(source_cache_path : str, face_swapper_source : FaceSwapperSource) -> bool:
+    temp_source_cache_path = source_cache_path + '.tmp'
+
+    if create_directory(os.path.dirname(source_cache_path)):
+        with open(temp_source_cache_path, 'wb') as source_cache_file:
+            numpy.save(source_cache_file, face_swapper_source)
+        os.replace(temp_source_cache_path, source_cache_path)
+    return is_file(source_cache_path)
+
+
 def process_frame(inputs : FaceSwapperInputs) -> VisionFrame:
     reference_vision_frame = inputs.get('reference_vision_frame')
-    source_vision_frames = inputs.get('source_vision_frames')
     target_vision_frame = inputs.get('target_vision_frame')
     temp_vision_frame = inputs.get('temp_vision_frame')
-    source_face = extract_source_face(source_vision_frames)
+    face_swapper_source = get_face_swapper_source()
     target_faces = select_faces(reference_vision_frame, target_vision_frame)
 
-    if source_face and target_faces:
+    if face_swapper_source is not None and target_faces:
         for target_face in target_faces:
             target_face = scale_face(target_face, target_vision_frame, temp_vision_frame)
-            temp_vision_frame = swap_face(source_face, target_face, temp_vision_frame)
+            temp_vision_frame = swap_face(face_swapper_source, target_face, temp_vision_frame)
 
     return temp_vision_frame
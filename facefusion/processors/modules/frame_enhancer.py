@@ -14,7 +14,7 @@ from facefusion.filesystem import in_directory, is_image, is_video, resolve_rela
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import FrameEnhancerInputs
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.thread_helper import session_semaphore
 from facefusion.types import ApplyStateItem, Args, DownloadScope, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import blend_frame, create_tile_frames, merge_tile_frames, read_static_image, read_static_video_frame
 
@@ -496,7 +496,7 @@ def enhance_frame(temp_vision_frame : VisionFrame) -> VisionFrame:
 def forward(tile_vision_frame : VisionFrame) -> VisionFrame:
 	frame_enhancer = get_inference_pool().get('frame_enhancer')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(frame_enhancer):
 		tile_vision_frame = frame_enhancer.run(None,
 		{
 			'input': tile_vision_frame
@@ -18,7 +18,7 @@ from facefusion.filesystem import has_audio, resolve_relative_path
 from facefusion.processors import choices as processors_choices
 from facefusion.processors.types import LipSyncerInputs, LipSyncerWeight
 from facefusion.program_helper import find_argument_group
-from facefusion.thread_helper import conditional_thread_semaphore
+from facefusion.thread_helper import session_semaphore
 from facefusion.types import ApplyStateItem, Args, AudioFrame, DownloadScope, Face, InferencePool, ModelOptions, ModelSet, ProcessMode, VisionFrame
 from facefusion.vision import read_static_image, read_static_video_frame
 
@@ -192,7 +192,7 @@ def sync_lip(target_face : Face, source_voice_frame : AudioFrame, temp_vision_fr
 def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFrame, lip_syncer_weight : LipSyncerWeight) -> VisionFrame:
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(lip_syncer):
 		crop_vision_frame = lip_syncer.run(None,
 		{
 			'source': temp_audio_frame,
@@ -206,7 +206,7 @@ def forward_edtalk(temp_audio_frame : AudioFrame, crop_vision_frame : VisionFram
 def forward_wav2lip(temp_audio_frame : AudioFrame, area_vision_frame : VisionFrame) -> VisionFrame:
 	lip_syncer = get_inference_pool().get('lip_syncer')
 
-	with conditional_thread_semaphore():
+	with session_semaphore(lip_syncer):
 		area_vision_frame = lip_syncer.run(None,
 		{
 			'source': temp_audio_frame,
@@ -1,4 +1,4 @@
-from typing import Any, Dict, List, Literal, TypeAlias, TypedDict
+from typing import Any, Dict, List, Literal, Optional, TypeAlias, TypedDict
 
 from numpy.typing import NDArray
 
@@ -83,6 +83,8 @@ LipSyncerInputs = TypedDict('LipSyncerInputs',
 AgeModifierDirection : TypeAlias = NDArray[Any]
 DeepSwapperMorph : TypeAlias = NDArray[Any]
 FaceEnhancerWeight : TypeAlias = NDArray[Any]
+FaceSwapperSource : TypeAlias = NDArray[Any]
+FaceSwapperSourceSet : TypeAlias = Dict[str, Optional[FaceSwapperSource]]
 FaceSwapperWeight : TypeAlias = float
 LipSyncerWeight : TypeAlias = NDArray[Any]
 LivePortraitPitch : TypeAlias = float
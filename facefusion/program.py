@@ -101,7 +101,9 @@ def create_face_detector_program() -> ArgumentParser:
     group_face_detector.add_argument('--face-detector-size', help = wording.get('help.face_detector_size'), default = config.get_str_value('face_detector', 'face_detector_size', get_last(face_detector_size_choices)), choices = face_detector_size_choices)
     group_face_detector.add_argument('--face-detector-angles', help = wording.get('help.face_detector_angles'), type = int, default = config.get_int_list('face_detector', 'face_detector_angles', '0'), choices = facefusion.choices.face_detector_angles, nargs = '+', metavar = 'FACE_DETECTOR_ANGLES')
     group_face_detector.add_argument('--face-detector-score', help = wording.get('help.face_detector_score'), type = float, default = config.get_float_value('face_detector', 'face_detector_score', '0.5'), choices = facefusion.choices.face_detector_score_range, metavar = create_float_metavar(facefusion.choices.face_detector_score_range))
-    job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score' ])
+    group_face_detector.add_argument('--face-detector-interval', help = wording.get('help.face_detector_interval'), type = int, default = config.get_int_value('face_detector', 'face_detector_interval', '0'), choices = facefusion.choices.face_detector_interval_range, metavar = create_int_metavar(facefusion.choices.face_detector_interval_range))
+    group_face_detector.add_argument('--face-detector-refine', help = wording.get('help.face_detector_refine'), action = 'store_true', default = config.get_bool_value('face_detector', 'face_detector_refine'))
+    job_store.register_step_keys([ 'face_detector_model', 'face_detector_angles', 'face_detector_size', 'face_detector_score', 'face_detector_interval', 'face_detector_refine' ])
     return program
 
 
@@ -158,8 +160,10 @@ def create_frame_extraction_program() -> ArgumentParser:
     group_frame_extraction.add_argument('--trim-frame-start', help = wording.get('help.trim_frame_start'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_start'))
     group_frame_extraction.add_argument('--trim-frame-end', help = wording.get('help.trim_frame_end'), type = int, default = facefusion.config.get_int_value('frame_extraction', 'trim_frame_end'))
     group_frame_extraction.add_argument('--temp-frame-format', help = wording.get('help.temp_frame_format'), default = config.get_str_value('frame_extraction', 'temp_frame_format', 'png'), choices = facefusion.choices.temp_frame_formats)
+    group_frame_extraction.add_argument('--video-pipeline', help = wording.get('help.video_pipeline'), default = config.get_str_value('frame_extraction', 'video_pipeline', 'temp_frames'), choices = facefusion.choices.video_pipelines)
     group_frame_extraction.add_argument('--keep-temp', help = wording.get('help.keep_temp'), action = 'store_true', default = config.get_bool_value('frame_extraction', 'keep_temp'))
-    job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'keep_temp' ])
+    group_frame_extraction.add_argument('--video-segment-count', help = wording.get('help.video_segment_count'), type = int, default = config.get_int_value('frame_extraction', 'video_segment_count', '4'), choices = facefusion.choices.video_segment_count_range, metavar = create_int_metavar(facefusion.choices.video_segment_count_range))
+    job_store.register_step_keys([ 'trim_frame_start', 'trim_frame_end', 'temp_frame_format', 'video_pipeline', 'video_segment_count', 'keep_temp' ])
     return program
 
 
@@ -234,7 +238,14 @@ def create_execution_program() -> ArgumentParser:
     group_execution.add_argument('--execution-device-ids', help = wording.get('help.execution_device_ids'), default = config.get_str_list('execution', 'execution_device_ids', '0'), nargs = '+', metavar = 'EXECUTION_DEVICE_IDS')
     group_execution.add_argument('--execution-providers', help = wording.get('help.execution_providers').format(choices = ', '.join(available_execution_providers)), default = config.get_str_list('execution', 'execution_providers', get_first(available_execution_providers)), choices = available_execution_providers, nargs = '+', metavar = 'EXECUTION_PROVIDERS')
     group_execution.add_argument('--execution-thread-count', help = wording.get('help.execution_thread_count'), type = int, default = config.get_int_value('execution', 'execution_thread_count', '4'), choices = facefusion.choices.execution_thread_count_range, metavar = create_int_metavar(facefusion.choices.execution_thread_count_range))
-    job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count' ])
+    group_execution.add_argument('--execution-queue-count', help = wording.get('help.execution_queue_count'), type = int, default = config.get_int_value('execution', 'execution_queue_count', '2'), choices = facefusion.choices.execution_queue_count_range, metavar = create_int_metavar(facefusion.choices.execution_queue_count_range))
+    group_execution.add_argument('--execution-worker', help = wording.get('help.execution_worker'), default = config.get_str_value('execution', 'execution_worker', 'thread'), choices = facefusion.choices.execution_workers)
+    group_execution.add_argument('--execution-device-pinning', help = wording.get('help.execution_device_pinning'), default = config.get_str_value('execution', 'execution_device_pinning', 'frame'), choices = facefusion.choices.execution_device_pinnings)
+    group_execution.add_argument('--execution-batch-size', help = wording.get('help.execution_batch_size'), type = int, default = config.get_int_value('execution', 'execution_batch_size', '1'), choices = facefusion.choices.execution_batch_size_range, metavar = create_int_metavar(facefusion.choices.execution_batch_size_range))
+    group_execution.add_argument('--execution-batch-timeout', help = wording.get('help.execution_batch_timeout'), type = int, default = config.get_int_value('execution', 'execution_batch_timeout', '1000'), choices = facefusion.choices.execution_batch_timeout_range, metavar = create_int_metavar(facefusion.choices.execution_batch_timeout_range))
+    group_execution.add_argument('--execution-concurrency-limit', help = wording.get('help.execution_concurrency_limit'), type = int, default = config.get_int_value('execution', 'execution_concurrency_limit', '0'), choices = facefusion.choices.execution_concurrency_limit_range, metavar = create_int_metavar(facefusion.choices.execution_concurrency_limit_range))
+    group_execution.add_argument('--execution-warm-up', help = wording.get('help.execution_warm_up'), action = 'store_true', default = config.get_bool_value('execution', 'execution_warm_up'))
+    job_store.register_job_keys([ 'execution_device_ids', 'execution_providers', 'execution_thread_count', 'execution_queue_count', 'execution_worker', 'execution_device_pinning', 'execution_batch_size', 'execution_batch_timeout', 'execution_concurrency_limit', 'execution_warm_up' ])
     return program
 
 
@@ -243,7 +254,9 @@ def create_memory_program() -> ArgumentParser:
     group_memory = program.add_argument_group('memory')
     group_memory.add_argument('--video-memory-strategy', help = wording.get('help.video_memory_strategy'), default = config.get_str_value('memory', 'video_memory_strategy', 'strict'), choices = facefusion.choices.video_memory_strategies)
     group_memory.add_argument('--system-memory-limit', help = wording.get('help.system_memory_limit'), type = int, default = config.get_int_value('memory', 'system_memory_limit', '0'), choices = facefusion.choices.system_memory_limit_range, metavar = create_int_metavar(facefusion.choices.system_memory_limit_range))
-    job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit' ])
+    group_memory.add_argument('--inference-memory-budget', help = wording.get('help.inference_memory_budget'), type = int, default = config.get_int_value('memory', 'inference_memory_budget', '0'), choices = facefusion.choices.inference_memory_budget_range, metavar = create_int_metavar(facefusion.choices.inference_memory_budget_range))
+    group_memory.add_argument('--face-store-capacity', help = wording.get('help.face_store_capacity'), type = int, default = config.get_int_value('memory', 'face_store_capacity', '1024'), choices = facefusion.choices.face_store_capacity_range, metavar = create_int_metavar(facefusion.choices.face_store_capacity_range))
+    job_store.register_job_keys([ 'video_memory_strategy', 'system_memory_limit', 'inference_memory_budget', 'face_store_capacity' ])
     return program
 
 
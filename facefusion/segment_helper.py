@@ -0,0 +1,25 @@
+from typing import List
+
+import numpy
+
+from facefusion.types import SegmentRange
+
+
+def calculate_segment_ranges(frame_start : int, frame_end : int, video_keyframes : List[int], segment_count : int) -> List[SegmentRange]:
+	segment_frames = [ frame_start ]
+	segment_keyframes = numpy.array([ video_keyframe for video_keyframe in video_keyframes if frame_start < video_keyframe < frame_end ], dtype = numpy.int64)
+
+	for segment_index in range(1, segment_count):
+		segment_frame = frame_start + (frame_end - frame_start) * segment_index // segment_count
+
+		if segment_keyframes.size:
+			candidate_keyframes = segment_keyframes[segment_keyframes > segment_frames[-1]]
+
+			if not candidate_keyframes.size:
+				break
+			segment_frame = int(candidate_keyframes[numpy.argmin(numpy.abs(candidate_keyframes - segment_frame))])
+		if segment_frames[-1] < segment_frame < frame_end:
+			segment_frames.append(segment_frame)
+
+	segment_frames.append(frame_end)
+	return list(zip(segment_frames[:-1], segment_frames[1:]))
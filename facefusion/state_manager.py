@@ -1,14 +1,19 @@
-from typing import Any, Union
+from collections import namedtuple
+from contextvars import ContextVar, Token
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type, Union
 
 from facefusion.app_context import detect_app_context
 from facefusion.processors.types import ProcessorState, ProcessorStateKey, ProcessorStateSet
-from facefusion.types import State, StateKey, StateSet
+from facefusion.types import AppContext, State, StateKey, StateSet, StateSnapshot
 
 STATE_SET : Union[StateSet, ProcessorStateSet] =\
 {
 	'cli': {}, #type:ignore[assignment]
 	'ui': {} #type:ignore[assignment]
 }
+STATE_SNAPSHOT : ContextVar[Optional[StateSnapshot]] = ContextVar('state_snapshot', default = None)
+STATE_SNAPSHOT_SET : Dict[AppContext, Tuple[Union[State, ProcessorState], StateSnapshot]] = {}
 
 
 def get_state() -> Union[State, ProcessorState]:
@@ -18,11 +23,13 @@ def get_state() -> Union[State, ProcessorState]:
 
 def sync_state() -> None:
 	STATE_SET['cli'] = STATE_SET.get('ui') #type:ignore[assignment]
+	STATE_SNAPSHOT_SET.clear()
 
 
 def init_item(key : Union[StateKey, ProcessorStateKey], value : Any) -> None:
 	STATE_SET['cli'][key] = value #type:ignore[literal-required]
 	STATE_SET['ui'][key] = value #type:ignore[literal-required]
+	refresh_state_snapshot()
 
 
 def get_item(key : Union[StateKey, ProcessorStateKey]) -> Any:
@@ -32,11 +39,60 @@ def get_item(key : Union[StateKey, ProcessorStateKey]) -> Any:
 def set_item(key : Union[StateKey, ProcessorStateKey], value : Any) -> None:
 	app_context = detect_app_context()
 	STATE_SET[app_context][key] = value #type:ignore[literal-required]
+	refresh_state_snapshot()
 
 
 def sync_item(key : Union[StateKey, ProcessorStateKey]) -> None:
 	STATE_SET['cli'][key] = STATE_SET.get('ui').get(key) #type:ignore[literal-required]
+	STATE_SNAPSHOT_SET.clear()
 
 
 def clear_item(key : Union[StateKey, ProcessorStateKey]) -> None:
 	set_item(key, None)
+
+
+def get_state_snapshot() -> StateSnapshot:
+	state_snapshot = STATE_SNAPSHOT.get()
+
+	if state_snapshot is None:
+		app_context = detect_app_context()
+		state = STATE_SET.get(app_context)
+		state_snapshot_entry = STATE_SNAPSHOT_SET.get(app_context)
+
+		if state_snapshot_entry and state_snapshot_entry[0] is state:
+			return state_snapshot_entry[1]
+		state_snapshot = create_state_snapshot_type(tuple(state.keys()))(**state)
+		STATE_SNAPSHOT_SET[app_context] = (state, state_snapshot)
+	return state_snapshot
+
+
+def create_state_snapshot() -> StateSnapshot:
+	state = get_state()
+	return create_state_snapshot_type(tuple(state.keys()))(**state)
+
+
+def refresh_state_snapshot() -> None:
+	STATE_SNAPSHOT_SET.clear()
+
+	if STATE_SNAPSHOT.get() is not None:
+		STATE_SNAPSHOT.set(create_state_snapshot())
+
+
+@lru_cache(maxsize = 16)
+def create_state_snapshot_type(keys : Tuple[str, ...]) -> Type[StateSnapshot]:
+	state_snapshot_type = namedtuple('StateSnapshot', keys) #type:ignore[misc]
+	return type('StateSnapshot', (state_snapshot_type,), { '__slots__': (), '__getattr__': get_missing_item })
+
+
+def get_missing_item(state_snapshot : StateSnapshot, key : str) -> Any:
+	if key.startswith('_'):
+		raise AttributeError(key)
+	return None
+
+
+def bind_state_snapshot() -> Token[Optional[StateSnapshot]]:
+	return STATE_SNAPSHOT.set(create_state_snapshot())
+
+
+def unbind_state_snapshot(state_snapshot_token : Token[Optional[StateSnapshot]]) -> None:
+	STATE_SNAPSHOT.reset(state_snapshot_token)
@@ -26,7 +26,7 @@ def multi_process_capture(camera_capture : cv2.VideoCapture, camera_fps : Fps) -
 
 			while camera_capture and camera_capture.isOpened():
 				_, capture_frame = camera_capture.read()
-                                if numpy.any(capture_frame):
+				if numpy.any(capture_frame):
 					future = executor.submit(process_stream_frame, capture_frame)
 					futures.append(future)
 
@@ -11,6 +11,12 @@ def get_temp_file_path(file_path : str) -> str:
     return os.path.join(temp_directory_path, 'temp' + temp_file_extension)
 
 
+def get_temp_segment_path(file_path : str, segment_index : int) -> str:
+    temp_directory_path = get_temp_directory_path(file_path)
+    temp_file_extension = get_file_extension(file_path)
+    return os.path.join(temp_directory_path, 'segment-' + str(segment_index).zfill(4) + temp_file_extension)
+
+
 def move_temp_file(file_path : str, move_path : str) -> bool:
     temp_file_path = get_temp_file_path(file_path)
     return move_file(temp_file_path, move_path)
@@ -1,24 +1,46 @@
 import threading
 from contextlib import nullcontext
-from typing import ContextManager, Union
+from typing import ContextManager, Dict, List, Union
+from weakref import WeakKeyDictionary
 
-from facefusion.common_helper import is_linux, is_windows
-from facefusion.execution import has_execution_provider
+from onnxruntime import InferenceSession
+
+import facefusion.choices
+from facefusion import state_manager
+from facefusion.types import ExecutionProvider
 
 THREAD_LOCK : threading.Lock = threading.Lock()
-THREAD_SEMAPHORE : threading.Semaphore = threading.Semaphore()
 NULL_CONTEXT : ContextManager[None] = nullcontext()
+SESSION_SEMAPHORE_SET : WeakKeyDictionary[InferenceSession, Union[threading.Semaphore, ContextManager[None]]] = WeakKeyDictionary()
+CAPTURE_SEMAPHORE_SET : Dict[str, threading.Semaphore] = {}
+SERIAL_EXECUTION_PROVIDERS : List[ExecutionProvider] = [ 'directml', 'migraphx', 'rocm' ]
 
 
 def thread_lock() -> threading.Lock:
 	return THREAD_LOCK
 
 
-def thread_semaphore() -> threading.Semaphore:
-	return THREAD_SEMAPHORE
+def session_semaphore(inference_session : InferenceSession) -> Union[threading.Semaphore, ContextManager[None]]:
+	with THREAD_LOCK:
+		if inference_session not in SESSION_SEMAPHORE_SET:
+			concurrency_limit = resolve_concurrency_limit(inference_session.get_providers())
+			SESSION_SEMAPHORE_SET[inference_session] = threading.Semaphore(concurrency_limit) if concurrency_limit else NULL_CONTEXT
+		return SESSION_SEMAPHORE_SET.get(inference_session)
+
+
+def capture_semaphore(video_path : str) -> threading.Semaphore:
+	with THREAD_LOCK:
+		if video_path not in CAPTURE_SEMAPHORE_SET:
+			CAPTURE_SEMAPHORE_SET[video_path] = threading.Semaphore()
+		return CAPTURE_SEMAPHORE_SET.get(video_path)
+
 
+def resolve_concurrency_limit(inference_session_providers : List[str]) -> int:
+	execution_concurrency_limit = state_manager.get_item('execution_concurrency_limit')
 
-def conditional_thread_semaphore() -> Union[threading.Semaphore, ContextManager[None]]:
-	if is_windows() and has_execution_provider('directml') or is_linux() and has_execution_provider('migraphx') or is_linux() and has_execution_provider('rocm'):
-		return THREAD_SEMAPHORE
-	return NULL_CONTEXT
+	if execution_concurrency_limit:
+		return execution_concurrency_limit
+	for execution_provider in SERIAL_EXECUTION_PROVIDERS:
+		if facefusion.choices.execution_provider_set.get(execution_provider) in inference_session_providers:
+			return 1
+	return 0
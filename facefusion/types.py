@@ -1,5 +1,6 @@
-from collections import namedtuple
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, TypeAlias, TypedDict
+from collections import OrderedDict, namedtuple
+from threading import Condition, Event
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, Optional, Tuple, TypeAlias, TypedDict
 
 import cv2
 import numpy
@@ -14,7 +15,11 @@ Detection : TypeAlias = NDArray[Any]
 Prediction : TypeAlias = NDArray[Any]
 
 BoundingBox : TypeAlias = NDArray[Any]
+BoundingBoxes : TypeAlias = NDArray[Any]
+Scores : TypeAlias = NDArray[Any]
 FaceLandmark5 : TypeAlias = NDArray[Any]
+FaceLandmarks5 : TypeAlias = NDArray[Any]
+FaceDetection : TypeAlias = Tuple[BoundingBoxes, Scores, FaceLandmarks5]
 FaceLandmark68 : TypeAlias = NDArray[Any]
 FaceLandmarkSet = TypedDict('FaceLandmarkSet',
 {
@@ -44,10 +49,14 @@ Face = namedtuple('Face',
 	'age',
 	'race'
 ])
-FaceSet : TypeAlias = Dict[str, List[Face]]
+Embeddings : TypeAlias = NDArray[Any]
+FaceSet : TypeAlias = 'OrderedDict[str, List[Face]]'
 FaceStore = TypedDict('FaceStore',
 {
-	'static_faces' : FaceSet
+	'static_faces' : FaceSet,
+	'pinned_faces' : FaceSet,
+	'hit_count' : int,
+	'miss_count' : int
 })
 
 VideoCaptureSet : TypeAlias = Dict[str, cv2.VideoCapture]
@@ -70,6 +79,12 @@ Distance : TypeAlias = NDArray[Any]
 Matrix : TypeAlias = NDArray[Any]
 Anchors : TypeAlias = NDArray[Any]
 Translation : TypeAlias = NDArray[Any]
+FaceTracker = TypedDict('FaceTracker',
+{
+	'track_frame' : Optional[VisionFrame],
+	'faces' : List[Face],
+	'frame_count' : int
+})
 
 AudioBuffer : TypeAlias = bytes
 Audio : TypeAlias = NDArray[Any]
@@ -86,6 +101,12 @@ Duration : TypeAlias = float
 Padding : TypeAlias = Tuple[int, int, int, int]
 Orientation = Literal['landscape', 'portrait']
 Resolution : TypeAlias = Tuple[int, int]
+VideoProbe = NamedTuple('VideoProbe',
+[
+	('fps', Fps),
+	('frame_total', int),
+	('resolution', Resolution)
+])
 
 ProcessState = Literal['checking', 'processing', 'stopping', 'pending']
 Args : TypeAlias = Dict[str, Any]
@@ -111,6 +132,7 @@ FaceDetectorModel = Literal['many', 'retinaface', 'scrfd', 'yolo_face', 'yunet']
 FaceLandmarkerModel = Literal['many', '2dfan4', 'peppa_wutz']
 FaceDetectorSet : TypeAlias = Dict[FaceDetectorModel, List[str]]
 FaceSelectorMode = Literal['many', 'one', 'reference']
+FaceAttribute = Literal['embedding', 'classification']
 FaceSelectorOrder = Literal['left-right', 'right-left', 'top-bottom', 'bottom-top', 'small-large', 'large-small', 'best-worst', 'worst-best']
 FaceOccluderModel = Literal['many', 'xseg_1', 'xseg_2', 'xseg_3']
 FaceParserModel = Literal['bisenet_resnet_18', 'bisenet_resnet_34']
@@ -126,6 +148,14 @@ AudioFormat = Literal['flac', 'm4a', 'mp3', 'ogg', 'opus', 'wav']
 ImageFormat = Literal['bmp', 'jpeg', 'png', 'tiff', 'webp']
 VideoFormat = Literal['avi', 'm4v', 'mkv', 'mov', 'mp4', 'webm', 'wmv']
 TempFrameFormat = Literal['bmp', 'jpeg', 'png', 'tiff']
+VideoPipeline = Literal['temp_frames', 'stream', 'segment']
+FrameBitmap : TypeAlias = NDArray[numpy.bool_]
+SegmentRange : TypeAlias = Tuple[int, int]
+FrameManifest = TypedDict('FrameManifest',
+{
+	'args_hash' : str,
+	'frame_total' : int
+})
 AudioTypeSet : TypeAlias = Dict[AudioFormat, str]
 ImageTypeSet : TypeAlias = Dict[ImageFormat, str]
 VideoTypeSet : TypeAlias = Dict[VideoFormat, str]
@@ -149,7 +179,8 @@ BenchmarkCycleSet = TypedDict('BenchmarkCycleSet',
 	'average_run' : float,
 	'fastest_run' : float,
 	'slowest_run' : float,
-	'relative_fps' : float
+	'relative_fps' : float,
+	'device_utilization' : str
 })
 
 WebcamMode = Literal['inline', 'udp', 'v4l2']
@@ -163,6 +194,23 @@ ExecutionProvider = Literal['cpu', 'coreml', 'cuda', 'directml', 'openvino', 'mi
 ExecutionProviderValue = Literal['CPUExecutionProvider', 'CoreMLExecutionProvider', 'CUDAExecutionProvider', 'DmlExecutionProvider', 'OpenVINOExecutionProvider', 'MIGraphXExecutionProvider', 'ROCMExecutionProvider', 'TensorrtExecutionProvider']
 ExecutionProviderSet : TypeAlias = Dict[ExecutionProvider, ExecutionProviderValue]
 InferenceSessionProvider : TypeAlias = Any
+ExecutionWorker = Literal['thread', 'process']
+ExecutionDevicePinning = Literal['frame', 'worker']
+ExecutionDeviceLoad = TypedDict('ExecutionDeviceLoad',
+{
+	'requests' : int,
+	'workers' : int,
+	'latency' : float,
+	'busy_time' : float,
+	'busy_start' : float,
+	'frame_total' : int
+})
+SharedFrame = TypedDict('SharedFrame',
+{
+	'name' : str,
+	'shape' : Tuple[int, ...],
+	'dtype' : str
+})
 ValueAndUnit = TypedDict('ValueAndUnit',
 {
 	'value' : int,
@@ -220,9 +268,31 @@ DownloadSet : TypeAlias = Dict[str, Download]
 
 VideoMemoryStrategy = Literal['strict', 'moderate', 'tolerant']
 AppContext = Literal['cli', 'ui']
+StateSnapshot : TypeAlias = Any
 
 InferencePool : TypeAlias = Dict[str, InferenceSession]
 InferencePoolSet : TypeAlias = Dict[AppContext, Dict[str, InferencePool]]
+InferenceFootprintSet : TypeAlias = 'OrderedDict[Tuple[str, str], int]'
+InferenceInputs : TypeAlias = Dict[str, NDArray[Any]]
+InferenceInputType : TypeAlias = str
+InferenceOutputs : TypeAlias = List[NDArray[Any]]
+InferenceRequest = TypedDict('InferenceRequest',
+{
+	'inputs' : InferenceInputs,
+	'outputs' : Optional[InferenceOutputs],
+	'error' : Optional[Exception],
+	'event' : Event
+})
+InferenceBinding = TypedDict('InferenceBinding',
+{
+	'io_binding' : Any,
+	'outputs' : InferenceOutputs
+})
+InferenceBatch = TypedDict('InferenceBatch',
+{
+	'condition' : Condition,
+	'requests' : List[InferenceRequest]
+})
 
 UiWorkflow = Literal['instant_runner', 'job_runner', 'job_manager']
 
@@ -270,6 +340,8 @@ StateKey = Literal\
 	'face_detector_size',
 	'face_detector_angles',
 	'face_detector_score',
+	'face_detector_interval',
+	'face_detector_refine',
 	'face_landmarker_model',
 	'face_landmarker_score',
 	'face_selector_mode',
@@ -292,6 +364,8 @@ StateKey = Literal\
 	'trim_frame_start',
 	'trim_frame_end',
 	'temp_frame_format',
+	'video_pipeline',
+	'video_segment_count',
 	'keep_temp',
 	'output_image_quality',
 	'output_image_scale',
@@ -310,8 +384,17 @@ StateKey = Literal\
 	'execution_device_ids',
 	'execution_providers',
 	'execution_thread_count',
+	'execution_queue_count',
+	'execution_worker',
+	'execution_device_pinning',
+	'execution_batch_size',
+	'execution_batch_timeout',
+	'execution_concurrency_limit',
+	'execution_warm_up',
 	'video_memory_strategy',
 	'system_memory_limit',
+	'inference_memory_budget',
+	'face_store_capacity',
 	'log_level',
 	'halt_on_error',
 	'job_id',
@@ -340,6 +423,8 @@ State = TypedDict('State',
 	'face_detector_size' : str,
 	'face_detector_angles' : List[Angle],
 	'face_detector_score' : Score,
+	'face_detector_interval' : int,
+	'face_detector_refine' : bool,
 	'face_landmarker_model' : FaceLandmarkerModel,
 	'face_landmarker_score' : Score,
 	'face_selector_mode' : FaceSelectorMode,
@@ -362,6 +447,8 @@ State = TypedDict('State',
 	'trim_frame_start' : int,
 	'trim_frame_end' : int,
 	'temp_frame_format' : TempFrameFormat,
+	'video_pipeline' : VideoPipeline,
+	'video_segment_count' : int,
 	'keep_temp' : bool,
 	'output_image_quality' : int,
 	'output_image_scale' : Scale,
@@ -380,8 +467,17 @@ State = TypedDict('State',
 	'execution_device_ids' : List[str],
 	'execution_providers' : List[ExecutionProvider],
 	'execution_thread_count' : int,
+	'execution_queue_count' : int,
+	'execution_worker' : ExecutionWorker,
+	'execution_device_pinning' : ExecutionDevicePinning,
+	'execution_batch_size' : int,
+	'execution_batch_timeout' : int,
+	'execution_concurrency_limit' : int,
+	'execution_warm_up' : bool,
 	'video_memory_strategy' : VideoMemoryStrategy,
 	'system_memory_limit' : int,
+	'inference_memory_budget' : int,
+	'face_store_capacity' : int,
 	'log_level' : LogLevel,
 	'halt_on_error' : bool,
 	'job_id' : str,
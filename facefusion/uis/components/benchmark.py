@@ -20,7 +20,8 @@ def render() -> None:
 			'average_run',
 			'fastest_run',
 			'slowest_run',
-			'relative_fps'
+			'relative_fps',
+			'device_utilization'
 		],
 		datatype =
 		[
@@ -29,7 +30,8 @@ def render() -> None:
 			'number',
 			'number',
 			'number',
-			'number'
+			'number',
+			'str'
 		],
 		show_label = False
 	)
@@ -1,4 +1,5 @@
 import math
+import os
 from functools import lru_cache
 from typing import List, Optional, Tuple
 
@@ -7,9 +8,9 @@ import numpy
 from cv2.typing import Size
 
 from facefusion.common_helper import is_windows
-from facefusion.filesystem import get_file_extension, is_image, is_video
-from facefusion.thread_helper import thread_semaphore
-from facefusion.types import Duration, Fps, Orientation, Resolution, Scale, VisionFrame
+from facefusion.filesystem import get_file_extension, get_file_format, is_image, is_video
+from facefusion.thread_helper import capture_semaphore
+from facefusion.types import Duration, Fps, Orientation, Resolution, Scale, VideoProbe, VisionFrame
 from facefusion.video_manager import get_video_capture
 
 
@@ -47,6 +48,31 @@ def write_image(image_path : str, vision_frame : VisionFrame) -> bool:
 	return False
 
 
+def write_image_with_quality(image_path : str, vision_frame : VisionFrame, image_quality : int) -> bool:
+	if image_path:
+		image_file_extension = get_file_extension(image_path)
+
+		try:
+			is_encoded, image_buffer = cv2.imencode(image_file_extension, vision_frame, create_image_params(image_path, image_quality))
+		except cv2.error:
+			return False
+
+		if is_encoded:
+			image_buffer.tofile(image_path)
+			return is_image(image_path)
+	return False
+
+
+def create_image_params(image_path : str, image_quality : int) -> List[int]:
+	image_format = get_file_format(image_path)
+
+	if image_format == 'jpeg':
+		return [ cv2.IMWRITE_JPEG_QUALITY, image_quality ]
+	if image_format == 'webp':
+		return [ cv2.IMWRITE_WEBP_QUALITY, max(1, image_quality) ]
+	return []
+
+
 def detect_image_resolution(image_path : str) -> Optional[Resolution]:
 	if is_image(image_path):
 		image = read_image(image_path)
@@ -77,7 +103,7 @@ def read_video_frame(video_path : str, frame_number : int = 0) -> Optional[Visio
 		if video_capture.isOpened():
 			frame_total = video_capture.get(cv2.CAP_PROP_FRAME_COUNT)
 
-			with thread_semaphore():
+			with capture_semaphore(video_path):
 				video_capture.set(cv2.CAP_PROP_POS_FRAMES, min(frame_total, frame_number - 1))
 				has_vision_frame, vision_frame = video_capture.read()
 
@@ -87,15 +113,34 @@ def read_video_frame(video_path : str, frame_number : int = 0) -> Optional[Visio
 	return None
 
 
-def count_video_frame_total(video_path : str) -> int:
+def probe_video(video_path : str) -> Optional[VideoProbe]:
 	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
+		video_stat = os.stat(video_path)
+		return probe_video_file(video_path, video_stat.st_size, video_stat.st_mtime_ns)
+	return None
 
-		if video_capture.isOpened():
-			with thread_semaphore():
-				video_frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT))
-				return video_frame_total
 
+@lru_cache(maxsize = 128)
+def probe_video_file(video_path : str, video_size : int, video_mtime : int) -> Optional[VideoProbe]:
+	video_capture = cv2.VideoCapture(video_path)
+	video_probe = None
+
+	if video_capture.isOpened():
+		video_probe = VideoProbe(
+			fps = video_capture.get(cv2.CAP_PROP_FPS),
+			frame_total = int(video_capture.get(cv2.CAP_PROP_FRAME_COUNT)),
+			resolution = (int(video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)), int(video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)))
+		)
+
+	video_capture.release()
+	return video_probe
+
+
+def count_video_frame_total(video_path : str) -> int:
+	video_probe = probe_video(video_path)
+
+	if video_probe:
+		return video_probe.frame_total
 	return 0
 
 
@@ -108,14 +153,10 @@ def predict_video_frame_total(video_path : str, fps : Fps, trim_frame_start : in
 
 
 def detect_video_fps(video_path : str) -> Optional[float]:
-	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
-
-		if video_capture.isOpened():
-			with thread_semaphore():
-				video_fps = video_capture.get(cv2.CAP_PROP_FPS)
-				return video_fps
+	video_probe = probe_video(video_path)
 
+	if video_probe:
+		return video_probe.fps
 	return None
 
 
@@ -161,15 +202,10 @@ def restrict_trim_frame(video_path : str, trim_frame_start : Optional[int], trim
 
 
 def detect_video_resolution(video_path : str) -> Optional[Resolution]:
-	if is_video(video_path):
-		video_capture = get_video_capture(video_path)
-
-		if video_capture.isOpened():
-			with thread_semaphore():
-				width = video_capture.get(cv2.CAP_PROP_FRAME_WIDTH)
-				height = video_capture.get(cv2.CAP_PROP_FRAME_HEIGHT)
-				return int(width), int(height)
+	video_probe = probe_video(video_path)
 
+	if video_probe:
+		return video_probe.resolution
 	return None
 
 
@@ -207,6 +243,17 @@ def unpack_resolution(resolution : str) -> Resolution:
 	return width, height
 
 
+def resize_frame(vision_frame : VisionFrame, resolution : Resolution) -> VisionFrame:
+	height, width = vision_frame.shape[:2]
+	resize_width, resize_height = resolution
+
+	if width != resize_width or height != resize_height:
+		if resize_width < width or resize_height < height:
+			return cv2.resize(vision_frame, (resize_width, resize_height), interpolation = cv2.INTER_AREA)
+		return cv2.resize(vision_frame, (resize_width, resize_height), interpolation = cv2.INTER_CUBIC)
+	return vision_frame
+
+
 def detect_frame_orientation(vision_frame : VisionFrame) -> Orientation:
 	height, width = vision_frame.shape[:2]
 
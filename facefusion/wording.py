@@ -8,8 +8,18 @@ WORDING : Dict[str, Any] =\
 	'ffmpeg_not_installed': 'FFMpeg is not installed',
 	'creating_temp': 'Creating temporary resources',
 	'extracting_frames': 'Extracting frames with a resolution of {resolution} and {fps} frames per second',
+	'processing_segments': 'Processing {segment_total} segments with a resolution of {resolution} and {fps} frames per second',
+	'processing_segments_succeeded': 'Processing segments succeeded',
+	'processing_segments_failed': 'Processing segments failed',
+	'resuming_frames': 'Resuming processing from the frame manifest',
+	'processing_frames_succeeded': 'Processing frames succeeded',
+	'processing_frames_failed': 'Processing frames failed',
+	'writing_frame_failed': 'Writing frame {frame_number} failed',
 	'extracting_frames_succeeded': 'Extracting frames succeeded',
 	'extracting_frames_failed': 'Extracting frames failed',
+	'streaming_frames': 'Streaming frames with a resolution of {resolution} and {fps} frames per second',
+	'streaming_frames_succeeded': 'Streaming frames succeeded',
+	'streaming_frames_failed': 'Streaming frames failed',
 	'analysing': 'Analysing',
 	'extracting': 'Extracting',
 	'streaming': 'Streaming',
@@ -84,6 +94,9 @@ WORDING : Dict[str, Any] =\
 	'deleting_corrupt_source': 'Deleting corrupt source for {source_file_name}',
 	'loading_model_succeeded': 'Loading model {model_name} succeeded in {seconds} seconds',
 	'loading_model_failed': 'Loading model {model_name} failed',
+	'unloading_model': 'Unloading model {model_name} to stay within the memory budget',
+	'warming_up_model_failed': 'Warming up model {model_name} failed: {error}',
+	'warming_up_model_skipped': 'Warming up model {model_name} skipped due to unresolved input shapes',
 	'time_ago_now': 'just now',
 	'time_ago_minutes': '{minutes} minutes ago',
 	'time_ago_hours': '{hours} hours and {minutes} minutes ago',
@@ -114,6 +127,8 @@ WORDING : Dict[str, Any] =\
 		'face_detector_size': 'specify the frame size provided to the face detector',
 		'face_detector_angles': 'specify the angles to rotate the frame before detecting faces',
 		'face_detector_score': 'filter the detected faces based on the confidence score',
+		'face_detector_interval': 'detect the faces every n frames of a video and track them in between (0 = detect every frame)',
+		'face_detector_refine': 'detect the faces of high resolution frames again at native resolution around the candidate regions',
 		# face landmarker
 		'face_landmarker_model': 'choose the model responsible for detecting the face landmarks',
 		'face_landmarker_score': 'filter the detected face landmarks based on the confidence score',
@@ -141,6 +156,8 @@ WORDING : Dict[str, Any] =\
 		'trim_frame_start': 'specify the starting frame of the target video',
 		'trim_frame_end': 'specify the ending frame of the target video',
 		'temp_frame_format': 'specify the temporary resources format',
+		'video_pipeline': 'choose between temporary frames on disk, streaming frames through pipes and processing segments in parallel',
+		'video_segment_count': 'specify the amount of segments the video is split into for the segment pipeline',
 		'keep_temp': 'keep the temporary resources after processing',
 		# output creation
 		'output_image_quality': 'specify the image quality which translates to the image compression',
@@ -206,9 +223,18 @@ WORDING : Dict[str, Any] =\
 		'execution_device_ids': 'specify the devices used for processing',
 		'execution_providers': 'inference using different providers (choices: {choices}, ...)',
 		'execution_thread_count': 'specify the amount of parallel threads while processing',
+		'execution_queue_count': 'specify the amount of frames each thread keeps in flight while processing',
+		'execution_worker': 'choose between threads and processes to run the frame workers',
+		'execution_device_pinning': 'keep each frame or each worker on one of the least loaded devices',
+		'execution_batch_size': 'specify the maximum amount of concurrent inferences merged into one batch',
+		'execution_batch_timeout': 'specify the microseconds to wait for concurrent inferences before running a batch',
+		'execution_concurrency_limit': 'specify the maximum amount of concurrent runs per model (0 = unlimited unless the provider requires serial runs)',
+		'execution_warm_up': 'run a synthetic inference per model before processing',
 		# memory
 		'video_memory_strategy': 'balance fast processing and low VRAM usage',
 		'system_memory_limit': 'limit the available RAM that can be used while processing',
+		'inference_memory_budget': 'keep loaded models within the memory budget in GB and unload the least recently used first (0 = disabled)',
+		'face_store_capacity': 'limit the amount of frames whose analysed faces are kept in memory',
 		# misc
 		'log_level': 'adjust the message severity displayed in the terminal',
 		'halt_on_error': 'halt the program once an error occurred',
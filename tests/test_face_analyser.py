@@ -1,10 +1,13 @@
 import subprocess
+from unittest.mock import patch
 
+import numpy
 import pytest
 
 from facefusion import face_classifier, face_detector, face_landmarker, face_recognizer, state_manager
 from facefusion.download import conditional_download
-from facefusion.face_analyser import get_many_faces
+from facefusion.face_analyser import detect_faces_by_angles, get_many_faces, resolve_face_attributes
+from facefusion.face_detector import FACE_DETECTOR_ANGLE_SET, merge_detections
 from facefusion.vision import read_static_image
 from .helper import get_test_example_file, get_test_examples_directory
 
@@ -125,3 +128,50 @@ def test_get_many_faces() -> None:
 	many_faces = get_many_faces([ source_frame, source_frame, source_frame ])
 
 	assert len(many_faces) == 3
+
+
+def test_resolve_face_attributes() -> None:
+	state_manager.init_item('processors', [ 'face_enhancer' ])
+	state_manager.init_item('face_selector_mode', 'many')
+	state_manager.init_item('face_selector_gender', None)
+	state_manager.init_item('face_selector_race', None)
+	state_manager.init_item('face_selector_age_start', None)
+	state_manager.init_item('face_selector_age_end', None)
+
+	assert resolve_face_attributes() == []
+
+	state_manager.init_item('processors', [ 'face_swapper' ])
+	state_manager.init_item('face_selector_gender', 'female')
+
+	assert resolve_face_attributes() == [ 'embedding', 'classification' ]
+
+	state_manager.init_item('processors', [ 'face_enhancer' ])
+	state_manager.init_item('face_selector_mode', 'reference')
+	state_manager.init_item('face_selector_gender', None)
+
+	assert resolve_face_attributes() == [ 'embedding' ]
+
+
+def test_detect_faces_by_angles() -> None:
+	state_manager.init_item('face_detector_angles', [ 0, 90 ])
+	vision_frame = numpy.ones((64, 64, 3), dtype = numpy.uint8)
+	face_detection = (numpy.ones((1, 4)), numpy.ones(1), numpy.ones((1, 5, 2)))
+
+	with patch('facefusion.face_analyser.detect_many_faces', return_value = [ face_detection ]), patch('facefusion.face_analyser.detect_faces_by_angle', return_value = merge_detections([])):
+		assert len(detect_faces_by_angles([ vision_frame ], None)[0][0]) == 1
+		assert FACE_DETECTOR_ANGLE_SET == {}
+
+	with patch('facefusion.face_analyser.detect_many_faces', return_value = [ face_detection ]) as detect_many_faces, patch('facefusion.face_analyser.detect_faces_by_angle', return_value = face_detection):
+		assert len(detect_faces_by_angles([ vision_frame ], 'target.mp4')[0][0]) == 2
+		assert FACE_DETECTOR_ANGLE_SET == { 'target.mp4': 0 }
+		assert len(detect_faces_by_angles([ vision_frame ], 'target.mp4')[0][0]) == 1
+		assert detect_many_faces.call_count == 2
+
+	with patch('facefusion.face_analyser.detect_many_faces', return_value = [ merge_detections([]) ]), patch('facefusion.face_analyser.detect_faces_by_angle', return_value = face_detection):
+		assert len(detect_faces_by_angles([ vision_frame ], 'target.mp4')[0][0]) == 1
+		assert FACE_DETECTOR_ANGLE_SET == { 'target.mp4': 90 }
+
+	face_detector.clear_inference_pool()
+	state_manager.init_item('face_detector_angles', [ 0 ])
+
+	assert FACE_DETECTOR_ANGLE_SET == {}
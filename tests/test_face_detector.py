@@ -0,0 +1,44 @@
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_detector import create_roi_boxes, filter_detection, merge_roi_boxes, offset_detection
+
+
+def test_create_roi_boxes() -> None:
+	state_manager.init_item('face_detector_model', 'yolo_face')
+	state_manager.init_item('face_detector_angles', [ 0 ])
+	vision_frame = numpy.zeros((2160, 3840, 3), dtype = numpy.uint8)
+	face_detection =\
+	(
+		numpy.array([ [ 1000, 1000, 1040, 1050 ], [ 1001, 1001, 1041, 1051 ], [ 10, 10, 50, 60 ], [ 2000, 500, 2600, 1200 ] ], dtype = numpy.float32),
+		numpy.array([ 0.9, 0.8, 0.7, 0.9 ], dtype = numpy.float32),
+		numpy.zeros((4, 5, 2))
+	)
+
+	assert create_roi_boxes(vision_frame, face_detection, 0.25, 384).tolist() == [ [ 959, 959, 1081, 1091 ], [ 0, 0, 91, 101 ] ]
+	assert create_roi_boxes(vision_frame, (numpy.empty((0, 4)), numpy.empty(0), numpy.empty((0, 5, 2))), 0.25, 384).shape == (0, 4)
+
+
+def test_merge_roi_boxes() -> None:
+	roi_boxes = numpy.array([ [ 0, 0, 100, 100 ], [ 500, 500, 600, 600 ], [ 80, 80, 200, 200 ], [ 190, 0, 300, 90 ] ])
+
+	assert merge_roi_boxes(roi_boxes, (640, 640)).tolist() == [ [ 500, 500, 600, 600 ], [ 0, 0, 300, 200 ] ]
+	assert merge_roi_boxes(roi_boxes, (150, 150)).tolist() == [ [ 0, 0, 100, 100 ], [ 500, 500, 600, 600 ], [ 80, 80, 200, 200 ], [ 190, 0, 300, 90 ] ]
+	assert merge_roi_boxes(numpy.empty((0, 4)), (640, 640)).shape == (0, 4)
+
+
+def test_filter_detection() -> None:
+	face_detection = (numpy.zeros((2, 4)), numpy.array([ 0.3, 0.6 ]), numpy.zeros((2, 5, 2)))
+	bounding_boxes, face_scores, face_landmarks_5 = filter_detection(face_detection, 0.5)
+
+	assert bounding_boxes.shape == (1, 4)
+	assert face_scores.tolist() == [ 0.6 ]
+	assert face_landmarks_5.shape == (1, 5, 2)
+
+
+def test_offset_detection() -> None:
+	face_detection = (numpy.array([ [ 10, 20, 30, 40 ] ]), numpy.array([ 0.9 ]), numpy.full((1, 5, 2), 5))
+	bounding_boxes, _, face_landmarks_5 = offset_detection(face_detection, (100, 200))
+
+	assert bounding_boxes.tolist() == [ [ 110, 220, 130, 240 ] ]
+	assert face_landmarks_5[0, 0].tolist() == [ 105, 205 ]
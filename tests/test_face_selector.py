@@ -0,0 +1,47 @@
+from typing import List
+
+import numpy
+
+from facefusion.face_selector import compare_faces, find_match_faces, get_reference_matrix
+from facefusion.types import Embedding, Face
+
+
+def create_face(embedding_norm : Embedding) -> Face:
+	return Face(
+		bounding_box = numpy.zeros(4),
+		score_set = {},
+		landmark_set = {},
+		angle = 0,
+		embedding = embedding_norm,
+		embedding_norm = embedding_norm,
+		gender = None,
+		age = None,
+		race = None
+	)
+
+
+def create_faces(face_total : int) -> List[Face]:
+	random_state = numpy.random.RandomState(0)
+	embedding_matrix = random_state.randn(face_total, 512)
+	embedding_matrix /= numpy.linalg.norm(embedding_matrix, axis = 1, keepdims = True)
+	return [ create_face(embedding_norm) for embedding_norm in embedding_matrix ]
+
+
+def test_find_match_faces() -> None:
+	reference_faces = create_faces(12)
+	target_faces = [ reference_faces[3], reference_faces[7], create_faces(13)[12], reference_faces[3] ]
+	match_faces = find_match_faces(reference_faces, target_faces, 0.3)
+
+	assert match_faces == [ target_faces[0], target_faces[3], target_faces[1] ]
+	assert match_faces == [ target_face for reference_face in reference_faces for target_face in target_faces if compare_faces(target_face, reference_face, 0.3) ]
+	assert find_match_faces([], target_faces, 0.3) == []
+	assert find_match_faces(reference_faces, [], 0.3) == []
+
+
+def test_get_reference_matrix() -> None:
+	reference_faces = create_faces(12)
+	reference_matrix = get_reference_matrix(reference_faces)
+
+	assert reference_matrix.shape == (12, 512)
+	assert get_reference_matrix([ create_face(reference_face.embedding_norm.copy()) for reference_face in reference_faces ]) is reference_matrix
+	assert get_reference_matrix(reference_faces[:6]) is not reference_matrix
@@ -0,0 +1,41 @@
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_store import clear_static_faces, get_face_store, get_static_faces, pin_static_faces, set_static_faces
+
+
+def test_get_static_faces() -> None:
+	clear_static_faces()
+	vision_frame = numpy.zeros((64, 64, 3), dtype = numpy.uint8)
+
+	assert get_static_faces(vision_frame) is None
+
+	set_static_faces(vision_frame, [])
+
+	assert get_static_faces(vision_frame) == []
+	assert get_static_faces(vision_frame.copy()) == []
+	assert get_face_store().get('hit_count') == 2
+	assert get_face_store().get('miss_count') == 1
+
+	vision_frame[:] = 255
+
+	assert get_static_faces(vision_frame) is None
+
+
+def test_set_static_faces_with_capacity() -> None:
+	clear_static_faces()
+	state_manager.init_item('face_store_capacity', 64)
+	source_vision_frame = numpy.ones((64, 64, 3), dtype = numpy.uint8)
+	vision_frames = [ numpy.full((64, 64, 3), index, dtype = numpy.uint8) for index in range(2, 102) ]
+
+	set_static_faces(source_vision_frame, [])
+	pin_static_faces(source_vision_frame)
+
+	for vision_frame in vision_frames:
+		set_static_faces(vision_frame, [])
+
+	assert len(get_face_store().get('static_faces')) == 64
+	assert len(get_face_store().get('pinned_faces')) == 1
+	assert get_static_faces(source_vision_frame) == []
+	assert get_static_faces(vision_frames[0]) is None
+	assert get_static_faces(vision_frames[-1]) == []
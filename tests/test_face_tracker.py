@@ -0,0 +1,68 @@
+import cv2
+import numpy
+
+from facefusion import state_manager
+from facefusion.face_tracker import create_face_tracker, detect_scene_cut, is_track_frame, propagate_faces
+from facefusion.types import Face, VisionFrame
+
+
+def create_track_frame() -> VisionFrame:
+	random_state = numpy.random.RandomState(0)
+	track_frame = random_state.randint(0, 255, (240, 320)).astype(numpy.uint8)
+	return cv2.GaussianBlur(track_frame, (7, 7), 2)
+
+
+def create_face() -> Face:
+	face_landmark_68 = numpy.stack(numpy.meshgrid(numpy.linspace(120, 200, 17), numpy.linspace(80, 160, 4)), axis = -1).reshape(-1, 2)[:68].astype(numpy.float32)
+	face_landmark_5 = face_landmark_68[[ 0, 16, 34, 51, 67 ]]
+	return Face(
+		bounding_box = numpy.array([ 110, 70, 210, 170 ], dtype = numpy.float32),
+		score_set = { 'detector': 1.0, 'landmarker': 0.0 },
+		landmark_set = { '5': face_landmark_5, '5/68': face_landmark_5, '68': face_landmark_68, '68/5': face_landmark_68 },
+		angle = 0,
+		embedding = numpy.ones(512),
+		embedding_norm = numpy.ones(512),
+		gender = 'female',
+		age = range(20, 29),
+		race = 'white'
+	)
+
+
+def test_is_track_frame() -> None:
+	state_manager.init_item('face_detector_interval', 2)
+	face_tracker = create_face_tracker()
+	track_frame = create_track_frame()
+
+	assert is_track_frame(face_tracker, track_frame) is False
+
+	face_tracker['track_frame'] = track_frame
+	face_tracker['frame_count'] = 1
+
+	assert is_track_frame(face_tracker, track_frame) is True
+	assert is_track_frame(face_tracker, numpy.zeros_like(track_frame)) is False
+
+	face_tracker['frame_count'] = 2
+
+	assert is_track_frame(face_tracker, track_frame) is False
+
+
+def test_detect_scene_cut() -> None:
+	track_frame = create_track_frame()
+
+	assert detect_scene_cut(track_frame, numpy.roll(track_frame, 3, axis = 1)) is False
+	assert detect_scene_cut(track_frame, numpy.zeros_like(track_frame)) is True
+
+
+def test_propagate_faces() -> None:
+	state_manager.init_item('face_landmarker_score', 0.5)
+	track_frame = create_track_frame()
+	face = create_face()
+	tracked_faces = propagate_faces(track_frame, numpy.roll(track_frame, (2, 3), axis = (0, 1)), [ face ])
+
+	assert len(tracked_faces) == 1
+	assert numpy.allclose(tracked_faces[0].bounding_box, face.bounding_box + [ 3, 2, 3, 2 ], atol = 0.5)
+	assert numpy.allclose(tracked_faces[0].landmark_set.get('68'), face.landmark_set.get('68') + [ 3, 2 ], atol = 0.5)
+	assert tracked_faces[0].embedding is face.embedding
+	assert tracked_faces[0].gender == 'female'
+	assert propagate_faces(track_frame, create_track_frame()[::-1].copy(), [ face ]) is None
+	assert propagate_faces(track_frame, track_frame, []) == []
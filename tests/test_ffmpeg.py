@@ -7,7 +7,7 @@ import pytest
 import facefusion.ffmpeg
 from facefusion import process_manager, state_manager
 from facefusion.download import conditional_download
-from facefusion.ffmpeg import concat_video, extract_frames, merge_video, read_audio_buffer, replace_audio, restore_audio
+from facefusion.ffmpeg import close_stream, concat_video, detect_video_keyframes, extract_frames, merge_video, merge_video_with_audio, open_frame_reader, open_frame_writer, read_audio_buffer, read_stream_frame, replace_audio, restore_audio, write_stream_frame
 from facefusion.filesystem import copy_file
 from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_file_path, resolve_temp_frame_paths
 from facefusion.types import EncoderSet
@@ -116,6 +116,53 @@ def test_merge_video() -> None:
 	state_manager.init_item('output_video_encoder', 'libx264')
 
 
+def test_merge_video_with_audio() -> None:
+	test_set =\
+	[
+		(get_test_example_file('target-240p-16khz.mp4'), get_test_example_file('target-240p-16khz.mp4'), get_test_output_file('test-merge-video-with-audio.mp4')),
+		(get_test_example_file('target-240p-16khz.mkv'), get_test_example_file('source.mp3'), get_test_output_file('test-merge-video-with-audio.mkv')),
+		(get_test_example_file('target-240p-25fps.mp4'), get_test_example_file('target-240p-25fps.mp4'), get_test_output_file('test-merge-video-without-audio.mp4'))
+	]
+
+	for target_path, audio_path, output_path in test_set:
+		create_temp_directory(target_path)
+		extract_frames(target_path, (452, 240), 25.0, 0, 10)
+
+		assert merge_video_with_audio(target_path, audio_path, output_path, 25.0, (452, 240), 25.0, 0, 10) is True
+
+		clear_temp_directory(target_path)
+
+
+def test_detect_video_keyframes() -> None:
+	video_keyframes = detect_video_keyframes(get_test_example_file('target-240p-25fps.mp4'))
+
+	assert video_keyframes[0] == 0
+	assert video_keyframes == sorted(video_keyframes)
+	assert detect_video_keyframes(get_test_example_file('invalid.mp4')) == []
+
+
+def test_stream_frames() -> None:
+	target_path = get_test_example_file('target-240p-25fps.mp4')
+	create_temp_directory(target_path)
+	reader_process = open_frame_reader(target_path, (452, 240), 25.0, 0, 10)
+	writer_process = open_frame_writer(get_temp_file_path(target_path), 25.0, (452, 240), (452, 240), 25.0)
+	vision_frame = read_stream_frame(reader_process, (452, 240))
+	frame_total = 0
+
+	while vision_frame is not None:
+		assert vision_frame.shape == (240, 452, 3)
+		assert write_stream_frame(writer_process, vision_frame) is True
+		vision_frame = read_stream_frame(reader_process, (452, 240))
+		frame_total += 1
+
+	assert frame_total == 10
+	assert close_stream(reader_process) is True
+	assert close_stream(writer_process) is True
+	assert os.path.exists(get_temp_file_path(target_path))
+
+	clear_temp_directory(target_path)
+
+
 def test_concat_video() -> None:
 	output_path = get_test_output_file('test-concat-video.mp4')
 	temp_output_paths =\
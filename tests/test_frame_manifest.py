@@ -0,0 +1,109 @@
+import os
+import tempfile
+
+import numpy
+import pytest
+
+from facefusion import state_manager
+from facefusion.filesystem import is_file
+from facefusion.frame_manifest import commit_partial_frame, create_args_hash, create_frame_manifest, get_partial_frame_path, has_frame_manifest, mark_frame, read_frame_bitmap, read_frame_manifest, restore_partial_frames, validate_frame_manifest
+from facefusion.temp_helper import clear_temp_directory, create_temp_directory, get_temp_frames_pattern, resolve_temp_frame_paths
+from facefusion.vision import write_image
+from .helper import get_test_example_file
+
+
+@pytest.fixture(scope = 'module', autouse = True)
+def before_all() -> None:
+	state_manager.init_item('temp_path', tempfile.gettempdir())
+	state_manager.init_item('temp_frame_format', 'png')
+
+
+@pytest.fixture(scope = 'function', autouse = True)
+def before_each() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+	clear_temp_directory(target_path)
+	create_temp_directory(target_path)
+
+	for frame_number in range(10):
+		write_image(get_temp_frames_pattern(target_path, '%08d' % (frame_number + 1)), numpy.zeros((8, 8, 3), dtype = numpy.uint8))
+
+
+def test_create_args_hash() -> None:
+	assert create_args_hash({ 'target_path': 'target.mp4', 'face_swapper_model': 'inswapper_128' }) == create_args_hash({ 'face_swapper_model': 'inswapper_128', 'target_path': 'target.mp4' })
+	assert create_args_hash({ 'target_path': 'target.mp4' }) != create_args_hash({ 'target_path': 'target.mkv' })
+
+
+def test_create_frame_manifest() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+
+	assert create_frame_manifest(target_path, 'abcd1234', 10) is True
+	assert read_frame_manifest(target_path) == { 'args_hash': 'abcd1234', 'frame_total': 10 }
+	assert len(resolve_temp_frame_paths(target_path)) == 10
+
+
+def test_validate_frame_manifest() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+
+	assert validate_frame_manifest(target_path, 'abcd1234') is False
+
+	create_frame_manifest(target_path, 'abcd1234', 10)
+
+	assert validate_frame_manifest(target_path, 'abcd1234') is True
+	assert validate_frame_manifest(target_path, 'dcba4321') is False
+
+	create_frame_manifest(target_path, 'abcd1234', 20)
+
+	assert validate_frame_manifest(target_path, 'abcd1234') is False
+
+
+def test_has_frame_manifest() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+
+	assert has_frame_manifest(target_path) is False
+
+	create_frame_manifest(target_path, 'abcd1234', 10)
+
+	assert has_frame_manifest(target_path) is True
+
+	create_frame_manifest(target_path, 'abcd1234', 20)
+
+	assert has_frame_manifest(target_path) is False
+
+
+def test_mark_frame() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+	create_frame_manifest(target_path, 'abcd1234', 10)
+
+	assert mark_frame(target_path, 0) is True
+	assert mark_frame(target_path, 9) is True
+	assert mark_frame(target_path, 16) is False
+	assert read_frame_bitmap(target_path).tolist() == [ True, False, False, False, False, False, False, False, False, True ]
+
+
+def test_commit_partial_frame() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+	temp_frame_path = resolve_temp_frame_paths(target_path)[2]
+	create_frame_manifest(target_path, 'abcd1234', 10)
+
+	assert commit_partial_frame(target_path, temp_frame_path, 2) is False
+
+	write_image(get_partial_frame_path(temp_frame_path), numpy.ones((8, 8, 3), dtype = numpy.uint8))
+
+	assert commit_partial_frame(target_path, temp_frame_path, 2) is True
+	assert is_file(get_partial_frame_path(temp_frame_path)) is False
+	assert numpy.count_nonzero(read_frame_bitmap(target_path)) == 1
+
+
+def test_restore_partial_frames() -> None:
+	target_path = get_test_example_file('target-manifest.mp4')
+	temp_frame_paths = resolve_temp_frame_paths(target_path)
+	create_frame_manifest(target_path, 'abcd1234', 10)
+	mark_frame(target_path, 3)
+
+	for temp_frame_path in temp_frame_paths[3:5]:
+		write_image(get_partial_frame_path(temp_frame_path), numpy.ones((8, 8, 3), dtype = numpy.uint8))
+
+	restore_partial_frames(target_path)
+
+	assert os.listdir(os.path.dirname(get_partial_frame_path(temp_frame_paths[0]))) == []
+	assert len(resolve_temp_frame_paths(target_path)) == 10
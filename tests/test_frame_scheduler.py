@@ -0,0 +1,103 @@
+import threading
+import time
+from typing import Iterator, List, Tuple
+
+import numpy
+
+from facefusion import process_manager
+from facefusion.frame_scheduler import calculate_frame_window, prefetch_frames, schedule_frames
+from facefusion.types import VisionFrame
+
+
+def test_calculate_frame_window() -> None:
+	assert calculate_frame_window(4, 2) == 8
+	assert calculate_frame_window(1, 1) == 1
+	assert calculate_frame_window(0, 0) == 1
+
+
+def test_schedule_frames() -> None:
+	def process_frame(frame_number : int) -> int:
+		time.sleep((10 - frame_number) * 0.001)
+		return frame_number
+
+	process_manager.start()
+
+	assert list(schedule_frames(process_frame, ((frame_number,) for frame_number in range(10)), 4, 2)) == list(range(10))
+
+	process_manager.end()
+
+
+def test_prefetch_frames() -> None:
+	prefetch_windows : List[List[int]] = []
+
+	def prefetch_frame(vision_frames : List[VisionFrame]) -> None:
+		prefetch_windows.append([ int(vision_frame[0, 0]) for vision_frame in vision_frames ])
+
+	process_manager.start()
+	frame_arguments = [ (numpy.full((2, 2), frame_number), frame_number) for frame_number in range(5) ]
+
+	assert [ frame_number for _, frame_number in prefetch_frames(frame_arguments, prefetch_frame, 2) ] == list(range(5))
+	assert prefetch_windows == [ [ 0, 1 ], [ 2, 3 ], [ 4 ] ]
+
+	process_manager.end()
+
+
+def test_schedule_frames_with_backpressure() -> None:
+	frame_lock = threading.Lock()
+	frame_counts = { 'submitted': 0, 'maximum': 0 }
+
+	def process_frame(frame_number : int) -> int:
+		return frame_number
+
+	def resolve_frame_arguments() -> Iterator[Tuple[int]]:
+		for frame_number in range(100):
+			with frame_lock:
+				frame_counts['submitted'] += 1
+			yield (frame_number,)
+
+	process_manager.start()
+
+	for frame_number in schedule_frames(process_frame, resolve_frame_arguments(), 2, 2):
+		frame_counts['maximum'] = max(frame_counts.get('maximum'), frame_counts.get('submitted') - frame_number)
+
+	assert frame_counts.get('maximum') <= 4
+
+	process_manager.end()
+
+
+def test_schedule_frames_with_stopping() -> None:
+	def process_frame(frame_number : int) -> int:
+		if frame_number == 4:
+			process_manager.stop()
+		return frame_number
+
+	process_manager.start()
+
+	assert len(list(schedule_frames(process_frame, ((frame_number,) for frame_number in range(100)), 1, 1))) < 100
+
+	process_manager.end()
+
+
+def flip_frame(vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	return vision_frame[:, ::-1]
+
+
+def scale_frame(vision_frame : VisionFrame, frame_number : int) -> VisionFrame:
+	return numpy.repeat(numpy.repeat(vision_frame, 2, axis = 0), 2, axis = 1)
+
+
+def test_schedule_frames_with_processes() -> None:
+	vision_frames = [ numpy.full((24, 32, 3), frame_number, dtype = numpy.uint8) for frame_number in range(10) ]
+
+	process_manager.start()
+
+	temp_vision_frames = list(schedule_frames(flip_frame, ((vision_frame, frame_number) for frame_number, vision_frame in enumerate(vision_frames)), 2, 2, 'process'))
+
+	assert [ temp_vision_frame[0][0][0] for temp_vision_frame in temp_vision_frames ] == list(range(10))
+
+	temp_vision_frames = list(schedule_frames(scale_frame, ((vision_frame, frame_number) for frame_number, vision_frame in enumerate(vision_frames)), 2, 2, 'process'))
+
+	assert temp_vision_frames[5].shape == (48, 64, 3)
+	assert temp_vision_frames[5][0][0][0] == 5
+
+	process_manager.end()
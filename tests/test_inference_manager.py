@@ -1,10 +1,18 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Union
 from unittest.mock import patch
 
+import numpy
+import onnx
 import pytest
+from onnx import ModelProto, TensorProto, helper
 from onnxruntime import InferenceSession
 
 from facefusion import content_analyser, state_manager
-from facefusion.inference_manager import INFERENCE_POOL_SET, get_inference_pool
+from facefusion.filesystem import create_directory, is_file, remove_file
+from facefusion.inference_manager import EXECUTION_DEVICE_LOAD_SET, INFERENCE_BATCHABLE_SET, INFERENCE_FOOTPRINT_SET, INFERENCE_POOL_SET, clear_inference_pool, create_cached_inference_session, get_execution_device_loads, get_inference_pool, get_optimized_model_path, get_tensor_buffer, is_batchable_session, pin_execution_device, resolve_execution_device, run_bound_inference, run_inference, run_stacked_inference, select_execution_device, select_worker_execution_device, unpin_execution_device, warm_up_inference_pool
+from .helper import get_test_example_file, get_test_examples_directory
 
 
 @pytest.fixture(scope = 'module', autouse = True)
@@ -12,6 +20,8 @@ def before_all() -> None:
 	state_manager.init_item('execution_device_ids', [ '0' ])
 	state_manager.init_item('execution_providers', [ 'cpu' ])
 	state_manager.init_item('download_providers', [ 'github' ])
+	state_manager.init_item('execution_batch_size', 4)
+	state_manager.init_item('execution_batch_timeout', 10000)
 	content_analyser.pre_check()
 
 
@@ -30,3 +40,227 @@ def test_get_inference_pool() -> None:
 		assert isinstance(INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1'), InferenceSession)
 
 	assert INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1') == INFERENCE_POOL_SET.get('ui').get('facefusion.content_analyser.nsfw_1.nsfw_2.nsfw_3.0.cpu').get('nsfw_1')
+
+
+def create_scale_model(batch_dimension : Union[int, str]) -> ModelProto:
+	model_input = helper.make_tensor_value_info('input', TensorProto.FLOAT, [ batch_dimension, 3 ])
+	model_output = helper.make_tensor_value_info('output', TensorProto.FLOAT, [ batch_dimension, 3 ])
+	model_scale = helper.make_tensor('scale', TensorProto.FLOAT, [ 1 ], [ 2.0 ])
+	model_graph = helper.make_graph([ helper.make_node('Mul', [ 'input', 'scale' ], [ 'output' ]) ], 'scale', [ model_input ], [ model_output ], [ model_scale ])
+	model = helper.make_model(model_graph, opset_imports = [ helper.make_opsetid('', 13) ])
+	model.ir_version = 8
+	return model
+
+
+def create_scale_session(batch_dimension : Union[int, str]) -> InferenceSession:
+	return InferenceSession(create_scale_model(batch_dimension).SerializeToString(), providers = [ 'CPUExecutionProvider' ])
+
+
+def test_run_inference() -> None:
+	inference_session = create_scale_session('batch')
+	vision_frames = [ numpy.full((1, 3), index, dtype = numpy.float32) for index in range(8) ]
+
+	with patch.object(inference_session, 'run', wraps = inference_session.run) as inference_run:
+		with ThreadPoolExecutor(max_workers = 8) as executor:
+			futures = [ executor.submit(run_inference, inference_session, { 'input': vision_frame }) for vision_frame in vision_frames ]
+
+		assert inference_run.call_count < len(vision_frames)
+
+	for vision_frame, future in zip(vision_frames, futures):
+		assert numpy.array_equal(future.result()[0], vision_frame * 2)
+	assert INFERENCE_BATCHABLE_SET.get(inference_session) is True
+
+
+def test_run_inference_with_fixed_batch() -> None:
+	inference_session = create_scale_session(1)
+	vision_frame = numpy.ones((1, 3), dtype = numpy.float32)
+
+	assert numpy.array_equal(run_inference(inference_session, { 'input': vision_frame })[0], vision_frame * 2)
+	assert INFERENCE_BATCHABLE_SET.get(inference_session) is False
+
+
+def test_is_batchable_session() -> None:
+	model_input = helper.make_tensor_value_info('input', TensorProto.FLOAT, [ 'batch', 3 ])
+	model_output = helper.make_tensor_value_info('output', TensorProto.FLOAT, [ 'anchors', 1 ])
+	model_graph = helper.make_graph([ helper.make_node('Reshape', [ 'input', 'shape' ], [ 'output' ]) ], 'flatten', [ model_input ], [ model_output ], [ helper.make_tensor('shape', TensorProto.INT64, [ 2 ], [ -1, 1 ]) ])
+	model = helper.make_model(model_graph, opset_imports = [ helper.make_opsetid('', 13) ])
+	model.ir_version = 8
+
+	assert is_batchable_session(create_scale_session('batch')) is True
+	assert is_batchable_session(create_scale_session(1)) is False
+	assert is_batchable_session(InferenceSession(model.SerializeToString(), providers = [ 'CPUExecutionProvider' ])) is False
+
+
+def test_run_bound_inference() -> None:
+	inference_session = create_scale_session(1)
+	vision_frame = get_tensor_buffer('scale.input', (1, 3), numpy.float32)
+	vision_frame.fill(1)
+	first_outputs = run_bound_inference(inference_session, { 'input': vision_frame })
+
+	assert numpy.array_equal(first_outputs[0], vision_frame * 2)
+
+	vision_frame.fill(3)
+	second_outputs = run_bound_inference(inference_session, { 'input': vision_frame })
+
+	assert numpy.array_equal(second_outputs[0], vision_frame * 2)
+	assert numpy.array_equal(first_outputs[0], numpy.full((1, 3), 2))
+	assert get_tensor_buffer('scale.input', (1, 3), numpy.float32) is vision_frame
+	assert numpy.array_equal(run_bound_inference(create_scale_session('batch'), { 'input': vision_frame })[0], vision_frame * 2)
+
+
+def test_run_stacked_inference() -> None:
+	vision_frames = numpy.arange(12, dtype = numpy.float32).reshape(4, 3)
+
+	assert numpy.array_equal(run_stacked_inference(create_scale_session(1), { 'input': vision_frames })[0], vision_frames * 2)
+	assert numpy.array_equal(run_stacked_inference(create_scale_session('batch'), { 'input': vision_frames })[0], vision_frames * 2)
+
+
+def test_create_cached_inference_session() -> None:
+	model_path = get_test_example_file('scale.onnx')
+	create_directory(get_test_examples_directory())
+	onnx.save(create_scale_model('batch'), model_path)
+	optimized_model_path = get_optimized_model_path(model_path, [ 'cpu' ])
+	remove_file(optimized_model_path)
+	create_cached_inference_session(model_path, [ 'cpu' ], [ 'CPUExecutionProvider' ])
+
+	assert is_file(optimized_model_path)
+
+	with patch('facefusion.inference_manager.InferenceSession', wraps = InferenceSession) as inference_session:
+		create_cached_inference_session(model_path, [ 'cpu' ], [ 'CPUExecutionProvider' ])
+
+		assert inference_session.call_args[0][0] == optimized_model_path
+
+	assert get_optimized_model_path(model_path, [ 'cuda', 'cpu' ]) != optimized_model_path
+
+	remove_file(optimized_model_path)
+
+
+def test_warm_up_inference_pool() -> None:
+	inference_session = create_scale_session('batch')
+
+	with patch.object(inference_session, 'run', wraps = inference_session.run) as inference_run:
+		warm_up_inference_pool({ 'scale': inference_session })
+
+		assert inference_run.call_args[0][1].get('input').shape == (1, 3)
+
+	model_input = helper.make_tensor_value_info('input', TensorProto.FLOAT, [ 'batch', 3, 'height', 'width' ])
+	model_output = helper.make_tensor_value_info('output', TensorProto.FLOAT, [ 'batch', 3, 'height', 'width' ])
+	model_graph = helper.make_graph([ helper.make_node('Identity', [ 'input' ], [ 'output' ]) ], 'identity', [ model_input ], [ model_output ])
+	model = helper.make_model(model_graph, opset_imports = [ helper.make_opsetid('', 13) ])
+	model.ir_version = 8
+	inference_session = InferenceSession(model.SerializeToString(), providers = [ 'CPUExecutionProvider' ])
+
+	with patch.object(inference_session, 'run', wraps = inference_session.run) as inference_run:
+		warm_up_inference_pool({ 'identity': inference_session }, (640, 320))
+
+		assert inference_run.call_args[0][1].get('input').shape == (1, 3, 320, 640)
+
+	with patch.object(inference_session, 'run') as inference_run:
+		warm_up_inference_pool({ 'identity': inference_session })
+
+		assert inference_run.call_count == 0
+
+
+def test_evict_inference_pools() -> None:
+	model_path = get_test_example_file('scale.onnx')
+	create_directory(get_test_examples_directory())
+	onnx.save(create_scale_model('batch'), model_path)
+	model_source_set =\
+	{
+		'scale':
+		{
+			'url': '',
+			'path': model_path
+		}
+	}
+	state_manager.init_item('inference_memory_budget', 1)
+
+	assert 'scale' in get_inference_pool('facefusion.content_analyser', [ 'first' ], model_source_set)
+
+	INFERENCE_FOOTPRINT_SET[('facefusion.content_analyser.first.0.cpu', 'scale')] = 1024 ** 3
+	get_inference_pool('facefusion.content_analyser', [ 'second' ], model_source_set)
+
+	assert INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.first.0.cpu') == {}
+	assert 'scale' in INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.second.0.cpu')
+
+	clear_inference_pool('facefusion.content_analyser', [ 'second' ])
+
+	assert 'scale' in INFERENCE_POOL_SET.get('cli').get('facefusion.content_analyser.second.0.cpu')
+	assert 'scale' in get_inference_pool('facefusion.content_analyser', [ 'first' ], model_source_set)
+
+	state_manager.init_item('inference_memory_budget', 0)
+	remove_file(get_optimized_model_path(model_path, [ 'cpu' ]))
+
+
+def test_get_inference_pool_per_model() -> None:
+	model_path = get_test_example_file('scale.onnx')
+	create_directory(get_test_examples_directory())
+	onnx.save(create_scale_model('batch'), model_path)
+	model_source_set =\
+	{
+		'first':
+		{
+			'url': '',
+			'path': model_path
+		},
+		'second':
+		{
+			'url': '',
+			'path': model_path
+		}
+	}
+
+	assert list(get_inference_pool('facefusion.content_analyser', [ 'lazy' ], { 'first': model_source_set.get('first') }).keys()) == [ 'first' ]
+	assert list(get_inference_pool('facefusion.content_analyser', [ 'lazy' ], model_source_set).keys()) == [ 'first', 'second' ]
+	assert ('facefusion.content_analyser.lazy.0.cpu', 'first') in INFERENCE_FOOTPRINT_SET
+
+	clear_inference_pool('facefusion.content_analyser', [ 'lazy' ])
+	remove_file(get_optimized_model_path(model_path, [ 'cpu' ]))
+
+
+def collect_worker_execution_device(execution_device_ids : List[str]) -> None:
+	execution_device_ids.append(select_worker_execution_device([ '0', '1' ]))
+
+
+def test_pin_execution_device() -> None:
+	state_manager.init_item('execution_device_ids', [ '0', '1' ])
+	state_manager.init_item('execution_device_pinning', 'frame')
+	EXECUTION_DEVICE_LOAD_SET.clear()
+
+	first_device_token = pin_execution_device()
+	second_device_token = pin_execution_device()
+
+	assert resolve_execution_device([ '0', '1' ]) == '1'
+	assert get_execution_device_loads().get('0').get('requests') == 1
+	assert get_execution_device_loads().get('1').get('requests') == 1
+
+	unpin_execution_device(second_device_token)
+
+	assert resolve_execution_device([ '0', '1' ]) == '0'
+	assert resolve_execution_device([ '2' ]) == '2'
+
+	unpin_execution_device(first_device_token)
+
+	assert get_execution_device_loads().get('0').get('frame_total') == 1
+	assert get_execution_device_loads().get('1').get('frame_total') == 1
+
+	EXECUTION_DEVICE_LOAD_SET.get('1')['latency'] = 1.0
+
+	assert select_execution_device([ '0', '1' ]) == '0'
+
+	execution_device_ids : List[str] = []
+	worker_threads = [ threading.Thread(target = collect_worker_execution_device, args = (execution_device_ids,)) for _ in range(2) ]
+
+	for worker_thread in worker_threads:
+		worker_thread.start()
+		worker_thread.join()
+
+	assert sorted(execution_device_ids) == [ '0', '1' ]
+
+	del worker_threads, worker_thread
+
+	assert get_execution_device_loads().get('0').get('workers') == 0
+	assert get_execution_device_loads().get('1').get('workers') == 0
+
+	state_manager.init_item('execution_device_ids', [ '0' ])
+	EXECUTION_DEVICE_LOAD_SET.clear()
@@ -0,0 +1,9 @@
+from facefusion.segment_helper import calculate_segment_ranges
+
+
+def test_calculate_segment_ranges() -> None:
+	assert calculate_segment_ranges(0, 100, [], 1) == [ (0, 100) ]
+	assert calculate_segment_ranges(0, 100, [], 4) == [ (0, 25), (25, 50), (50, 75), (75, 100) ]
+	assert calculate_segment_ranges(0, 100, [ 0, 30, 60, 90 ], 4) == [ (0, 30), (30, 60), (60, 90), (90, 100) ]
+	assert calculate_segment_ranges(0, 100, [ 0, 60 ], 4) == [ (0, 60), (60, 100) ]
+	assert calculate_segment_ranges(10, 50, [ 0, 30, 60, 90 ], 2) == [ (10, 30), (30, 50) ]
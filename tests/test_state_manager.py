@@ -1,9 +1,12 @@
+import timeit
+from functools import partial
 from typing import Union
 
 import pytest
 
+from facefusion.app_context import bind_app_context, detect_app_context, unbind_app_context
 from facefusion.processors.types import ProcessorState
-from facefusion.state_manager import STATE_SET, get_item, init_item, set_item
+from facefusion.state_manager import STATE_SET, bind_state_snapshot, get_item, get_state_snapshot, init_item, set_item, unbind_state_snapshot
 from facefusion.types import AppContext, State
 
 
@@ -33,3 +36,48 @@ def test_get_item_and_set_item() -> None:
 
 	assert get_item('video_memory_strategy') == 'tolerant'
 	assert get_state('ui').get('video_memory_strategy') is None
+
+
+def test_bind_app_context() -> None:
+	app_context_token = bind_app_context('ui')
+	set_item('video_memory_strategy', 'tolerant')
+
+	assert detect_app_context() == 'ui'
+	assert get_state('ui').get('video_memory_strategy') == 'tolerant'
+	assert get_state('cli').get('video_memory_strategy') is None
+
+	unbind_app_context(app_context_token)
+
+	assert detect_app_context() == 'cli'
+
+
+def test_get_state_snapshot() -> None:
+	init_item('video_memory_strategy', 'tolerant')
+
+	assert get_state_snapshot().video_memory_strategy == 'tolerant'
+
+	state_snapshot_token = bind_state_snapshot()
+	state_snapshot = get_state_snapshot()
+
+	assert get_state_snapshot() is state_snapshot
+
+	with pytest.raises(AttributeError):
+		state_snapshot.video_memory_strategy = 'strict'
+
+	set_item('video_memory_strategy', 'strict')
+
+	assert get_state_snapshot().video_memory_strategy == 'strict'
+	assert get_state_snapshot().face_swapper_weight is None
+
+	unbind_state_snapshot(state_snapshot_token)
+
+	assert get_state_snapshot() is get_state_snapshot()
+
+
+def test_state_snapshot_benchmark() -> None:
+	init_item('face_swapper_weight', 0.5)
+	state_snapshot = get_state_snapshot()
+	get_item_time = min(timeit.repeat(partial(get_item, 'face_swapper_weight'), number = 1000, repeat = 5))
+	state_snapshot_time = min(timeit.repeat(partial(getattr, state_snapshot, 'face_swapper_weight'), number = 1000, repeat = 5))
+
+	assert state_snapshot_time * 2 < get_item_time
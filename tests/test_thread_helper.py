@@ -0,0 +1,47 @@
+import threading
+
+from onnx import TensorProto, helper
+from onnxruntime import InferenceSession
+
+from facefusion import state_manager
+from facefusion.thread_helper import NULL_CONTEXT, capture_semaphore, resolve_concurrency_limit, session_semaphore
+
+
+def create_identity_session() -> InferenceSession:
+	model_input = helper.make_tensor_value_info('input', TensorProto.FLOAT, [ 1 ])
+	model_output = helper.make_tensor_value_info('output', TensorProto.FLOAT, [ 1 ])
+	model_graph = helper.make_graph([ helper.make_node('Identity', [ 'input' ], [ 'output' ]) ], 'identity', [ model_input ], [ model_output ])
+	model = helper.make_model(model_graph, opset_imports = [ helper.make_opsetid('', 13) ])
+	model.ir_version = 8
+	return InferenceSession(model.SerializeToString(), providers = [ 'CPUExecutionProvider' ])
+
+
+def test_session_semaphore() -> None:
+	state_manager.init_item('execution_concurrency_limit', 0)
+	inference_session = create_identity_session()
+
+	assert session_semaphore(inference_session) is NULL_CONTEXT
+
+	state_manager.init_item('execution_concurrency_limit', 2)
+	inference_session = create_identity_session()
+
+	assert isinstance(session_semaphore(inference_session), threading.Semaphore)
+	assert session_semaphore(inference_session) is session_semaphore(inference_session)
+	assert session_semaphore(inference_session) is not session_semaphore(create_identity_session())
+
+
+def test_capture_semaphore() -> None:
+	assert capture_semaphore('target.mp4') is capture_semaphore('target.mp4')
+	assert capture_semaphore('target.mp4') is not capture_semaphore('source.mp4')
+
+
+def test_resolve_concurrency_limit() -> None:
+	state_manager.init_item('execution_concurrency_limit', 0)
+
+	assert resolve_concurrency_limit([ 'CUDAExecutionProvider', 'CPUExecutionProvider' ]) == 0
+	assert resolve_concurrency_limit([ 'DmlExecutionProvider', 'CPUExecutionProvider' ]) == 1
+	assert resolve_concurrency_limit([ 'ROCMExecutionProvider' ]) == 1
+
+	state_manager.init_item('execution_concurrency_limit', 4)
+
+	assert resolve_concurrency_limit([ 'DmlExecutionProvider' ]) == 4
@@ -1,9 +1,10 @@
+import os
 import subprocess
 
 import pytest
 
 from facefusion.download import conditional_download
-from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, read_image, read_video_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, unpack_resolution, write_image
+from facefusion.vision import calculate_histogram_difference, count_trim_frame_total, count_video_frame_total, detect_image_resolution, detect_video_duration, detect_video_fps, detect_video_resolution, match_frame_color, normalize_resolution, pack_resolution, predict_video_frame_total, probe_video, read_image, read_video_frame, resize_frame, restrict_image_resolution, restrict_trim_frame, restrict_video_fps, restrict_video_resolution, scale_resolution, unpack_resolution, write_image, write_image_with_quality
 from .helper import get_test_example_file, get_test_examples_directory, get_test_output_file, prepare_test_output_directory
 
 
@@ -46,6 +47,16 @@ def test_write_image() -> None:
 	assert write_image(get_test_output_file('目标-240p.webp'), vision_frame) is True
 
 
+def test_write_image_with_quality() -> None:
+	vision_frame = read_image(get_test_example_file('target-240p.jpg'))
+
+	assert write_image_with_quality(get_test_output_file('target-240p-quality-high.jpg'), vision_frame, 100) is True
+	assert write_image_with_quality(get_test_output_file('target-240p-quality-low.jpg'), vision_frame, 10) is True
+	assert os.path.getsize(get_test_output_file('target-240p-quality-low.jpg')) < os.path.getsize(get_test_output_file('target-240p-quality-high.jpg'))
+	assert write_image_with_quality(get_test_output_file('目标-240p.webp'), vision_frame, 80) is True
+	assert write_image_with_quality(get_test_output_file('target-240p.invalid'), vision_frame, 80) is False
+
+
 def test_detect_image_resolution() -> None:
 	assert detect_image_resolution(get_test_example_file('target-240p.jpg')) == (426, 226)
 	assert detect_image_resolution(get_test_example_file('target-240p-90deg.jpg')) == (226, 426)
@@ -65,6 +76,16 @@ def test_read_video_frame() -> None:
 	assert read_video_frame('invalid') is None
 
 
+def test_probe_video() -> None:
+	video_probe = probe_video(get_test_example_file('target-240p-25fps.mp4'))
+
+	assert video_probe.fps == 25.0
+	assert video_probe.frame_total == 270
+	assert video_probe.resolution == (426, 226)
+	assert probe_video(get_test_example_file('target-240p-25fps.mp4')) is video_probe
+	assert probe_video('invalid') is None
+
+
 def test_count_video_frame_total() -> None:
 	assert count_video_frame_total(get_test_example_file('target-240p-25fps.mp4')) == 270
 	assert count_video_frame_total(get_test_example_file('target-240p-30fps.mp4')) == 324
@@ -137,6 +158,14 @@ def test_scale_resolution() -> None:
 	assert scale_resolution((4096, 2160), 2.0) == (8192, 4320)
 
 
+def test_resize_frame() -> None:
+	vision_frame = read_image(get_test_example_file('target-240p.jpg'))
+
+	assert resize_frame(vision_frame, (426, 226)) is vision_frame
+	assert resize_frame(vision_frame, (212, 112)).shape == (112, 212, 3)
+	assert resize_frame(vision_frame, (852, 452)).shape == (452, 852, 3)
+
+
 def test_normalize_resolution() -> None:
 	assert normalize_resolution((2.5, 2.5)) == (2, 2)
 	assert normalize_resolution((3.0, 3.0)) == (4, 4)